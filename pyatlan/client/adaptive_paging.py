@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+from typing import TYPE_CHECKING, Optional
+
+from pydantic import Field, validator
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+DEFAULT_TARGET_PAGE_BYTES = 2 * 1024 * 1024
+DEFAULT_TARGET_PAGE_LATENCY = 2.0
+DEFAULT_MIN_PAGE_SIZE = 10
+DEFAULT_MAX_PAGE_SIZE = 1000
+# Largest factor by which a page may grow over the one before, so a page of unusually small
+# results does not make the next one huge
+MAX_PAGE_GROWTH = 2.0
+
+
+@dataclass(frozen=True)
+class AdaptivePageSize:
+    """
+    Sizes each page of search results from the size and latency of the response for the page
+    before it, aiming for responses of the target number of bytes that take no longer than the
+    target latency, within the given bounds on the number of results per page.
+    """
+
+    target_bytes: int = Field(DEFAULT_TARGET_PAGE_BYTES, gt=0)
+    target_latency: Optional[float] = Field(DEFAULT_TARGET_PAGE_LATENCY, gt=0)
+    min_size: int = Field(DEFAULT_MIN_PAGE_SIZE, ge=1)
+    max_size: int = Field(DEFAULT_MAX_PAGE_SIZE, ge=1)
+
+    @validator("max_size")
+    def validate_max_size(cls, v, values):
+        if "min_size" in values and v < values["min_size"]:
+            raise ValueError("max_size must be at least min_size")
+        return v
+
+    def next_size(
+        self, size: int, results: int, response_bytes: int, latency: float
+    ) -> int:
+        """
+        Determine the size of the next page.
+
+        :param size: number of results requested for the last page
+        :param results: number of results the last page contained
+        :param response_bytes: size of the response for the last page
+        :param latency: seconds taken to receive the response for the last page
+        :returns: the number of results to request for the next page
+        """
+        if results <= 0:
+            return size
+        desired = self.target_bytes * results / max(response_bytes, 1)
+        if self.target_latency is not None and latency > 0:
+            desired = min(desired, self.target_latency * results / latency)
+        desired = min(desired, size * MAX_PAGE_GROWTH)
+        return max(self.min_size, min(self.max_size, int(desired)))
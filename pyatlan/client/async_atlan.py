@@ -0,0 +1,318 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncGenerator, Callable, Optional, Type, TypeVar, Union
+
+from pyatlan.client.atlan import DEFAULT_POOL_MAXSIZE, AtlanClient, SearchResult
+from pyatlan.model.assets import Asset
+from pyatlan.model.enums import AtlanTypeCategory
+from pyatlan.model.group import AtlanGroup, CreateGroupResponse, GroupResponse
+from pyatlan.model.lineage import LineageListRequest, LineageRequest, LineageResponse
+from pyatlan.model.response import AssetMutationResponse
+from pyatlan.model.role import RoleResponse
+from pyatlan.model.search import IndexSearchRequest, Query
+from pyatlan.model.typedef import TypeDef, TypeDefResponse
+from pyatlan.model.user import AtlanUser, UserMinimalResponse, UserResponse
+from pyatlan.utils import get_logger
+
+A = TypeVar("A", bound=Asset)
+R = TypeVar("R")
+
+DEFAULT_MAX_CONCURRENCY = 20
+
+LOGGER = get_logger()
+
+
+class AsyncAtlanClient:
+    """
+    Asyncio facade over AtlanClient. Every call is run as a coroutine on a bounded pool of worker
+    threads that share the underlying client (and therefore its HTTP connection pool), so that many
+    requests can be fanned out concurrently from a single event loop. A client built by the facade
+    keeps at least as many connections open as there are worker threads.
+    """
+
+    class AsyncSearchResults:
+        def __init__(
+            self, client: "AsyncAtlanClient", results: AtlanClient.SearchResults
+        ):
+            self._client = client
+            self._results = results
+
+        def current_page(self) -> list[SearchResult]:
+            return self._results.current_page()
+
+        async def next_page(self, start=None, size=None) -> bool:
+            return await self._client._run(self._results.next_page, start, size)
+
+        async def __aiter__(self) -> AsyncGenerator[SearchResult, None]:
+            while True:
+                for asset in self.current_page():
+                    yield asset
+                if not await self.next_page():
+                    break
+
+    class AsyncIndexSearchResults(AsyncSearchResults):
+        def __init__(
+            self, client: "AsyncAtlanClient", results: AtlanClient.IndexSearchResults
+        ):
+            super().__init__(client, results)
+            self._index_results = results
+
+        @property
+        def count(self) -> int:
+            return self._index_results.count
+
+    class AsyncLineageListResults(AsyncSearchResults):
+        def __init__(
+            self, client: "AsyncAtlanClient", results: AtlanClient.LineageListResults
+        ):
+            super().__init__(client, results)
+            self._lineage_results = results
+
+        @property
+        def has_more(self) -> bool:
+            return self._lineage_results.has_more
+
+    def __init__(
+        self,
+        client: Optional[AtlanClient] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **data,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if client is None:
+            # Enough connections for every worker thread, so that none has to open (and then
+            # discard) one of its own
+            data.setdefault(
+                "connection_pool_maxsize", max(max_concurrency, DEFAULT_POOL_MAXSIZE)
+            )
+            client = AtlanClient(**data)
+        if client.connection_pool_maxsize < max_concurrency:
+            LOGGER.warning(
+                "The client's connection pool holds %s connections, fewer than the %s worker "
+                "threads: connections beyond the pool will be discarded after each request.",
+                client.connection_pool_maxsize,
+                max_concurrency,
+            )
+        self._client = client
+        self._max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="pyatlan-async"
+        )
+
+    @property
+    def client(self) -> AtlanClient:
+        return self._client
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    async def __aenter__(self) -> "AsyncAtlanClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        # Wait for the worker threads to finish without blocking the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def close(self) -> None:
+        """
+        Release the worker threads used to run requests.
+        """
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def search(
+        self,
+        criteria: IndexSearchRequest,
+        deep_paging: bool = False,
+        lazy: bool = False,
+    ) -> AsyncIndexSearchResults:
+        results = await self._run(
+            self._client.search, criteria, deep_paging=deep_paging, lazy=lazy
+        )
+        return AsyncAtlanClient.AsyncIndexSearchResults(self, results)
+
+    async def count(
+        self, query: Query, track_total_hits: Union[bool, int] = True
+    ) -> int:
+        return await self._run(
+            self._client.count, query, track_total_hits=track_total_hits
+        )
+
+    async def exists(self, query: Query) -> bool:
+        return await self._run(self._client.exists, query)
+
+    async def upsert(
+        self,
+        entity: Union[Asset, list[Asset]],
+        replace_atlan_tags: bool = False,
+        replace_custom_metadata: bool = False,
+        overwrite_custom_metadata: bool = False,
+    ) -> AssetMutationResponse:
+        return await self._run(
+            self._client.upsert,
+            entity,
+            replace_atlan_tags=replace_atlan_tags,
+            replace_custom_metadata=replace_custom_metadata,
+            overwrite_custom_metadata=overwrite_custom_metadata,
+        )
+
+    async def upsert_merging_cm(
+        self, entity: Union[Asset, list[Asset]], replace_atlan_tags: bool = False
+    ) -> AssetMutationResponse:
+        return await self._run(
+            self._client.upsert_merging_cm,
+            entity,
+            replace_atlan_tags=replace_atlan_tags,
+        )
+
+    async def upsert_replacing_cm(
+        self, entity: Union[Asset, list[Asset]], replace_atlan_tags: bool = False
+    ) -> AssetMutationResponse:
+        return await self._run(
+            self._client.upsert_replacing_cm, entity, replace_atlan_tags
+        )
+
+    async def get_asset_by_guid(
+        self,
+        guid: str,
+        asset_type: Type[A],
+        min_ext_info: bool = False,
+        ignore_relationships: bool = False,
+    ) -> A:
+        return await self._run(
+            self._client.get_asset_by_guid,
+            guid=guid,
+            asset_type=asset_type,
+            min_ext_info=min_ext_info,
+            ignore_relationships=ignore_relationships,
+        )
+
+    async def get_asset_by_qualified_name(
+        self,
+        qualified_name: str,
+        asset_type: Type[A],
+        min_ext_info: bool = False,
+        ignore_relationships: bool = False,
+    ) -> A:
+        return await self._run(
+            self._client.get_asset_by_qualified_name,
+            qualified_name=qualified_name,
+            asset_type=asset_type,
+            min_ext_info=min_ext_info,
+            ignore_relationships=ignore_relationships,
+        )
+
+    async def retrieve_minimal(self, guid: str, asset_type: Type[A]) -> A:
+        return await self._run(
+            self._client.retrieve_minimal, guid=guid, asset_type=asset_type
+        )
+
+    async def purge_entity_by_guid(self, guid) -> AssetMutationResponse:
+        return await self._run(self._client.purge_entity_by_guid, guid)
+
+    async def delete_entity_by_guid(self, guid) -> AssetMutationResponse:
+        return await self._run(self._client.delete_entity_by_guid, guid)
+
+    async def get_lineage(self, lineage_request: LineageRequest) -> LineageResponse:
+        return await self._run(self._client.get_lineage, lineage_request)
+
+    async def get_lineage_list(
+        self, lineage_request: LineageListRequest
+    ) -> AsyncLineageListResults:
+        results = await self._run(self._client.get_lineage_list, lineage_request)
+        return AsyncAtlanClient.AsyncLineageListResults(self, results)
+
+    async def get_all_typedefs(self) -> TypeDefResponse:
+        return await self._run(self._client.get_all_typedefs)
+
+    async def get_typedefs(self, type_category: AtlanTypeCategory) -> TypeDefResponse:
+        return await self._run(self._client.get_typedefs, type_category)
+
+    async def create_typedef(self, typedef: TypeDef) -> TypeDefResponse:
+        return await self._run(self._client.create_typedef, typedef)
+
+    async def update_typedef(self, typedef: TypeDef) -> TypeDefResponse:
+        return await self._run(self._client.update_typedef, typedef)
+
+    async def purge_typedef(self, name: str, typedef_type: type) -> None:
+        return await self._run(self._client.purge_typedef, name, typedef_type)
+
+    async def get_roles(
+        self,
+        limit: int,
+        post_filter: Optional[str] = None,
+        sort: Optional[str] = None,
+        count: bool = True,
+        offset: int = 0,
+    ) -> RoleResponse:
+        return await self._run(
+            self._client.get_roles,
+            limit=limit,
+            post_filter=post_filter,
+            sort=sort,
+            count=count,
+            offset=offset,
+        )
+
+    async def get_all_roles(self) -> RoleResponse:
+        return await self._run(self._client.get_all_roles)
+
+    async def create_group(
+        self, group: AtlanGroup, user_ids: Optional[list[str]] = None
+    ) -> CreateGroupResponse:
+        return await self._run(self._client.create_group, group, user_ids)
+
+    async def get_groups(
+        self,
+        limit: Optional[int] = None,
+        post_filter: Optional[str] = None,
+        sort: Optional[str] = None,
+        count: bool = True,
+        offset: int = 0,
+    ) -> GroupResponse:
+        return await self._run(
+            self._client.get_groups,
+            limit=limit,
+            post_filter=post_filter,
+            sort=sort,
+            count=count,
+            offset=offset,
+        )
+
+    async def get_all_groups(self) -> list[AtlanGroup]:
+        return await self._run(self._client.get_all_groups)
+
+    async def get_users(
+        self,
+        limit: Optional[int] = None,
+        post_filter: Optional[str] = None,
+        sort: Optional[str] = None,
+        count: bool = True,
+        offset: int = 0,
+    ) -> UserResponse:
+        return await self._run(
+            self._client.get_users,
+            limit=limit,
+            post_filter=post_filter,
+            sort=sort,
+            count=count,
+            offset=offset,
+        )
+
+    async def get_all_users(self) -> list[AtlanUser]:
+        return await self._run(self._client.get_all_users)
+
+    async def get_current_user(self) -> UserMinimalResponse:
+        return await self._run(self._client.get_current_user)
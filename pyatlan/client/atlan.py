@@ -5,16 +5,39 @@ from __future__ import annotations
 
 import abc
 import contextlib
-import copy
+import gzip
 import json
 import logging
 import os
+import queue
+import threading
+import time
 from abc import ABC
-from typing import ClassVar, Generator, Optional, Type, TypeVar, Union
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from itertools import chain, product
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Generator,
+    Generic,
+    Iterable,
+    Literal,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import requests
 from pydantic import (
     BaseSettings,
+    Field,
     HttpUrl,
     PrivateAttr,
     StrictStr,
@@ -26,6 +49,14 @@ from pydantic import (
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+from pyatlan.client.adaptive_paging import AdaptivePageSize
+from pyatlan.client.circuit_breaker import CircuitBreakers, endpoint_family
+from pyatlan.client.codec import JsonCodec, get_codec
 from pyatlan.client.constants import (
     ADD_BUSINESS_ATTRIBUTE_BY_ID,
     ADD_USER_TO_GROUPS,
@@ -62,8 +93,31 @@ from pyatlan.client.constants import (
     UPDATE_USER,
     UPLOAD_IMAGE,
 )
-from pyatlan.error import AtlanError, NotFoundError
+from pyatlan.client.deadline import (
+    Deadline,
+    DeadlineTimeout,
+    current_deadline,
+    deadline_scope,
+)
+from pyatlan.client.metrics import InMemoryMetricsSink, MetricsSink, RequestMetrics
+from pyatlan.client.rate_limit import (
+    AtlanRetry,
+    LimitTimeoutError,
+    RateLimiter,
+    RetryBudget,
+)
+from pyatlan.client.request_template import RequestTemplates
+from pyatlan.client.search_cache import SearchCache, search_key
+from pyatlan.client.single_flight import SingleFlight, WaitTimeoutError, request_key
+from pyatlan.client.transport import SessionTransport, Transport
+from pyatlan.error import (
+    AtlanError,
+    DeadlineExceededError,
+    NotFoundError,
+    ServiceUnavailableError,
+)
 from pyatlan.exceptions import AtlanServiceException, InvalidRequestException
+from pyatlan.model.asset_view import AssetView
 from pyatlan.model.assets import (
     Asset,
     AtlasGlossary,
@@ -112,9 +166,16 @@ from pyatlan.model.response import AssetMutationResponse
 from pyatlan.model.role import RoleResponse
 from pyatlan.model.search import (
     DSL,
+    AggregationResult,
+    Bool,
     IndexSearchRequest,
     Query,
+    Range,
+    SortItem,
     Term,
+    TermAttributes,
+    Terms,
+    parse_aggregations,
     with_active_category,
     with_active_glossary,
     with_active_term,
@@ -137,7 +198,9 @@ from pyatlan.model.user import (
 from pyatlan.multipart_data_generator import MultipartDataGenerator
 from pyatlan.utils import (
     API,
+    HTTPMethod,
     HTTPStatus,
+    chunks,
     get_logger,
     unflatten_custom_metadata_for_entity,
 )
@@ -145,6 +208,9 @@ from pyatlan.utils import (
 LOGGER = get_logger()
 T = TypeVar("T", bound=Referenceable)
 A = TypeVar("A", bound=Asset)
+R = TypeVar("R")
+# Result of a search: a full asset, or (for a lazy search) a read-only view over one
+SearchResult = Union[Asset, AssetView]
 Assets = Union[
     AtlasGlossary,
     AtlasGlossaryCategory,
@@ -169,20 +235,331 @@ Asset_Types = Union[
 ]
 
 
-def get_session():
-    retry_strategy = Retry(
-        total=10,
+ACCEPT_ENCODING = "gzip, deflate"
+# Favour speed over size, as most of the saving comes from the lower levels
+GZIP_COMPRESSION_LEVEL = 5
+# POST requests that only read, and can therefore be shared between identical callers
+COALESCIBLE_POSTS = frozenset({INDEX_SEARCH.path, GET_LINEAGE_LIST.path})
+# POST requests that only read, and therefore do not invalidate any cached search
+READ_ONLY_POSTS = COALESCIBLE_POSTS | {GET_LINEAGE.path, PARSE_QUERY.path}
+# Index fields whose values are held on the entity itself, rather than in its attributes
+ENTITY_SORT_FIELDS = {
+    TermAttributes.GUID.value: "guid",
+    TermAttributes.CREATE_TIME_AS_TIMESTAMP.value: "createTime",
+    TermAttributes.UPDATE_TIME_AS_TIMESTAMP.value: "updateTime",
+    TermAttributes.TYPE_NAME.value: "typeName",
+    TermAttributes.STATE.value: "status",
+    TermAttributes.CREATED_BY.value: "createdBy",
+    TermAttributes.MODIFIED_BY.value: "updatedBy",
+}
+DEFAULT_PREFETCH_PAGES = 2
+DEFAULT_SEARCH_SLICES = 4
+DEFAULT_TERMS_CHUNK_SIZE = 1000
+DEFAULT_RESOLVE_WORKERS = 4
+DEFAULT_SEARCH_CHUNK_WORKERS = 4
+# Terms queries with more values than this are split into chunks of (at most) this many values
+DEFAULT_MAX_TERMS_VALUES = 10_000
+# Slices are bounded by the first two hexadecimal digits of GUIDs
+MAX_SEARCH_SLICES = 256
+PREFETCH_POLL_INTERVAL = 0.1
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+DEFAULT_MAX_RETRIES = 10
+RETRY_STATUS_FORCELIST = [403, 429, 500, 502, 503, 504]
+RETRY_ALLOWED_METHODS = ["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"]
+
+
+def get_retry_strategy(
+    total: int = DEFAULT_MAX_RETRIES,
+    budget: Optional[RetryBudget] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> Retry:
+    return AtlanRetry(
+        total=total,
         backoff_factor=1,
-        status_forcelist=[403, 500, 502, 503, 504],
-        allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"],
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        allowed_methods=RETRY_ALLOWED_METHODS,
+        respect_retry_after_header=True,
+        budget=budget,
+        rate_limiter=rate_limiter,
+    )
+
+
+def get_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    retry_strategy: Optional[Retry] = None,
+):
+    if retry_strategy is None:
+        retry_strategy = get_retry_strategy()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=retry_strategy,
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
     session = requests.session()
     session.mount("https://", adapter)
+    session.mount("http://", adapter)
     session.headers.update({"x-atlan-agent": "sdk", "x-atlan-agent-id": "python"})
     return session
 
 
+def _sort_attribute(field: str) -> str:
+    # Sorting uses sub-fields (such as name.keyword) of the attribute's own field
+    return field.split(".")[0]
+
+
+def get_search_after(
+    sort: Optional[list[SortItem]], entity: dict[str, Any]
+) -> list[Any]:
+    """
+    Derive the values from which to search after the given (raw) entity, for the given sort.
+    """
+    attributes = entity.get("attributes") or {}
+    return [
+        entity.get(ENTITY_SORT_FIELDS[item.field])
+        if item.field in ENTITY_SORT_FIELDS
+        else attributes.get(_sort_attribute(item.field))
+        for item in sort or []
+    ]
+
+
+def with_tiebreaker(criteria: IndexSearchRequest) -> IndexSearchRequest:
+    """
+    Copy the given criteria, adding a sort by GUID to make the order of results total (so that
+    they can be paged through with search_after) and requesting any attributes that are sorted
+    by, so that the values to search after can be taken from each page's last result.
+    """
+    criteria = criteria.copy(deep=True)
+    sort = list(criteria.dsl.sort or [])
+    if all(item.field != TermAttributes.GUID.value for item in sort):
+        sort.append(SortItem(field=TermAttributes.GUID.value))
+    criteria.dsl.sort = sort
+    attributes = list(criteria.attributes or [])
+    for item in sort:
+        name = _sort_attribute(item.field)
+        if item.field not in ENTITY_SORT_FIELDS and name not in attributes:
+            attributes.append(name)
+    criteria.attributes = attributes
+    return criteria
+
+
+def partition_by_guid(
+    criteria: IndexSearchRequest, slices: int
+) -> list[IndexSearchRequest]:
+    """
+    Split the given criteria into the given number of copies that each match a disjoint range of
+    GUIDs (by their leading hexadecimal digits), and together match everything the criteria do.
+    """
+    if not 1 <= slices <= MAX_SEARCH_SLICES:
+        raise ValueError(f"slices must be between 1 and {MAX_SEARCH_SLICES}")
+    if slices == 1:
+        return [criteria.copy(deep=True)]
+    bounds: list[Optional[str]] = [
+        f"{MAX_SEARCH_SLICES * i // slices:02x}" for i in range(1, slices)
+    ]
+    partitions = []
+    for lower, upper in zip([None] + bounds, bounds + [None]):
+        partition = criteria.copy(deep=True)
+        guids = Range(field=TermAttributes.GUID.value, gte=lower, lt=upper)
+        query = partition.dsl.query
+        partition.dsl.query = (
+            Bool(must=[query], filter=[guids]) if query else Bool(filter=[guids])
+        )
+        partitions.append(partition)
+    return partitions
+
+
+def _required_terms(query: Query) -> Generator[Terms, None, None]:
+    # Terms queries that must match for the query to, rather than optional or negated ones
+    if isinstance(query, Terms):
+        yield query
+    elif isinstance(query, Bool):
+        for child in chain(query.must, query.filter):
+            yield from _required_terms(child)
+
+
+def _replace_query(query: Query, old: Query, new: Query) -> Query:
+    if query is old:
+        return new
+    if isinstance(query, Bool):
+        return query._evolve(
+            must=[_replace_query(child, old, new) for child in query.must],
+            filter=[_replace_query(child, old, new) for child in query.filter],
+        )
+    return query
+
+
+def split_terms(
+    criteria: IndexSearchRequest, max_values: int
+) -> list[IndexSearchRequest]:
+    """
+    Split the given criteria into copies that each match a chunk of the values of every terms
+    query with more than the given number of values, so that together they match everything
+    the criteria do. When several terms queries are split, there is a copy for every
+    combination of their chunks. Only terms queries that must match (rather than optional or
+    negated ones) are split.
+    """
+    query = criteria.dsl.query
+    if query is None:
+        return [criteria]
+    # By identity, so that a query shared by several clauses is only split once
+    oversized = {
+        id(terms): terms
+        for terms in _required_terms(query)
+        if len(terms.values) > max_values
+    }
+    if not oversized:
+        return [criteria]
+    split = []
+    for combination in product(
+        *(chunks(terms.values, max_values) for terms in oversized.values())
+    ):
+        chunked = query
+        for terms, chunk in zip(oversized.values(), combination):
+            chunked = _replace_query(chunked, terms, terms._evolve(values=chunk))
+        split.append(
+            criteria.copy(update={"dsl": criteria.dsl.copy(update={"query": chunked})})
+        )
+    return split
+
+
+def _put_until_stopped(buffer: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """
+    Put the item in the given buffer once it has room, unless stopped before then.
+    """
+    while not stop.is_set():
+        try:
+            buffer.put(item, timeout=PREFETCH_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _drain(buffer: queue.Queue) -> None:
+    with contextlib.suppress(queue.Empty):
+        while True:
+            buffer.get_nowait()
+
+
+@dataclass
+class _RequestTiming:
+    # When a request was sent (once the rate limiter allowed it) and its response received
+    sent: Optional[float] = None
+    received: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class SliceProgress:
+    """
+    Progress through one slice of a parallel search.
+    """
+
+    index: int
+    retrieved: int
+    count: Optional[int]
+    done: bool
+
+
+@dataclass(frozen=True)
+class PagingGap:
+    """
+    Point at which results may have been missed while paging through them by offset: the
+    result the page before it ended with was not found where the next page should have
+    started, so results earlier in the order had moved (or been removed) in between.
+    """
+
+    start: int
+    after_guid: str
+
+
+@dataclass(frozen=True)
+class PagingReport:
+    """
+    Consistency of paging through the results of a search so far: how many results were
+    skipped for having already been retrieved on an earlier page, and each point at which
+    results may have been missed.
+    """
+
+    duplicates: int
+    gaps: list[PagingGap]
+
+    @property
+    def complete(self) -> bool:
+        """
+        Whether every result is known to have been retrieved (no gaps were detected).
+        """
+        return not self.gaps
+
+
+def _checkpoint_criteria(criteria: IndexSearchRequest) -> dict[str, Any]:
+    # Everything about the criteria except which page of results they retrieve
+    request = json.loads(criteria.json(by_alias=True, exclude_unset=True))
+    for name in ("from", "size", "search_after"):
+        request["dsl"].pop(name, None)
+    return request
+
+
+@dataclass(frozen=True)
+class SearchCheckpoint:
+    """
+    Position reached while iterating through the results of a search, from which iterating
+    through them can be resumed (by AtlanClient.resume_search) later, such as after a failure.
+    It holds the criteria of the search (without paging), the page being iterated through (by
+    its offset and the values it was searched after) and how many of its results were consumed,
+    along with running counts.
+    """
+
+    criteria: dict[str, Any]
+    size: int
+    start: int
+    search_after: Optional[list[Any]]
+    deep_paging: bool
+    skip: int
+    retrieved: int
+    count: int
+    lazy: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SearchCheckpoint":
+        return cls(**data)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Write the checkpoint to the given file as JSON, atomically replacing any earlier
+        checkpoint there (so a failure while saving never loses the previous one).
+        """
+        path = Path(path)
+        temporary = path.with_name(f"{path.name}.tmp")
+        temporary.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SearchCheckpoint":
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+@dataclass(frozen=True)
+class ConnectionPoolStats:
+    """
+    Point-in-time usage of the connection pool to a single host.
+    """
+
+    host: str
+    maxsize: int
+    num_connections: int
+    num_requests: int
+    available_connections: int
+
+
 def _build_typedef_request(typedef: TypeDef) -> TypeDefResponse:
     if isinstance(typedef, AtlanTagDef):
         # Set up the request payload...
@@ -242,13 +619,131 @@ class AtlanClient(BaseSettings):
     _default_client: "ClassVar[Optional[AtlanClient]]" = None
     base_url: HttpUrl
     api_key: str
-    _session: requests.Session = PrivateAttr(default_factory=get_session)
-    _request_params: dict = PrivateAttr()
+    connection_pool_size: int = Field(
+        DEFAULT_POOL_CONNECTIONS,
+        description="Number of per-host connection pools to keep.",
+        ge=1,
+    )
+    connection_pool_maxsize: int = Field(
+        DEFAULT_POOL_MAXSIZE,
+        description="Maximum number of connections to keep open to each host.",
+        ge=1,
+    )
+    connection_pool_block: bool = Field(
+        False,
+        description="Whether to wait for a free connection when a host's pool is exhausted, "
+        "rather than opening (and then discarding) an additional connection.",
+    )
+    rate_limit_per_second: Optional[float] = Field(
+        None,
+        description="Maximum number of requests to start per second, across all threads "
+        "using the client (unlimited if not set).",
+        gt=0,
+    )
+    max_concurrent_requests: Optional[int] = Field(
+        None,
+        description="Maximum number of requests to have in flight at once, across all threads "
+        "using the client (unlimited if not set).",
+        ge=1,
+    )
+    max_retries: int = Field(
+        DEFAULT_MAX_RETRIES,
+        description="Maximum number of times to retry a single request.",
+        ge=0,
+    )
+    retry_budget_ratio: float = Field(
+        0.2,
+        description="Fraction of requests that may be retried, shared across all threads "
+        "using the client.",
+        ge=0,
+    )
+    connect_timeout: float = Field(
+        30.0,
+        description="Seconds to wait for a connection to be established.",
+        gt=0,
+    )
+    read_timeout: float = Field(
+        900.0,
+        description="Seconds to wait for the server to send data once connected.",
+        gt=0,
+    )
+    circuit_breaker_failure_threshold: float = Field(
+        0.5,
+        description="Proportion of recent requests to a family of endpoints (search, bulk, "
+        "typedefs, admin, entity) that must fail for further requests to it to be rejected.",
+        gt=0,
+        le=1,
+    )
+    circuit_breaker_minimum_calls: int = Field(
+        20,
+        description="Number of recent requests over which the failure proportion is measured.",
+        ge=1,
+    )
+    circuit_breaker_reset_timeout: float = Field(
+        30.0,
+        description="Seconds to reject requests for, once a circuit has opened, "
+        "before trying a request again.",
+        ge=0,
+    )
+    json_codec: Literal["auto", "orjson", "json"] = Field(
+        "auto",
+        description="JSON library used to encode requests and decode responses "
+        "('auto' uses orjson when it is installed).",
+    )
+    compress_requests: bool = Field(
+        False,
+        description="Whether to gzip the bodies of requests to endpoints that accept "
+        "compressed payloads (bulk updates, index search and lineage list).",
+    )
+    compression_threshold: int = Field(
+        1024,
+        description="Minimum size (in bytes) of a request body before it is compressed.",
+        ge=0,
+    )
+    coalesce_requests: bool = Field(
+        False,
+        description="Whether to merge identical read requests (GETs, searches and lineage "
+        "lookups) that are in flight at the same time into a single call.",
+    )
+    search_cache_size: int = Field(
+        0,
+        description="Maximum number of search responses to cache in memory (0 to disable "
+        "caching). The cache is cleared by any write made through the client.",
+        ge=0,
+    )
+    search_cache_ttl: float = Field(
+        60.0,
+        description="Seconds for which a cached search response is used.",
+        gt=0,
+    )
+    max_terms_values: int = Field(
+        DEFAULT_MAX_TERMS_VALUES,
+        description="Maximum number of values of a terms query to search for at once, beyond "
+        "which a search is split into several (run concurrently) for chunks of the values.",
+        ge=1,
+    )
+    search_chunk_workers: int = Field(
+        DEFAULT_SEARCH_CHUNK_WORKERS,
+        description="Maximum number of the chunks of a search split into chunks (see "
+        "max_terms_values) to page through at the same time.",
+        ge=1,
+    )
+    _session: requests.Session = PrivateAttr()
+    _transport: Transport = PrivateAttr()
+    _codec: JsonCodec = PrivateAttr()
+    _single_flight: SingleFlight = PrivateAttr()
+    _search_cache: Optional[SearchCache] = PrivateAttr()
+    _metrics_sink: MetricsSink = PrivateAttr()
+    _captured_requests: threading.local = PrivateAttr()
+    _rate_limiter: RateLimiter = PrivateAttr()
+    _retry_budget: RetryBudget = PrivateAttr()
+    _circuit_breakers: CircuitBreakers = PrivateAttr()
+    _request_templates: RequestTemplates = PrivateAttr()
 
     class Config:
         env_prefix = "atlan_"
 
-    class SearchResults(ABC):
+    class SearchResults(ABC, Generic[R]):
         def __init__(
             self,
             client: "AtlanClient",
@@ -256,7 +751,7 @@ class AtlanClient(BaseSettings):
             criteria: SearchRequest,
             start: int,
             size: int,
-            assets: list[Asset],
+            assets: list[R],
         ):
             self._client = client
             self._endpoint = endpoint
@@ -264,15 +759,19 @@ class AtlanClient(BaseSettings):
             self._start = start
             self._size = size
             self._assets = assets
+            self._deadline = current_deadline()
 
-        def current_page(self) -> list[Asset]:
+        def current_page(self) -> list[R]:
             return self._assets
 
         def next_page(self, start=None, size=None) -> bool:
             self._start = start or self._start + self._size
             if size:
                 self._size = size
-            return self._get_next_page() if self._assets else False
+            if not self._assets:
+                return False
+            with deadline_scope(self._deadline):
+                return self._get_next_page()
 
         @abc.abstractmethod
         def _get_next_page(self):
@@ -287,16 +786,63 @@ class AtlanClient(BaseSettings):
             if "entities" not in raw_json:
                 self._assets = []
                 return None
-            self._assets = parse_obj_as(list[Asset], raw_json["entities"])
+            with self._client._measure_parse(self._endpoint):
+                self._assets = self._parse_entities(raw_json["entities"])
             return raw_json
 
-        def __iter__(self) -> Generator[Asset, None, None]:
+        @abc.abstractmethod
+        def _parse_entities(self, entities: list[dict[str, Any]]) -> list[R]:
+            pass
+
+        def __iter__(self) -> Generator[R, None, None]:
             while True:
                 yield from self.current_page()
                 if not self.next_page():
                     break
 
-    class IndexSearchResults(SearchResults):
+        def prefetch(
+            self, pages: int = DEFAULT_PREFETCH_PAGES
+        ) -> Generator[R, None, None]:
+            """
+            Iterate through all the results (like iterating over the results themselves), while a
+            background thread retrieves up to the given number of further pages ahead of the
+            page being consumed. The results' paging state belongs to that background thread
+            until iteration finishes, so do not page through them any other way in the meantime.
+
+            :param pages: maximum number of pages to retrieve and hold ahead of the current one
+            :returns: a generator of every asset in the results
+            """
+            if pages < 1:
+                raise ValueError("pages must be at least 1")
+            buffer: queue.Queue = queue.Queue(maxsize=pages)
+            stop = threading.Event()
+
+            def fetch():
+                try:
+                    while self.next_page():
+                        if not _put_until_stopped(buffer, self.current_page(), stop):
+                            return
+                except BaseException as err:
+                    _put_until_stopped(buffer, err, stop)
+                _put_until_stopped(buffer, None, stop)
+
+            first_page = self.current_page()
+            worker = threading.Thread(
+                target=fetch, name="atlan-search-prefetch", daemon=True
+            )
+            worker.start()
+            try:
+                yield from first_page
+                while (page := buffer.get()) is not None:
+                    if isinstance(page, BaseException):
+                        raise page
+                    yield from page
+            finally:
+                # Release a worker still waiting for room in the buffer
+                stop.set()
+                _drain(buffer)
+
+    class IndexSearchResults(SearchResults[SearchResult]):
         def __init__(
             self,
             client: "AtlanClient",
@@ -304,28 +850,254 @@ class AtlanClient(BaseSettings):
             start: int,
             size: int,
             count: int,
-            assets: list[Asset],
+            assets: list[SearchResult],
+            search_after: Optional[list[Any]] = None,
+            lazy: bool = False,
+            aggregations: Optional[dict[str, AggregationResult]] = None,
+            adaptive_page_size: Optional[AdaptivePageSize] = None,
+            consistent: bool = False,
+            chunks: Optional["AtlanClient.ParallelSearchResults"] = None,
         ):
             super().__init__(client, INDEX_SEARCH, criteria, start, size, assets)
+            self._criteria: IndexSearchRequest = criteria
             self._count = count
+            self._search_after = search_after
+            self._lazy = lazy
+            self._aggregations = aggregations or {}
+            self._adaptive_page_size = adaptive_page_size
+            self._next_size: Optional[int] = None
+            # Where the current page was retrieved from, and how far iteration is through it
+            self._page_start = start
+            self._page_search_after = (
+                criteria.dsl.search_after if search_after is not None else None
+            )
+            self._position = 0
+            self._retrieved = 0
+            # GUIDs of the results retrieved so far, and the last result of the latest page (with
+            # its offset) from which the next page should continue, when paging consistently
+            self._seen: Optional[set[str]] = set() if consistent else None
+            self._anchor: Optional[str] = None
+            self._anchor_offset = 0
+            self._duplicates = 0
+            self._gaps: list[PagingGap] = []
+            # Chunks of a search split into chunks (by split_terms), paged through concurrently,
+            # whose pages are taken in the order they are retrieved
+            self._chunks = chunks
+            self._chunk_pages = chunks.pages() if chunks is not None else None
+            if self._chunk_pages is not None:
+                self._next_chunk_page()
+            elif consistent:
+                self._skip_retrieved(True, self._deduplicate(overlapping=False))
+
+        def _parse_entities(self, entities: list[dict[str, Any]]) -> list[SearchResult]:
+            if self._lazy:
+                return [
+                    AssetView(entity, self._criteria.attributes) for entity in entities
+                ]
+            return list(parse_obj_as(list[Asset], entities))
 
         def _get_next_page(self):
-            self._criteria.dsl.from_ = self._start
-            self._criteria.dsl.size = self._size
-            if raw_json := super()._get_next_page_json():
+            if self._chunk_pages is not None:
+                return self._next_chunk_page()
+            overlapping = self._overlapping
+            fetched = self._fetch_page(overlapping)
+            if self._seen is None:
+                return fetched
+            return self._skip_retrieved(fetched, self._deduplicate(overlapping))
+
+        def _skip_retrieved(self, fetched: bool, further: bool) -> bool:
+            """
+            Carry on past pages whose results had all been retrieved already, until reaching
+            results not yet retrieved (if any).
+            """
+            while not self._assets:
+                if not further:
+                    return fetched
+                # Every result of the page had already been retrieved
+                self._start = self._anchor_offset + 1
+                overlapping = self._overlapping
+                fetched = self._fetch_page(overlapping)
+                further = self._deduplicate(overlapping)
+            return True
+
+        def _next_chunk_page(self) -> bool:
+            # Continue with the next page retrieved from any of the chunks, skipping results
+            # already retrieved from another chunk
+            for page in self._chunk_pages or ():
+                self._assets = page
+                self._position = 0
+                self._deduplicate(overlapping=False)
+                if self._assets:
+                    return True
+            self._assets = []
+            return False
+
+        @property
+        def _overlapping(self) -> bool:
+            # Whether the page is retrieved from the last result of the page before it (when
+            # paging consistently by offset), to detect results having moved in between
+            return (
+                self._seen is not None
+                and self._search_after is None
+                and self._anchor is not None
+                and self._start == self._anchor_offset + 1
+            )
+
+        def _fetch_page(self, overlapping: bool) -> bool:
+            page_search_after = self._search_after
+            if self._search_after is not None:
+                self._criteria.dsl.from_ = 0
+                self._criteria.dsl.search_after = self._search_after
+            else:
+                self._criteria.dsl.from_ = (
+                    self._start - 1 if overlapping else self._start
+                )
+            self._criteria.dsl.size = self._size + 1 if overlapping else self._size
+            with self._client._capture_requests() as captured:
+                raw_json = super()._get_next_page_json()
+            self._adapt(captured)
+            self._page_start = self._criteria.dsl.from_
+            self._page_search_after = page_search_after
+            self._position = 0
+            if raw_json:
                 self._count = (
                     raw_json["approximateCount"]
                     if "approximateCount" in raw_json
                     else 0
                 )
+                if self._search_after is not None and raw_json["entities"]:
+                    self._search_after = get_search_after(
+                        self._criteria.dsl.sort, raw_json["entities"][-1]
+                    )
                 return True
             return False
 
+        def _deduplicate(self, overlapping: bool) -> bool:
+            """
+            Drop the results of the current page that were already retrieved, noting any gap
+            before the page, and return whether the page went any further than the one before.
+            """
+            page = self._assets
+            if self._seen is None:
+                return bool(page)
+            guids = [asset.guid or "" for asset in page]
+            if overlapping and self._anchor not in guids:
+                self._gaps.append(
+                    PagingGap(start=self._start, after_guid=self._anchor or "")
+                )
+            unique = []
+            for asset, guid in zip(page, guids):
+                if guid in self._seen:
+                    if not overlapping or guid != self._anchor:
+                        self._duplicates += 1
+                    continue
+                self._seen.add(guid)
+                unique.append(asset)
+            if guids:
+                self._anchor = guids[-1]
+                self._anchor_offset = self._page_start + len(guids) - 1
+            self._assets = unique
+            return len(guids) > overlapping
+
+        def _adapt(self, captured: list[RequestMetrics]) -> None:
+            # Size the next page from the response for this one, unless it was not sent (but
+            # answered from the cache, for example)
+            if self._adaptive_page_size is None or not captured:
+                return
+            response = captured[-1]
+            self._next_size = self._adaptive_page_size.next_size(
+                self._size, len(self._assets), response.response_bytes, response.latency
+            )
+
+        def next_page(self, start=None, size=None) -> bool:
+            return super().next_page(start, size or self._next_size)
+
+        @property
+        def page_size(self) -> int:
+            """
+            Number of results requested for the current page.
+            """
+            return self._size
+
+        def __iter__(self) -> Generator[SearchResult, None, None]:
+            while True:
+                page = self.current_page()
+                while self._position < len(page):
+                    asset = page[self._position]
+                    self._position += 1
+                    self._retrieved += 1
+                    yield asset
+                if not self.next_page():
+                    break
+
+        def checkpoint(self) -> SearchCheckpoint:
+            """
+            Capture how far iterating through the results has got, treating every result
+            yielded so far as consumed, so that iterating can later be resumed from there
+            (see AtlanClient.resume_search). The checkpoint does not track iterating through
+            the results by prefetch(). Resuming is only reliable for results in a stable order,
+            such as those of a deep-paging search.
+
+            :returns: the position reached through the results
+            :raises ValueError: if the results are being paged through consistently, as the
+                results already retrieved (to skip) are not part of a checkpoint
+            """
+            if self._seen is not None:
+                raise ValueError("cannot checkpoint results paged through consistently")
+            return SearchCheckpoint(
+                criteria=_checkpoint_criteria(self._criteria),
+                size=self._size,
+                start=self._page_start,
+                search_after=None
+                if self._page_search_after is None
+                else list(self._page_search_after),
+                deep_paging=self.deep_paging,
+                skip=self._position,
+                retrieved=self._retrieved,
+                count=self._count,
+                lazy=self._lazy,
+            )
+
+        def _resume(self, checkpoint: SearchCheckpoint) -> None:
+            self._position = min(checkpoint.skip, len(self._assets))
+            self._retrieved = checkpoint.retrieved
+
+        @property
+        def retrieved(self) -> int:
+            """
+            Number of results yielded by iterating through the results, including any yielded
+            before the checkpoint they were resumed from.
+            """
+            return self._retrieved
+
+        @property
+        def deep_paging(self) -> bool:
+            return self._search_after is not None
+
+        @property
+        def paging_report(self) -> Optional[PagingReport]:
+            """
+            Duplicates skipped and possible gaps detected while paging through the results so
+            far, or None if the results are not being paged through consistently.
+            """
+            if self._seen is None:
+                return None
+            return PagingReport(duplicates=self._duplicates, gaps=list(self._gaps))
+
+        @property
+        def aggregations(self) -> dict[str, AggregationResult]:
+            """
+            Results of the aggregations requested by the search, by the name they were requested.
+            """
+            return self._aggregations
+
         @property
         def count(self) -> int:
+            if self._chunks is not None:
+                return self._chunks.count
             return self._count
 
-    class LineageListResults(SearchResults):
+    class LineageListResults(SearchResults[Asset]):
         def __init__(
             self,
             client: "AtlanClient",
@@ -338,6 +1110,9 @@ class AtlanClient(BaseSettings):
             super().__init__(client, GET_LINEAGE_LIST, criteria, start, size, assets)
             self._has_more = has_more
 
+        def _parse_entities(self, entities: list[dict[str, Any]]) -> list[Asset]:
+            return parse_obj_as(list[Asset], entities)
+
         def _get_next_page(self):
             self._criteria.offset = self._start
             self._criteria.size = self._size
@@ -350,6 +1125,105 @@ class AtlanClient(BaseSettings):
         def has_more(self) -> bool:
             return self._has_more
 
+    class ParallelSearchResults:
+        """
+        Results of a search split into disjoint slices that are retrieved concurrently. Iterating
+        over the results yields the assets of every slice as they are retrieved, so they are in no
+        particular order overall, and the results can only be iterated over once.
+        """
+
+        def __init__(
+            self,
+            client: "AtlanClient",
+            slices: list[IndexSearchRequest],
+            max_workers: int,
+            deep_paging: bool,
+            lazy: bool = False,
+            adaptive_page_size: Optional[AdaptivePageSize] = None,
+        ):
+            self._client = client
+            self._slices = slices
+            self._max_workers = max_workers
+            self._deep_paging = deep_paging
+            self._lazy = lazy
+            self._adaptive_page_size = adaptive_page_size
+            self._deadline = current_deadline()
+            self._retrieved = [0] * len(slices)
+            self._counts: list[Optional[int]] = [None] * len(slices)
+            self._done = [False] * len(slices)
+
+        @property
+        def progress(self) -> list[SliceProgress]:
+            return [
+                SliceProgress(
+                    index=index,
+                    retrieved=self._retrieved[index],
+                    count=self._counts[index],
+                    done=self._done[index],
+                )
+                for index in range(len(self._slices))
+            ]
+
+        @property
+        def count(self) -> int:
+            """
+            Approximate number of results across the slices that have started to be retrieved.
+            """
+            return sum(count for count in self._counts if count is not None)
+
+        def _retrieve(
+            self, index: int, buffer: queue.Queue, stop: threading.Event
+        ) -> None:
+            try:
+                with deadline_scope(self._deadline):
+                    results = self._client.search(
+                        self._slices[index],
+                        deep_paging=self._deep_paging,
+                        lazy=self._lazy,
+                        adaptive_page_size=self._adaptive_page_size,
+                    )
+                    self._counts[index] = results.count
+                    while page := results.current_page():
+                        if not _put_until_stopped(buffer, page, stop):
+                            return
+                        self._retrieved[index] += len(page)
+                        if not results.next_page():
+                            break
+                self._done[index] = True
+                _put_until_stopped(buffer, None, stop)
+            except BaseException as err:
+                _put_until_stopped(buffer, err, stop)
+
+        def __iter__(self) -> Generator[SearchResult, None, None]:
+            for page in self.pages():
+                yield from page
+
+        def pages(self) -> Generator[list[SearchResult], None, None]:
+            """
+            Retrieve the slices, yielding each page of results of any slice as soon as it has
+            been retrieved.
+            """
+            buffer: queue.Queue = queue.Queue(maxsize=self._max_workers)
+            stop = threading.Event()
+            executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="atlan-search-slice"
+            )
+            for index in range(len(self._slices)):
+                executor.submit(self._retrieve, index, buffer, stop)
+            remaining = len(self._slices)
+            try:
+                while remaining:
+                    if (page := buffer.get()) is None:
+                        remaining -= 1
+                    elif isinstance(page, BaseException):
+                        raise page
+                    else:
+                        yield page
+            finally:
+                stop.set()
+                _drain(buffer)
+                executor.shutdown(wait=False, cancel_futures=True)
+
     @classmethod
     def register_client(cls, client: "AtlanClient"):
         if not isinstance(client, AtlanClient):
@@ -367,15 +1241,262 @@ class AtlanClient(BaseSettings):
 
     def __init__(self, **data):
         super().__init__(**data)
-        self._request_params = {"headers": {"authorization": f"Bearer {self.api_key}"}}
+        self._rate_limiter = RateLimiter(
+            requests_per_second=self.rate_limit_per_second,
+            max_concurrent=self.max_concurrent_requests,
+        )
+        self._retry_budget = RetryBudget(ratio=self.retry_budget_ratio)
+        self._circuit_breakers = CircuitBreakers(
+            failure_threshold=self.circuit_breaker_failure_threshold,
+            minimum_calls=self.circuit_breaker_minimum_calls,
+            reset_timeout=self.circuit_breaker_reset_timeout,
+        )
+        self._session = get_session(
+            pool_connections=self.connection_pool_size,
+            pool_maxsize=self.connection_pool_maxsize,
+            pool_block=self.connection_pool_block,
+            retry_strategy=get_retry_strategy(
+                total=self.max_retries,
+                budget=self._retry_budget,
+                rate_limiter=self._rate_limiter,
+            ),
+        )
+        self._transport = SessionTransport(self._session)
+        self._request_templates = RequestTemplates(
+            base_url=self.base_url,
+            headers={
+                "authorization": f"Bearer {self.api_key}",
+                "Accept-Encoding": ACCEPT_ENCODING,
+            },
+        )
+        self._codec = get_codec(self.json_codec)
+        self._single_flight = SingleFlight()
+        self._search_cache = (
+            SearchCache(self.search_cache_size, self.search_cache_ttl, self._codec)
+            if self.search_cache_size
+            else None
+        )
+        self._metrics_sink = InMemoryMetricsSink()
+        self._captured_requests = threading.local()
+
+    def get_connection_pool_stats(self) -> list[ConnectionPoolStats]:
+        """
+        Retrieve usage statistics for every host connection pool currently held by the client.
+        """
+        stats: list[ConnectionPoolStats] = []
+        adapters = {id(adapter): adapter for adapter in self._session.adapters.values()}
+        for adapter in adapters.values():
+            pool_manager = getattr(adapter, "poolmanager", None)
+            if pool_manager is None:
+                continue
+            for key in pool_manager.pools.keys():
+                pool = pool_manager.pools.get(key)
+                if pool is None:
+                    continue
+                stats.append(
+                    ConnectionPoolStats(
+                        host=f"{pool.scheme}://{pool.host}:{pool.port}",
+                        maxsize=pool.pool.maxsize if pool.pool else 0,
+                        num_connections=pool.num_connections,
+                        num_requests=pool.num_requests,
+                        available_connections=pool.pool.qsize() if pool.pool else 0,
+                    )
+                )
+        return stats
+
+    @property
+    def search_cache(self) -> Optional[SearchCache]:
+        """
+        Cache of search responses (with its hit and miss counts), or None if caching is disabled.
+        """
+        return self._search_cache
+
+    @property
+    def codec(self) -> JsonCodec:
+        """
+        Codec (chosen by json_codec) through which the client encodes requests and decodes
+        responses.
+        """
+        return self._codec
+
+    @property
+    def metrics_sink(self) -> MetricsSink:
+        """
+        Sink that receives the latency, size, status, retry and parsing measurements of every
+        API call made by the client.
+        """
+        return self._metrics_sink
+
+    def set_metrics_sink(self, sink: MetricsSink) -> None:
+        self._metrics_sink = sink
+
+    def set_transport(self, transport: Transport) -> None:
+        """
+        Send all requests through the given transport, for example to record or replay them.
+        """
+        self._transport = transport
+
+    def _record_request(
+        self,
+        api,
+        params,
+        binary_data,
+        response,
+        latency: float,
+        decode_time: float,
+        queue_wait: float,
+    ) -> None:
+        data = binary_data or params.get("data")
+        retries = getattr(getattr(response, "raw", None), "retries", None)
+        metrics = RequestMetrics(
+            endpoint=api.endpoint,
+            status_code=response.status_code if response is not None else None,
+            latency=latency,
+            request_bytes=len(data) if data else 0,
+            response_bytes=len(response.content or b"") if response is not None else 0,
+            retries=len(retries.history) if isinstance(retries, Retry) else 0,
+            decode_time=decode_time,
+            queue_wait=queue_wait,
+        )
+        if (captured := getattr(self._captured_requests, "metrics", None)) is not None:
+            captured.append(metrics)
+        try:
+            self._metrics_sink.record_request(metrics)
+        except Exception:
+            LOGGER.exception("Unable to record metrics for: %s", api.endpoint)
+
+    @contextlib.contextmanager
+    def _capture_requests(self) -> Generator[list[RequestMetrics], None, None]:
+        """
+        Collect the measurements of every request the calling thread sends within the block.
+        Requests answered without being sent (from the search cache, or by another caller's
+        identical request) are not measured.
+        """
+        previous = getattr(self._captured_requests, "metrics", None)
+        captured: list[RequestMetrics] = []
+        self._captured_requests.metrics = captured
+        try:
+            yield captured
+        finally:
+            self._captured_requests.metrics = previous
+
+    @contextlib.contextmanager
+    def _measure_parse(self, api: API) -> Generator[None, None, None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            try:
+                self._metrics_sink.record_parse(
+                    api.endpoint, time.perf_counter() - start
+                )
+            except Exception:
+                LOGGER.exception("Unable to record metrics for: %s", api.endpoint)
+
+    @contextlib.contextmanager
+    def deadline(self, seconds: float) -> Generator[Deadline, None, None]:
+        """
+        Set a deadline for every request made by the calling thread within the block, including
+        the retrieval of further pages of any results obtained within it.
+        """
+        deadline = Deadline(seconds)
+        with deadline_scope(deadline):
+            yield deadline
+
+    def _get_timeout(
+        self, deadline: Optional[Deadline]
+    ) -> Union[tuple[float, float], DeadlineTimeout]:
+        if deadline is None:
+            return self.connect_timeout, self.read_timeout
+        # Capped by what is left of the deadline for each attempt, including retries
+        return DeadlineTimeout(self.connect_timeout, self.read_timeout, deadline)
+
+    def _send(self, api, path, params, timing: _RequestTiming, binary_data=None):
+        deadline = current_deadline()
+        if deadline is not None and deadline.expired:
+            raise DeadlineExceededError(
+                message=f"Deadline exceeded before calling: {api.method.value} {path}",
+                code="ATLAN-PYTHON-408-000",
+            )
+        breaker = self._circuit_breakers.for_api(api)
+        if not breaker.allow_request():
+            raise ServiceUnavailableError(
+                message=f"Requests to {endpoint_family(api).value} endpoints are failing, "
+                f"rejected: {api.method.value} {path}",
+                code="ATLAN-PYTHON-503-000",
+            )
+        recorded = False
+        try:
+            if binary_data:
+                params = dict(params, data=binary_data)
+            self._retry_budget.deposit()
+            try:
+                with self._rate_limiter.limit(deadline):
+                    if deadline is not None and deadline.expired:
+                        raise DeadlineExceededError(
+                            message="Deadline exceeded before calling: "
+                            f"{api.method.value} {path}",
+                            code="ATLAN-PYTHON-408-000",
+                        )
+                    timing.sent = time.perf_counter()
+                    try:
+                        response = self._transport.request(
+                            api.method.value,
+                            path,
+                            timeout=self._get_timeout(deadline),
+                            **params,
+                        )
+                    finally:
+                        timing.received = time.perf_counter()
+            except LimitTimeoutError as err:
+                raise DeadlineExceededError(
+                    message="Deadline exceeded while waiting to call: "
+                    f"{api.method.value} {path}",
+                    code="ATLAN-PYTHON-408-000",
+                ) from err
+            except requests.exceptions.RequestException as err:
+                breaker.record_failure()
+                recorded = True
+                if deadline is not None and deadline.expired:
+                    raise DeadlineExceededError(
+                        message=f"Deadline exceeded while calling: {api.method.value} {path}",
+                        code="ATLAN-PYTHON-408-000",
+                    ) from err
+                raise
+            if response is not None and response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            recorded = True
+            return response
+        finally:
+            # Never leave a trial call in flight (holding the circuit half-open) without an
+            # outcome, whatever else went wrong
+            if not recorded:
+                breaker.release()
 
     def _call_api_internal(self, api, path, params, binary_data=None):
-        if binary_data:
-            response = self._session.request(
-                api.method.value, path, data=binary_data, **params
+        start = time.perf_counter()
+        timing = _RequestTiming()
+        response = None
+        try:
+            response = self._send(api, path, params, timing, binary_data)
+            return self._handle_response(api, params, response)
+        finally:
+            end = time.perf_counter()
+            sent = timing.sent or end
+            received = timing.received or end
+            self._record_request(
+                api,
+                params,
+                binary_data,
+                response,
+                latency=received - sent,
+                decode_time=end - received if response is not None else 0.0,
+                queue_wait=sent - start,
             )
-        else:
-            response = self._session.request(api.method.value, path, **params)
+
+    def _handle_response(self, api, params, response):
         if response is not None:
             LOGGER.debug("HTTP Status: %s", response.status_code)
         if response is None:
@@ -389,6 +1510,7 @@ class AtlanClient(BaseSettings):
                     or response.status_code == HTTPStatus.NO_CONTENT
                 ):
                     return None
+                raw_json = self._codec.loads(response.content)
                 if LOGGER.isEnabledFor(logging.DEBUG):
                     LOGGER.debug(
                         "<== __call_api(%s,%s), result = %s",
@@ -396,8 +1518,8 @@ class AtlanClient(BaseSettings):
                         params,
                         response,
                     )
-                    LOGGER.debug(response.json())
-                return response.json()
+                    LOGGER.debug(raw_json)
+                return raw_json
             except Exception as e:
                 print(e)
                 LOGGER.exception(
@@ -409,11 +1531,13 @@ class AtlanClient(BaseSettings):
                 "Atlas Service unavailable. HTTP Status: %s",
                 HTTPStatus.SERVICE_UNAVAILABLE,
             )
-
-            return None
+            raise ServiceUnavailableError(
+                message=f"Atlan is unavailable: {api.method.value} {api.path}",
+                code="ATLAN-PYTHON-503-001",
+            )
         else:
             with contextlib.suppress(ValueError, json.decoder.JSONDecodeError):
-                error_info = json.loads(response.text)
+                error_info = self._codec.loads(response.content)
                 error_code = error_info.get("errorCode", 0)
                 error_message = error_info.get("errorMessage", "")
                 if error_code and error_message:
@@ -426,38 +1550,98 @@ class AtlanClient(BaseSettings):
 
     def _call_api(
         self, api, query_params=None, request_obj=None, exclude_unset: bool = True
+    ):
+        if self._search_cache is None:
+            return self._call_api_uncached(
+                api, query_params, request_obj, exclude_unset
+            )
+        if api.path == INDEX_SEARCH.path:
+            # Key the cache on the body before it is compressed, so it is only encoded once
+            params, path = self._create_params(
+                api, query_params, request_obj, exclude_unset, compress=False
+            )
+            key = search_key(params["data"])
+            self._compress(api, params)
+            return self._search_cache.get_or_load(
+                key, lambda: self._send_params(api, path, params)
+            )
+        if api.method == HTTPMethod.GET or api.path in READ_ONLY_POSTS:
+            return self._call_api_uncached(
+                api, query_params, request_obj, exclude_unset
+            )
+        try:
+            return self._call_api_uncached(
+                api, query_params, request_obj, exclude_unset
+            )
+        finally:
+            # Even a failed write may have changed something a cached search found
+            self._search_cache.clear()
+
+    def _call_api_uncached(
+        self, api, query_params=None, request_obj=None, exclude_unset: bool = True
     ):
         params, path = self._create_params(
             api, query_params, request_obj, exclude_unset
         )
+        return self._send_params(api, path, params)
+
+    def _send_params(self, api, path, params):
+        if self.coalesce_requests and (
+            api.method == HTTPMethod.GET or api.path in COALESCIBLE_POSTS
+        ):
+            deadline = current_deadline()
+            try:
+                return self._single_flight.do(
+                    request_key(
+                        api.method.value, path, params.get("params"), params.get("data")
+                    ),
+                    lambda: self._call_api_internal(api, path, params),
+                    timeout=deadline.remaining() if deadline is not None else None,
+                )
+            except WaitTimeoutError as err:
+                raise DeadlineExceededError(
+                    message=f"Deadline exceeded while waiting for: {api.method.value} {path}",
+                    code="ATLAN-PYTHON-408-000",
+                ) from err
         return self._call_api_internal(api, path, params)
 
     def _upload_file(self, api, file=None, filename=None):
         generator = MultipartDataGenerator()
         generator.add_file(file=file, filename=filename)
         post_data = generator.get_post_data()
-        api.produces = f"multipart/form-data; boundary={generator.boundary}"
+        api = API(
+            api.path,
+            api.method,
+            api.expected_status,
+            api.consumes,
+            f"multipart/form-data; boundary={generator.boundary}",
+        )
         params, path = self._create_params(
             api, query_params=None, request_obj=None, exclude_unset=True
         )
         return self._call_api_internal(api, path, params, binary_data=post_data)
 
     def _create_params(
-        self, api, query_params, request_obj, exclude_unset: bool = True
+        self,
+        api,
+        query_params,
+        request_obj,
+        exclude_unset: bool = True,
+        compress: bool = True,
     ):
-        params = copy.deepcopy(self._request_params)
-        path = os.path.join(self.base_url, api.path)
-        params["headers"]["Accept"] = api.consumes
-        params["headers"]["content-type"] = api.produces
+        params: dict[str, Any] = {"headers": self._request_templates.headers(api)}
+        path = self._request_templates.url(api)
         if query_params is not None:
             params["params"] = query_params
         if request_obj is not None:
             if isinstance(request_obj, AtlanObject):
-                params["data"] = request_obj.json(
-                    by_alias=True, exclude_unset=exclude_unset
+                params["data"] = self._codec.dumps_model(
+                    request_obj, exclude_unset=exclude_unset
                 )
             else:
-                params["data"] = json.dumps(request_obj)
+                params["data"] = self._codec.dumps(request_obj)
+            if compress:
+                self._compress(api, params)
         if LOGGER.isEnabledFor(logging.DEBUG):
             LOGGER.debug("------------------------------------------------------")
             LOGGER.debug("Call         : %s %s", api.method, path)
@@ -465,6 +1649,21 @@ class AtlanClient(BaseSettings):
             LOGGER.debug("Accept       : %s", api.produces)
         return params, path
 
+    def _compress(self, api, params: dict[str, Any]) -> None:
+        if not (self.compress_requests and api.compressible) or "data" not in params:
+            return
+        data = params["data"]
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if len(data) < self.compression_threshold:
+            return
+        # Without a timestamp, so that the same body is always compressed to the same bytes (for
+        # identical requests to be recognised as such when coalescing them)
+        params["data"] = gzip.compress(
+            data, compresslevel=GZIP_COMPRESSION_LEVEL, mtime=0
+        )
+        params["headers"]["Content-Encoding"] = "gzip"
+
     def upload_image(self, file, filename: str) -> AtlanImage:
         raw_json = self._upload_file(UPLOAD_IMAGE, file=file, filename=filename)
         return AtlanImage(**raw_json)
@@ -754,6 +1953,108 @@ class AtlanClient(BaseSettings):
         )
         return ParsedQuery(**raw_json)
 
+    def get_assets_by_qualified_names(
+        self,
+        qualified_names: Iterable[str],
+        chunk_size: int = DEFAULT_TERMS_CHUNK_SIZE,
+        max_workers: int = DEFAULT_RESOLVE_WORKERS,
+        include_archived: bool = False,
+    ) -> dict[str, Optional[AssetView]]:
+        """
+        Look up many assets by their qualified names at once, through searches for chunks of the
+        names that run in parallel and retrieve only minimal details of each asset.
+
+        :param qualified_names: qualified names of the assets to look up
+        :param chunk_size: maximum number of qualified names to look up in each search
+        :param max_workers: maximum number of searches to run at the same time
+        :param include_archived: whether to also find archived (soft-deleted) assets
+        :returns: a view (with its GUID, type and qualified name) of the asset with each qualified
+            name, or None for any qualified name for which no asset was found
+        """
+        return self._get_assets_by(
+            TermAttributes.QUALIFIED_NAME.value,
+            lambda view: view.qualified_name,
+            qualified_names,
+            chunk_size,
+            max_workers,
+            include_archived,
+        )
+
+    def get_assets_by_guids(
+        self,
+        guids: Iterable[str],
+        chunk_size: int = DEFAULT_TERMS_CHUNK_SIZE,
+        max_workers: int = DEFAULT_RESOLVE_WORKERS,
+        include_archived: bool = False,
+    ) -> dict[str, Optional[AssetView]]:
+        """
+        Look up many assets by their GUIDs at once, through searches for chunks of the GUIDs that
+        run in parallel and retrieve only minimal details of each asset.
+
+        :param guids: GUIDs of the assets to look up
+        :param chunk_size: maximum number of GUIDs to look up in each search
+        :param max_workers: maximum number of searches to run at the same time
+        :param include_archived: whether to also find archived (soft-deleted) assets
+        :returns: a view (with its GUID, type and qualified name) of the asset with each GUID, or
+            None for any GUID for which no asset was found
+        """
+        return self._get_assets_by(
+            TermAttributes.GUID.value,
+            lambda view: view.guid,
+            guids,
+            chunk_size,
+            max_workers,
+            include_archived,
+        )
+
+    def _get_assets_by(
+        self,
+        field: str,
+        key: Callable[[AssetView], Optional[str]],
+        identifiers: Iterable[str],
+        chunk_size: int,
+        max_workers: int,
+        include_archived: bool,
+    ) -> dict[str, Optional[AssetView]]:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        found: dict[str, Optional[AssetView]] = dict.fromkeys(identifiers)
+        deadline = current_deadline()
+
+        def search_chunk(chunk: Sequence[str]) -> list[AssetView]:
+            query: Query = Terms(field=field, values=list(chunk))
+            if not include_archived:
+                query = Bool(filter=[query, Term.with_state("ACTIVE")])
+            criteria = IndexSearchRequest(
+                dsl=DSL(query=query, size=len(chunk)),
+                attributes=[TermAttributes.QUALIFIED_NAME.value],
+            )
+            with deadline_scope(deadline):
+                results = self.search(criteria, deep_paging=True, lazy=True)
+                # A lazy search only returns views
+                views = cast(list[AssetView], list(results.current_page()))
+                # Only page further for the (rare) identifiers shared by several assets
+                while len(views) < results.count and results.next_page():
+                    views.extend(cast(list[AssetView], results.current_page()))
+                return views
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="atlan-resolve"
+        ) as executor:
+            for views in executor.map(search_chunk, chunks(list(found), chunk_size)):
+                for view in views:
+                    identifier = key(view)
+                    if identifier not in found:
+                        continue
+                    if found[identifier] is not None:
+                        LOGGER.warning(
+                            "More than 1 asset found for '%s', returning only the first.",
+                            identifier,
+                        )
+                        continue
+                    found[identifier] = view
+        return found
+
     @validate_arguments()
     def get_asset_by_qualified_name(
         self,
@@ -767,14 +2068,13 @@ class AtlanClient(BaseSettings):
             "minExtInfo": min_ext_info,
             "ignoreRelationships": ignore_relationships,
         }
+        api = GET_ENTITY_BY_UNIQUE_ATTRIBUTE.format_path_with_params(
+            asset_type.__name__
+        )
         try:
-            raw_json = self._call_api(
-                GET_ENTITY_BY_UNIQUE_ATTRIBUTE.format_path_with_params(
-                    asset_type.__name__
-                ),
-                query_params,
-            )
-            asset = self.handle_relationships(raw_json)
+            raw_json = self._call_api(api, query_params)
+            with self._measure_parse(api):
+                asset = self.handle_relationships(raw_json)
             if not isinstance(asset, asset_type):
                 raise NotFoundError(
                     message=f"Asset with qualifiedName {qualified_name} "
@@ -800,12 +2100,11 @@ class AtlanClient(BaseSettings):
             "ignoreRelationships": ignore_relationships,
         }
 
+        api = GET_ENTITY_BY_GUID.format_path_with_params(guid)
         try:
-            raw_json = self._call_api(
-                GET_ENTITY_BY_GUID.format_path_with_params(guid),
-                query_params,
-            )
-            asset = self.handle_relationships(raw_json)
+            raw_json = self._call_api(api, query_params)
+            with self._measure_parse(api):
+                asset = self.handle_relationships(raw_json)
             if not isinstance(asset, asset_type):
                 raise NotFoundError(
                     message=f"Asset with GUID {guid} is not of the type requested: {asset_type.__name__}.",
@@ -860,7 +2159,8 @@ class AtlanClient(BaseSettings):
             asset.validate_required()
         request = BulkRequest[Asset](entities=entities)
         raw_json = self._call_api(BULK_UPDATE, query_params, request)
-        return AssetMutationResponse(**raw_json)
+        with self._measure_parse(BULK_UPDATE):
+            return AssetMutationResponse(**raw_json)
 
     def upsert_merging_cm(
         self, entity: Union[Asset, list[Asset]], replace_atlan_tags: bool = False
@@ -879,7 +2179,8 @@ class AtlanClient(BaseSettings):
             asset.validate_required()
         request = BulkRequest[Asset](entities=entities)
         raw_json = self._call_api(BULK_UPDATE, query_params, request)
-        return AssetMutationResponse(**raw_json)
+        with self._measure_parse(BULK_UPDATE):
+            return AssetMutationResponse(**raw_json)
 
     def upsert_replacing_cm(
         self, entity: Union[Asset, list[Asset]], replace_atlan_tagss: bool = False
@@ -898,7 +2199,8 @@ class AtlanClient(BaseSettings):
             asset.validate_required()
         request = BulkRequest[Asset](entities=entities)
         raw_json = self._call_api(BULK_UPDATE, query_params, request)
-        return AssetMutationResponse(**raw_json)
+        with self._measure_parse(BULK_UPDATE):
+            return AssetMutationResponse(**raw_json)
 
     def purge_entity_by_guid(self, guid) -> AssetMutationResponse:
         raw_json = self._call_api(
@@ -914,31 +2216,220 @@ class AtlanClient(BaseSettings):
         )
         return AssetMutationResponse(**raw_json)
 
-    def search(self, criteria: IndexSearchRequest) -> IndexSearchResults:
-        raw_json = self._call_api(
-            INDEX_SEARCH,
-            request_obj=criteria,
+    def search(
+        self,
+        criteria: IndexSearchRequest,
+        deep_paging: bool = False,
+        lazy: bool = False,
+        adaptive_page_size: Optional[AdaptivePageSize] = None,
+        consistent: bool = False,
+    ) -> IndexSearchResults:
+        """
+        Search for assets matching the given criteria.
+
+        :param criteria: the criteria of the search
+        :param deep_paging: whether to page through the results using search_after (from the last
+            result of each page) rather than an offset, so that retrieving each further page costs
+            the same regardless of how deep into the results it is. This adds a sort by GUID to
+            (a copy of) the criteria, to make the order of the results stable.
+        :param lazy: whether to return lightweight, read-only views over the raw JSON of each
+            result (AssetView) rather than full assets, deferring the (comparatively expensive)
+            building of each asset until its view's to_asset() is called
+        :param adaptive_page_size: how to size each further page of results from the size and
+            latency of the response for the page before it, rather than keeping the size given
+            by the criteria (which is only used for the first page)
+        :param consistent: whether to guard against the index changing while paging through
+            the results: results already retrieved on an earlier page are skipped (by GUID), and
+            when paging by offset each page overlaps the one before it by a result, so that any
+            results that may have been missed are detected and reported (see paging_report on
+            the results). Deep paging, which continues from the last result of each page
+            rather than an offset, is not subject to such gaps unless the values sorted by change.
+        :returns: the first page of results, through which any further pages can be retrieved.
+            If the criteria require terms queries with more than max_terms_values values, the
+            search is split into several for chunks of their values (see split_terms), which
+            are paged through concurrently (by up to search_chunk_workers at a time). The results
+            then page through the chunks' pages in the order they are retrieved (so they are only
+            in the order requested within each chunk), skipping any result already retrieved
+            from another chunk, and cannot include aggregations.
+        :raises ValueError: if the search is split into chunks but requests aggregations
+        """
+        if deep_paging:
+            criteria = with_tiebreaker(criteria)
+        split = split_terms(criteria, self.max_terms_values)
+        if len(split) > 1:
+            return self._search_chunks(split, deep_paging, lazy, adaptive_page_size)
+        raw_json, assets, search_after, captured = self._search_page(
+            criteria, deep_paging, lazy
         )
-        if "entities" in raw_json:
+        results = AtlanClient.IndexSearchResults(
+            client=self,
+            criteria=criteria,
+            start=criteria.dsl.from_,
+            size=criteria.dsl.size,
+            count=raw_json.get("approximateCount", 0),
+            assets=assets,
+            search_after=search_after,
+            lazy=lazy,
+            aggregations=parse_aggregations(raw_json.get("aggregations")),
+            adaptive_page_size=adaptive_page_size,
+            consistent=consistent,
+        )
+        results._adapt(captured)
+        return results
+
+    def _search_page(
+        self, criteria: IndexSearchRequest, deep_paging: bool, lazy: bool
+    ) -> tuple[dict[str, Any], list[Any], Optional[list[Any]], list[RequestMetrics]]:
+        """
+        Retrieve the first page of results of a search: the response, the results parsed from
+        it, the values to search after its last result (if deep paging) and the requests sent.
+        """
+        with self._capture_requests() as captured:
+            raw_json = self._call_api(
+                INDEX_SEARCH,
+                request_obj=criteria,
+            )
+        assets: list[SearchResult]
+        if "entities" in raw_json and lazy:
+            assets = [
+                AssetView(entity, criteria.attributes)
+                for entity in raw_json["entities"]
+            ]
+        elif "entities" in raw_json:
             try:
-                for entity in raw_json["entities"]:
-                    unflatten_custom_metadata_for_entity(
-                        entity=entity, attributes=criteria.attributes
-                    )
-                assets = parse_obj_as(list[Asset], raw_json["entities"])
+                with self._measure_parse(INDEX_SEARCH):
+                    for entity in raw_json["entities"]:
+                        unflatten_custom_metadata_for_entity(
+                            entity=entity, attributes=criteria.attributes
+                        )
+                    assets = list(parse_obj_as(list[Asset], raw_json["entities"]))
             except ValidationError as err:
                 LOGGER.error("Problem parsing JSON: %s", raw_json["entities"])
                 raise err
         else:
             assets = []
-        count = raw_json["approximateCount"] if "approximateCount" in raw_json else 0
+        search_after = None
+        if deep_paging:
+            search_after = (
+                get_search_after(criteria.dsl.sort, raw_json["entities"][-1])
+                if raw_json.get("entities")
+                else []
+            )
+        return raw_json, assets, search_after, captured
+
+    def _search_chunks(
+        self,
+        split: list[IndexSearchRequest],
+        deep_paging: bool,
+        lazy: bool,
+        adaptive_page_size: Optional[AdaptivePageSize],
+    ) -> IndexSearchResults:
+        if split[0].dsl.aggregations:
+            raise ValueError("cannot aggregate over a search split into chunks")
+        criteria = split[0]
         return AtlanClient.IndexSearchResults(
             client=self,
             criteria=criteria,
             start=criteria.dsl.from_,
             size=criteria.dsl.size,
-            count=count,
-            assets=assets,
+            count=0,
+            assets=[],
+            lazy=lazy,
+            consistent=True,
+            chunks=AtlanClient.ParallelSearchResults(
+                client=self,
+                slices=split,
+                max_workers=min(self.search_chunk_workers, len(split)),
+                deep_paging=deep_paging,
+                lazy=lazy,
+                adaptive_page_size=adaptive_page_size,
+            ),
+        )
+
+    def resume_search(
+        self, criteria: IndexSearchRequest, checkpoint: SearchCheckpoint
+    ) -> IndexSearchResults:
+        """
+        Resume iterating through the results of a search from a checkpoint taken while
+        iterating through them. The page that was being iterated through is retrieved again,
+        skipping the results of it that had already been consumed.
+
+        :param criteria: the criteria the search was originally run with
+        :param checkpoint: the checkpoint to resume from
+        :returns: the results, continuing from the checkpoint when iterated through
+        :raises ValueError: if the criteria are not those the checkpoint was taken with
+        """
+        criteria = (
+            with_tiebreaker(criteria)
+            if checkpoint.deep_paging
+            else criteria.copy(deep=True)
+        )
+        if _checkpoint_criteria(criteria) != checkpoint.criteria:
+            raise ValueError("criteria do not match those of the checkpoint")
+        criteria.dsl.from_ = checkpoint.start
+        criteria.dsl.size = checkpoint.size
+        if checkpoint.search_after is not None:
+            criteria.dsl.search_after = checkpoint.search_after
+        results = self.search(
+            criteria, deep_paging=checkpoint.deep_paging, lazy=checkpoint.lazy
+        )
+        results._resume(checkpoint)
+        return results
+
+    def count(self, query: Query, track_total_hits: Union[bool, int] = True) -> int:
+        """
+        Count the assets matching the given query, without retrieving any of them.
+
+        :param query: the query to match assets against
+        :param track_total_hits: True to count every match exactly, or the number of matches
+            up to which to count exactly (beyond which the count is only a lower bound)
+        :returns: the number of matching assets
+        """
+        criteria = IndexSearchRequest(
+            dsl=DSL(query=query, size=0, track_total_hits=track_total_hits),
+            attributes=[],
+        )
+        raw_json = self._call_api(INDEX_SEARCH, request_obj=criteria)
+        return raw_json.get("approximateCount", 0) if raw_json else 0
+
+    def exists(self, query: Query) -> bool:
+        """
+        Determine whether any asset matches the given query, without retrieving any.
+
+        :param query: the query to match assets against
+        :returns: True if at least one asset matches the query, otherwise False
+        """
+        # Matches need only be counted up to the first
+        return self.count(query, track_total_hits=1) > 0
+
+    def search_parallel(
+        self,
+        criteria: IndexSearchRequest,
+        slices: int = DEFAULT_SEARCH_SLICES,
+        max_workers: Optional[int] = None,
+        deep_paging: bool = True,
+        lazy: bool = False,
+    ) -> ParallelSearchResults:
+        """
+        Search for assets matching the given criteria, splitting the search into slices over
+        disjoint ranges of GUIDs that are retrieved concurrently.
+
+        :param criteria: the criteria of the search
+        :param slices: number of slices to split the search into (at most 256)
+        :param max_workers: maximum number of slices to retrieve at the same time (defaults to
+            the number of slices)
+        :param deep_paging: whether each slice pages through its results with search_after
+        :param lazy: whether to return read-only views over the results rather than full assets
+        :returns: results that retrieve the slices once iterated over
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        return AtlanClient.ParallelSearchResults(
+            client=self,
+            slices=partition_by_guid(criteria, slices),
+            max_workers=max_workers or slices,
+            deep_paging=deep_paging,
+            lazy=lazy,
         )
 
     def get_all_typedefs(self) -> TypeDefResponse:
@@ -1311,7 +2802,8 @@ class AtlanClient(BaseSettings):
         )
         if "entities" in raw_json:
             try:
-                assets = parse_obj_as(list[Asset], raw_json["entities"])
+                with self._measure_parse(GET_LINEAGE_LIST):
+                    assets = parse_obj_as(list[Asset], raw_json["entities"])
                 has_more = parse_obj_as(bool, raw_json["hasMore"])
             except ValidationError as err:
                 LOGGER.error("Problem parsing JSON: %s", raw_json["entities"])
@@ -0,0 +1,150 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import threading
+import time
+from collections import deque
+from enum import Enum
+
+from pyatlan.client.constants import ENTITY_BULK_API, INDEX_API, TYPES_API
+from pyatlan.utils import ADMIN_URI, API
+
+
+class EndpointFamily(str, Enum):
+    SEARCH = "search"
+    BULK = "bulk"
+    TYPEDEFS = "typedefs"
+    ADMIN = "admin"
+    ENTITY = "entity"
+
+
+def endpoint_family(api: API) -> EndpointFamily:
+    """
+    Determine the family of endpoints to which the given API belongs.
+    """
+    path = api.path
+    if path.startswith(INDEX_API):
+        return EndpointFamily.SEARCH
+    if path.startswith(ENTITY_BULK_API):
+        return EndpointFamily.BULK
+    if path.startswith(TYPES_API):
+        return EndpointFamily.TYPEDEFS
+    if path.startswith(ADMIN_URI):
+        return EndpointFamily.ADMIN
+    return EndpointFamily.ENTITY
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker over a rolling window of the most recent calls. Once the
+    proportion of failed calls in the window reaches the threshold the circuit opens and calls
+    are rejected until the reset timeout has elapsed, after which a single trial call decides
+    whether to close the circuit again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        minimum_calls: int = 20,
+        reset_timeout: float = 30.0,
+    ):
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold must be greater than 0 and at most 1")
+        if minimum_calls < 1:
+            raise ValueError("minimum_calls must be at least 1")
+        self._failure_threshold = failure_threshold
+        self._minimum_calls = minimum_calls
+        self._reset_timeout = reset_timeout
+        self._outcomes: deque[bool] = deque(maxlen=minimum_calls)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            if (
+                self._state == CircuitState.OPEN
+                and time.monotonic() - self._opened_at >= self._reset_timeout
+            ):
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return True
+            if self._state == CircuitState.OPEN:
+                if time.monotonic() - self._opened_at < self._reset_timeout:
+                    return False
+                self._state = CircuitState.HALF_OPEN
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._trial_in_flight = False
+                self._state = CircuitState.CLOSED
+                self._outcomes.clear()
+            self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._trial_in_flight = False
+                self._open()
+                return
+            self._outcomes.append(False)
+            if len(self._outcomes) >= self._minimum_calls:
+                failures = self._outcomes.count(False)
+                if failures / len(self._outcomes) >= self._failure_threshold:
+                    self._open()
+
+    def release(self) -> None:
+        """
+        Give up a call that ended without an outcome (such as one that was never sent), so
+        that if it was the trial call another one can take its place.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+
+class CircuitBreakers:
+    """
+    One circuit breaker per endpoint family, all sharing the same settings.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        minimum_calls: int = 20,
+        reset_timeout: float = 30.0,
+    ):
+        self._breakers = {
+            family: CircuitBreaker(
+                failure_threshold=failure_threshold,
+                minimum_calls=minimum_calls,
+                reset_timeout=reset_timeout,
+            )
+            for family in EndpointFamily
+        }
+
+    def for_api(self, api: API) -> CircuitBreaker:
+        return self._breakers[endpoint_family(api)]
+
+    def __getitem__(self, family: EndpointFamily) -> CircuitBreaker:
+        return self._breakers[family]
@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, Union, cast
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+AUTO = "auto"
+STDLIB = "json"
+ORJSON = "orjson"
+
+
+class JsonCodec(ABC):
+    """
+    Encodes request bodies to, and decodes response bodies from, JSON.
+    """
+
+    name: str
+
+    @abstractmethod
+    def dumps(
+        self, obj: Any, default: Optional[Callable[[Any], Any]] = None
+    ) -> Union[str, bytes]:
+        """
+        Encode the given object as JSON, using default (if provided) for any object the codec
+        cannot natively encode.
+        """
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Decode the given JSON document.
+        """
+
+    def dumps_model(
+        self, model: BaseModel, exclude_unset: bool = True
+    ) -> Union[str, bytes]:
+        """
+        Encode a pydantic model, producing the same document as model.json(by_alias=True).
+        """
+        data = model.dict(by_alias=True, exclude_unset=exclude_unset)
+        if model.__custom_root_type__:
+            data = data["__root__"]
+        # pydantic declares its (one-argument) encoder as taking no arguments
+        encoder = cast(Callable[[Any], Any], model.__json_encoder__)
+        return self.dumps(data, default=encoder)
+
+
+class StdlibJsonCodec(JsonCodec):
+    name = STDLIB
+
+    def dumps(
+        self, obj: Any, default: Optional[Callable[[Any], Any]] = None
+    ) -> Union[str, bytes]:
+        return json.dumps(obj, default=default)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    name = ORJSON
+
+    def __init__(self):
+        if orjson is None:
+            raise ValueError("orjson must be installed to use the orjson codec")
+        # Let the model's own encoders handle datetimes and dataclasses (queries), as they
+        # serialize these differently from orjson's native representation
+        self._options = (
+            orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_NON_STR_KEYS
+        )
+
+    def dumps(
+        self, obj: Any, default: Optional[Callable[[Any], Any]] = None
+    ) -> Union[str, bytes]:
+        return orjson.dumps(obj, default=default, option=self._options)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+
+def get_codec(name: str = AUTO) -> JsonCodec:
+    """
+    Retrieve the JSON codec with the given name, where "auto" selects the fastest one installed.
+    """
+    if name == AUTO:
+        return OrjsonCodec() if orjson is not None else StdlibJsonCodec()
+    if name == ORJSON:
+        return OrjsonCodec()
+    if name == STDLIB:
+        return StdlibJsonCodec()
+    raise ValueError(f"Unknown JSON codec: {name}")
@@ -68,10 +68,12 @@ ENTITY_BULK_API = f"{ENTITY_API}bulk/"
 BULK_SET_CLASSIFICATIONS = "bulk/setClassifications"
 BULK_HEADERS = "bulk/headers"
 
-BULK_UPDATE = API(ENTITY_BULK_API, HTTPMethod.POST, HTTPStatus.OK)
+BULK_UPDATE = API(ENTITY_BULK_API, HTTPMethod.POST, HTTPStatus.OK, compressible=True)
 # Lineage APIs
 GET_LINEAGE = API(f"{BASE_URI}lineage/getlineage", HTTPMethod.POST, HTTPStatus.OK)
-GET_LINEAGE_LIST = API(f"{BASE_URI}lineage/list", HTTPMethod.POST, HTTPStatus.OK)
+GET_LINEAGE_LIST = API(
+    f"{BASE_URI}lineage/list", HTTPMethod.POST, HTTPStatus.OK, compressible=True
+)
 # Entity APIs
 GET_ENTITY_BY_GUID = API(f"{ENTITY_API}guid", HTTPMethod.GET, HTTPStatus.OK)
 GET_ENTITY_BY_UNIQUE_ATTRIBUTE = API(
@@ -242,7 +244,7 @@ LIMIT = "limit"
 OFFSET = "offset"
 
 INDEX_API = f"{BASE_URI}search/indexsearch"
-INDEX_SEARCH = API(INDEX_API, HTTPMethod.POST, HTTPStatus.OK)
+INDEX_SEARCH = API(INDEX_API, HTTPMethod.POST, HTTPStatus.OK, compressible=True)
 
 TYPES_API = f"{BASE_URI}types/"
 TYPEDEFS_API = f"{TYPES_API}typedefs/"
@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import contextlib
+import threading
+import time
+from typing import Generator, Optional
+
+from urllib3.util.timeout import Timeout
+
+_local = threading.local()
+
+# Shortest timeout given to an attempt at a request (as urllib3 rejects a timeout of 0), so that
+# one started just as the deadline passes fails straight away
+MIN_ATTEMPT_TIMEOUT = 0.001
+
+
+class Deadline:
+    """
+    Point in time by which an operation (one or more requests) must complete.
+    """
+
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise ValueError("seconds must be greater than 0")
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+class DeadlineTimeout(Timeout):
+    """
+    Connect and read timeouts that are capped by what is left of a deadline, afresh for each
+    attempt at a request (urllib3 clones the timeout for every retry).
+    """
+
+    def __init__(self, connect: float, read: float, deadline: Deadline):
+        super().__init__(connect=connect, read=read)
+        self.deadline = deadline
+        self._limits = connect, read
+
+    def clone(self) -> Timeout:
+        remaining = max(MIN_ATTEMPT_TIMEOUT, self.deadline.remaining())
+        connect, read = self._limits
+        return Timeout(connect=min(connect, remaining), read=min(read, remaining))
+
+
+def current_deadline() -> Optional[Deadline]:
+    """
+    Retrieve the deadline that applies to requests made by the calling thread, if any.
+    """
+    return getattr(_local, "deadline", None)
+
+
+@contextlib.contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Generator[None, None, None]:
+    """
+    Apply the given deadline to every request made by the calling thread within the block.
+    When scopes are nested the earliest deadline wins.
+    """
+    outer = current_deadline()
+    if deadline is None or (
+        outer is not None and outer.expires_at <= deadline.expires_at
+    ):
+        effective = outer
+    else:
+        effective = deadline
+    _local.deadline = effective
+    try:
+        yield
+    finally:
+        _local.deadline = outer
@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import contextlib
+import csv
+import gzip
+import json
+from pathlib import Path
+from typing import IO, Any, Generator, Iterable, Optional, Sequence, Union, cast
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.model.asset_view import AssetView
+from pyatlan.model.search import IndexSearchRequest
+
+# Columns written to CSV for every asset, ahead of those for the attributes requested
+DEFAULT_CSV_COLUMNS = ("typeName", "guid", "qualifiedName", "name")
+
+Destination = Union[str, Path, IO]
+
+
+@contextlib.contextmanager
+def _open(
+    destination: Destination, mode: str, compress: Optional[bool]
+) -> Generator[IO, None, None]:
+    if not isinstance(destination, (str, Path)):
+        # Leave files that were opened by the caller for the caller to close
+        yield destination
+        return
+    path = Path(destination)
+    if compress is None:
+        compress = path.suffix == ".gz"
+    newline = None if "b" in mode else ""
+    encoding = None if "b" in mode else "utf-8"
+    opener: Any = gzip.open if compress else open
+    with opener(path, mode, encoding=encoding, newline=newline) as file:
+        yield file
+
+
+def _views(
+    client: AtlanClient, criteria: IndexSearchRequest, prefetch: int
+) -> Generator[AssetView, None, None]:
+    results = client.search(criteria, deep_paging=True, lazy=True)
+    # A lazy search only returns views
+    views = results.prefetch(prefetch) if prefetch else results
+    yield from cast(Iterable[AssetView], views)
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+def csv_columns(criteria: IndexSearchRequest) -> list[str]:
+    """
+    Derive the columns to export the results of a search to CSV with: some identifying the
+    asset, followed by each attribute the search requests.
+    """
+    columns = list(DEFAULT_CSV_COLUMNS)
+    columns.extend(
+        attribute
+        for attribute in criteria.attributes or []
+        if attribute not in DEFAULT_CSV_COLUMNS
+    )
+    return columns
+
+
+def export_to_ndjson(
+    client: AtlanClient,
+    criteria: IndexSearchRequest,
+    destination: Destination,
+    compress: Optional[bool] = None,
+    prefetch: int = 0,
+) -> int:
+    """
+    Export every result of a search as newline-delimited JSON, one asset (as returned by the
+    search) per line. Results are written page by page, as they are retrieved, without building
+    assets from them, so memory use is bounded by the size of a page regardless of how many
+    results there are.
+
+    :param client: client through which to search
+    :param criteria: criteria of the search
+    :param destination: path of the file to write (replacing any existing one), or a file
+        opened in binary mode
+    :param compress: whether to gzip-compress the file written, by default only if its path
+        ends in .gz (ignored when given an open file)
+    :param prefetch: number of pages to retrieve ahead of the one being written, if any
+    :returns: the number of assets exported
+    """
+    codec = client.codec
+    exported = 0
+    with _open(destination, "wb", compress) as file:
+        for view in _views(client, criteria, prefetch):
+            line = codec.dumps(dict(view.raw))
+            file.write(line.encode("utf-8") if isinstance(line, str) else line)
+            file.write(b"\n")
+            exported += 1
+    return exported
+
+
+def export_to_csv(
+    client: AtlanClient,
+    criteria: IndexSearchRequest,
+    destination: Destination,
+    columns: Optional[Sequence[str]] = None,
+    compress: Optional[bool] = None,
+    prefetch: int = 0,
+) -> int:
+    """
+    Export every result of a search as CSV, with a header row followed by a row per asset.
+    Values that are not scalars (such as relationships) are written as JSON. Results are
+    written page by page, as they are retrieved, without building assets from them, so memory
+    use is bounded by the size of a page regardless of how many results there are.
+
+    :param client: client through which to search
+    :param criteria: criteria of the search
+    :param destination: path of the file to write (replacing any existing one), or a file
+        opened in text mode (with newline="")
+    :param columns: (camelCase) names of the properties or attributes to write as columns,
+        by default those given by csv_columns(criteria)
+    :param compress: whether to gzip-compress the file written, by default only if its path
+        ends in .gz (ignored when given an open file)
+    :param prefetch: number of pages to retrieve ahead of the one being written, if any
+    :returns: the number of assets exported
+    """
+    columns = list(columns) if columns else csv_columns(criteria)
+    exported = 0
+    with _open(destination, "wt", compress) as file:
+        writer = csv.writer(file)
+        writer.writerow(columns)
+        for view in _views(client, criteria, prefetch):
+            writer.writerow([_csv_value(view.get(column)) for column in columns])
+            exported += 1
+    return exported
@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Generator, Optional, Union
+
+from pydantic import Field
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.model.enums import SortOrder
+from pyatlan.model.search import (
+    DSL,
+    Bool,
+    IndexSearchRequest,
+    Query,
+    Range,
+    SortItem,
+    TermAttributes,
+)
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+# How far (in seconds) before the watermark to look again for changes, to catch changes whose
+# update time lags (through clock skew between servers, or indexing delays) behind later ones
+DEFAULT_OVERLAP = 60.0
+DEFAULT_SYNC_PAGE_SIZE = 100
+# Number of recently-changed assets to remember before dropping those older than the overlap
+PRUNE_THRESHOLD = 10_000
+
+
+@dataclass(frozen=True)
+class SyncState:
+    """
+    Progress of an incremental sync: the latest update time (in milliseconds since the epoch) of
+    any change retrieved, and the update time of every asset changed within the overlap before
+    it, by GUID, so that those changes are not retrieved again.
+    """
+
+    watermark: Optional[int] = None
+    recent: dict[str, int] = Field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SyncState":
+        return cls(**data)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Write the state to the given file as JSON, atomically replacing any earlier state there.
+        """
+        path = Path(path)
+        temporary = path.with_name(f"{path.name}.tmp")
+        temporary.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SyncState":
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+class IncrementalSync:
+    """
+    Retrieves the assets matching a query that have changed since the last time they were
+    retrieved, by searching only for those updated since a high-watermark of update time. Each
+    sync looks again at the overlap before the watermark, to catch changes whose update times
+    lag behind those already seen, and skips any change it has already retrieved (including
+    those tied on update time). Note that archived assets will only be retrieved as changes if
+    the query does not restrict the search to active assets.
+    """
+
+    def __init__(
+        self,
+        client: AtlanClient,
+        query: Query,
+        state: Optional[SyncState] = None,
+        overlap: float = DEFAULT_OVERLAP,
+        page_size: int = DEFAULT_SYNC_PAGE_SIZE,
+        attributes: Optional[list[str]] = None,
+        lazy: bool = False,
+    ):
+        """
+        :param client: client through which to search
+        :param query: query the assets to keep in sync must match
+        :param state: state reached by an earlier sync, or None to retrieve every asset
+        :param overlap: seconds before the watermark to look again for changes
+        :param page_size: number of assets to retrieve per page of changes
+        :param attributes: attributes to retrieve for each changed asset
+        :param lazy: whether to retrieve read-only views over the changed assets (AssetView)
+            rather than full assets
+        """
+        if overlap < 0:
+            raise ValueError("overlap must not be negative")
+        self._client = client
+        self._query = query
+        self._overlap = int(overlap * 1000)
+        self._page_size = page_size
+        self._attributes = attributes or []
+        self._lazy = lazy
+        state = state or SyncState()
+        self._watermark = state.watermark
+        self._recent = dict(state.recent)
+
+    @property
+    def state(self) -> SyncState:
+        """
+        State reached by the changes retrieved so far, from which to start the next sync. As
+        changes are retrieved in order of update time, it is safe to save part way through.
+        """
+        self._prune()
+        return SyncState(watermark=self._watermark, recent=dict(self._recent))
+
+    def _prune(self) -> None:
+        if self._watermark is None:
+            return
+        horizon = self._watermark - self._overlap
+        self._recent = {
+            guid: update_time
+            for guid, update_time in self._recent.items()
+            if update_time >= horizon
+        }
+
+    def _criteria(self) -> IndexSearchRequest:
+        query = self._query
+        if self._watermark is not None:
+            query = Bool(
+                filter=[
+                    query,
+                    Range.with_update_time_as_timestamp(
+                        gte=self._watermark - self._overlap
+                    ),
+                ]
+            )
+        return IndexSearchRequest(
+            dsl=DSL(
+                query=query,
+                size=self._page_size,
+                sort=[
+                    SortItem(
+                        TermAttributes.UPDATE_TIME_AS_TIMESTAMP.value,
+                        SortOrder.ASCENDING,
+                    )
+                ],
+            ),
+            attributes=self._attributes,
+        )
+
+    def changes(self) -> Generator[Any, None, None]:
+        """
+        Retrieve every asset that changed since the watermark, in order of update time, advancing
+        the watermark as each is retrieved.
+
+        :returns: a generator of the changed assets (or views over them, if lazy)
+        """
+        results = self._client.search(
+            self._criteria(), deep_paging=True, lazy=self._lazy
+        )
+        prune_at = PRUNE_THRESHOLD
+        for asset in results:
+            guid, update_time = asset.guid, asset.update_time
+            if update_time is None or guid is None:
+                yield asset
+                continue
+            if self._recent.get(guid) == update_time:
+                continue
+            self._recent[guid] = update_time
+            if self._watermark is None or update_time > self._watermark:
+                self._watermark = update_time
+            if len(self._recent) > prune_at:
+                self._prune()
+                prune_at = max(PRUNE_THRESHOLD, 2 * len(self._recent))
+            yield asset
+        self._prune()
@@ -0,0 +1,177 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from dataclasses import dataclass
+else:
+    from pydantic.dataclasses import dataclass
+
+# Upper bounds (in seconds) of the histogram buckets, from 1ms to ~2 minutes
+DEFAULT_BUCKETS = tuple(0.001 * 2**i for i in range(18))
+
+
+@dataclass(frozen=True)
+class RequestMetrics:
+    """
+    Measurements of a single call to an API. The latency only covers sending the request and
+    receiving its response, while the time spent beforehand waiting for the rate limiter to
+    allow the request is measured separately (as queue_wait).
+    """
+
+    endpoint: str
+    status_code: Optional[int]
+    latency: float
+    request_bytes: int
+    response_bytes: int
+    retries: int
+    decode_time: float
+    queue_wait: float = 0.0
+
+
+class MetricsSink(ABC):
+    """
+    Receives the measurements the client takes of every API call it makes.
+    Implementations must be thread-safe.
+    """
+
+    @abstractmethod
+    def record_request(self, metrics: RequestMetrics) -> None:
+        """
+        Record the network latency, sizes, status and retries of a single API call, and the time
+        spent waiting for the rate limiter before sending it and decoding its JSON response.
+        """
+
+    @abstractmethod
+    def record_parse(self, endpoint: str, seconds: float) -> None:
+        """
+        Record the time taken to build models from the decoded response of a call to an endpoint.
+        """
+
+
+class Histogram:
+    """
+    Histogram of durations with fixed, exponentially-sized buckets.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        # The last count holds everything beyond the largest bucket
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Estimate the given percentile (0-100) as the upper bound of the bucket it falls into.
+        """
+        if not self.count:
+            return 0.0
+        rank = percentile / 100 * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class EndpointMetrics:
+    """
+    Aggregated measurements of every call made to a single endpoint.
+    """
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.decode_time = Histogram()
+        self.parse_time = Histogram()
+        self.queue_wait = Histogram()
+        self.status_codes: Counter[Optional[int]] = Counter()
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+
+    @property
+    def count(self) -> int:
+        return self.latency.count
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """
+    Keeps aggregated measurements per endpoint in memory.
+    """
+
+    def __init__(self):
+        self._endpoints: dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, endpoint: str) -> EndpointMetrics:
+        if (metrics := self._endpoints.get(endpoint)) is None:
+            metrics = self._endpoints.setdefault(endpoint, EndpointMetrics())
+        return metrics
+
+    def record_request(self, metrics: RequestMetrics) -> None:
+        with self._lock:
+            endpoint = self._get(metrics.endpoint)
+            endpoint.latency.observe(metrics.latency)
+            endpoint.decode_time.observe(metrics.decode_time)
+            endpoint.queue_wait.observe(metrics.queue_wait)
+            endpoint.status_codes[metrics.status_code] += 1
+            endpoint.request_bytes += metrics.request_bytes
+            endpoint.response_bytes += metrics.response_bytes
+            endpoint.retries += metrics.retries
+
+    def record_parse(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            self._get(endpoint).parse_time.observe(seconds)
+
+    @property
+    def endpoints(self) -> dict[str, EndpointMetrics]:
+        return dict(self._endpoints)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints = {}
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Summarize the measurements of each endpoint, with all durations in seconds.
+        """
+        with self._lock:
+            return {
+                endpoint: {
+                    "count": metrics.count,
+                    "errors": sum(
+                        count
+                        for status, count in metrics.status_codes.items()
+                        if status is None or status >= 400
+                    ),
+                    "latency_mean": metrics.latency.mean,
+                    "latency_p50": metrics.latency.percentile(50),
+                    "latency_p95": metrics.latency.percentile(95),
+                    "latency_p99": metrics.latency.percentile(99),
+                    "latency_max": metrics.latency.max,
+                    "decode_time_total": metrics.decode_time.total,
+                    "parse_time_total": metrics.parse_time.total,
+                    "queue_wait_total": metrics.queue_wait.total,
+                    "request_bytes": metrics.request_bytes,
+                    "response_bytes": metrics.response_bytes,
+                    "retries": metrics.retries,
+                }
+                for endpoint, metrics in self._endpoints.items()
+            }
@@ -0,0 +1,230 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import contextlib
+import random
+import threading
+import time
+from typing import Generator, Optional
+
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+from pyatlan.client.deadline import Deadline, current_deadline
+
+TOO_MANY_REQUESTS = 429
+
+
+class LimitTimeoutError(TimeoutError):
+    """
+    Raised when a request could not be started before its deadline.
+    """
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that limits how many requests are started per second and how many
+    can be in flight at once. Any thread that is told to back off (for example by a 429 response
+    with a Retry-After header) pauses every other thread sharing the limiter as well.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        max_concurrent: Optional[int] = None,
+    ):
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second must be greater than 0")
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self._rate = requests_per_second
+        self._capacity = max(1.0, requests_per_second or 0.0)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._in_flight = (
+            threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        )
+
+    @property
+    def requests_per_second(self) -> Optional[float]:
+        return self._rate
+
+    def pause(self, seconds: float) -> None:
+        """
+        Prevent any new request from starting for the given number of seconds.
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _reserve(self) -> float:
+        """
+        Take a token if one is available, otherwise return how long to wait before trying again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self._rate is None:
+                return 0.0
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._last_refill) * self._rate
+            )
+            self._last_refill = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self._rate
+
+    def wait(self, deadline: Optional[Deadline] = None) -> bool:
+        """
+        Block until the calling thread is allowed to start a request, or until the given
+        deadline (if any) passes first.
+
+        :param deadline: point in time after which to stop waiting
+        :returns: whether the calling thread is allowed to start a request
+        """
+        while (delay := self._reserve()) > 0:
+            if deadline is not None and delay >= deadline.remaining():
+                time.sleep(deadline.remaining())
+                return False
+            time.sleep(delay)
+        return True
+
+    @contextlib.contextmanager
+    def limit(self, deadline: Optional[Deadline] = None) -> Generator[None, None, None]:
+        """
+        Context manager that holds one of the in-flight slots for the duration of a request.
+
+        :param deadline: point in time by which the request must have been allowed to start
+        :raises LimitTimeoutError: if the request is not allowed to start before the deadline
+        """
+        if self._in_flight and not self._in_flight.acquire(
+            timeout=deadline.remaining() if deadline is not None else None
+        ):
+            raise LimitTimeoutError("no request slot became free before the deadline")
+        try:
+            if not self.wait(deadline):
+                raise LimitTimeoutError("rate limit not lifted before the deadline")
+            yield
+        finally:
+            if self._in_flight:
+                self._in_flight.release()
+
+
+class RetryBudget:
+    """
+    Thread-safe budget of retries shared by every request of a client. Each request deposits
+    a fraction of a retry into the budget and each retry withdraws a whole one, so that retries
+    can never exceed that fraction of the overall traffic (plus a small reserve).
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: int = 10, capacity: int = 100):
+        if ratio < 0:
+            raise ValueError("ratio cannot be negative")
+        self._ratio = ratio
+        self._capacity = max(capacity, reserve)
+        self._balance = float(reserve)
+        self._lock = threading.Lock()
+
+    @property
+    def balance(self) -> float:
+        return self._balance
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._balance = min(self._capacity, self._balance + self._ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class AtlanRetry(Retry):
+    """
+    Retry strategy with jittered exponential backoff that draws from a shared retry budget and
+    propagates a server's Retry-After to every thread using the same rate limiter. Each retried
+    attempt also takes its own token from the rate limiter, so the limit applies to every attempt
+    sent rather than only to each call. Retries stop once the deadline of the calling thread (if
+    any) has passed, and never wait (for a backoff, Retry-After or the rate limiter) beyond it.
+    """
+
+    def __init__(
+        self,
+        *args,
+        budget: Optional[RetryBudget] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_backoff: float = 30.0,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.budget = budget
+        self.rate_limiter = rate_limiter
+        self.max_backoff = max_backoff
+
+    def new(self, **kw):
+        retry = super().new(**kw)
+        retry.budget = self.budget
+        retry.rate_limiter = self.rate_limiter
+        retry.max_backoff = self.max_backoff
+        return retry
+
+    def get_backoff_time(self) -> float:
+        backoff = min(self.max_backoff, super().get_backoff_time())
+        if (deadline := current_deadline()) is not None:
+            backoff = min(backoff, deadline.remaining())
+        # Use "equal jitter" so that workers retrying at the same time spread out
+        return backoff / 2 + random.uniform(0, backoff / 2)  # noqa: S311
+
+    def sleep_for_retry(self, response) -> bool:
+        retry_after = self.get_retry_after(response)
+        if not retry_after:
+            return False
+        if (deadline := current_deadline()) is not None:
+            retry_after = min(retry_after, deadline.remaining())
+        time.sleep(retry_after)
+        return True
+
+    def sleep(self, response=None) -> None:
+        super().sleep(response)
+        deadline = current_deadline()
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait(deadline)
+        if deadline is not None and deadline.expired:
+            # Abandoned between attempts, so there is no connection pool to report
+            raise MaxRetryError(
+                None, "", ResponseError("deadline exceeded")  # type: ignore[arg-type]
+            )
+
+    def increment(
+        self,
+        method=None,
+        url=None,
+        response=None,
+        error=None,
+        _pool=None,
+        _stacktrace=None,
+    ):
+        if (
+            response is not None
+            and response.status == TOO_MANY_REQUESTS
+            and self.rate_limiter is not None
+        ):
+            self.rate_limiter.pause(self.get_retry_after(response) or 1.0)
+        if (deadline := current_deadline()) is not None and deadline.expired:
+            raise MaxRetryError(_pool, url, error or ResponseError("deadline exceeded"))
+        if self.budget is not None and not self.budget.withdraw():
+            raise MaxRetryError(
+                _pool, url, error or ResponseError("retry budget exhausted")
+            )
+        return super().increment(
+            method=method,
+            url=url,
+            response=response,
+            error=error,
+            _pool=_pool,
+            _stacktrace=_stacktrace,
+        )
@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import os
+import threading
+from types import MappingProxyType
+from typing import Mapping
+
+from pyatlan.utils import API
+
+DEFAULT_MAX_CACHED_URLS = 4096
+
+
+class RequestTemplates:
+    """
+    Resolves and caches the URL and immutable header template for each API a client calls, so
+    that building a request only needs to copy a small header mapping rather than deep-copying
+    the client's request parameters and re-joining the URL every time.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: Mapping[str, str],
+        max_cached_urls: int = DEFAULT_MAX_CACHED_URLS,
+    ):
+        self._base_url = base_url
+        self._headers = MappingProxyType(dict(headers))
+        self._max_cached_urls = max_cached_urls
+        self._urls: dict[str, str] = {}
+        self._header_templates: dict[tuple[str, str], Mapping[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def url(self, api: API) -> str:
+        if (url := self._urls.get(api.path)) is None:
+            url = os.path.join(self._base_url, api.path)
+            with self._lock:
+                # Paths that embed GUIDs are effectively unbounded, so start afresh when full
+                if len(self._urls) >= self._max_cached_urls:
+                    self._urls = {}
+                self._urls[api.path] = url
+        return url
+
+    def header_template(self, api: API) -> Mapping[str, str]:
+        key = (api.consumes, api.produces)
+        if (template := self._header_templates.get(key)) is None:
+            template = MappingProxyType(
+                {**self._headers, "Accept": api.consumes, "content-type": api.produces}
+            )
+            with self._lock:
+                # Multipart uploads use a unique boundary per request, so bound these too
+                if len(self._header_templates) >= self._max_cached_urls:
+                    self._header_templates = {}
+                self._header_templates[key] = template
+        return template
+
+    def headers(self, api: API) -> dict[str, str]:
+        """
+        Build a fresh (mutable) set of headers for a single call to the given API.
+        """
+        return dict(self.header_template(api))
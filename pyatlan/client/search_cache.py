@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Union
+
+from pyatlan.client.codec import JsonCodec
+
+
+def search_key(data: Union[str, bytes]) -> str:
+    """
+    Build the key under which the response to a search is cached: a hash of its request body,
+    normalised so that the order of keys within it does not matter.
+    """
+    normalised = json.dumps(json.loads(data), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(normalised.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """
+    Keeps the (encoded) responses to searches in memory for a limited time, evicting the least
+    recently used once it holds the maximum number of them. Every response is decoded afresh
+    when it is used, so callers cannot modify one another's responses. Clearing the cache also
+    discards any response to a search that was already in flight, as it may predate whatever
+    made clearing the cache necessary.
+    """
+
+    def __init__(self, max_size: int, ttl: float, codec: JsonCodec):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._codec = codec
+        self._entries: OrderedDict[str, tuple[float, Union[str, bytes]]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_load(self, key: str, load: Callable[[], Any]) -> Any:
+        """
+        Retrieve the cached response under the given key, or (if there is none that has not
+        expired) load the response and cache it.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                data = entry[1]
+            else:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                generation = self._generation
+                data = None
+        if data is not None:
+            return self._codec.loads(data)
+        response = load()
+        # Encode the response before handing it over, in case the caller modifies it
+        data = self._codec.dumps(response)
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + self.ttl, data)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return response
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import copy
+import hashlib
+import threading
+from typing import Any, Callable, Hashable, Optional, Union
+
+
+def request_key(
+    method: str,
+    path: str,
+    query_params: Optional[dict[str, Any]],
+    data: Optional[Union[str, bytes]],
+) -> Hashable:
+    """
+    Build the key under which identical requests are coalesced: the method, URL, query
+    parameters and a hash of the request body.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    body_hash = hashlib.sha256(data).hexdigest() if data is not None else None
+    params = (
+        tuple(sorted((str(k), repr(v)) for k, v in query_params.items()))
+        if query_params
+        else ()
+    )
+    return method, path, params, body_hash
+
+
+class WaitTimeoutError(TimeoutError):
+    """
+    Raised to a caller that gave up waiting for the outcome of an identical call in flight.
+    """
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.followers = 0
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Merges identical calls that are in flight at the same time, so that only the first caller
+    (the leader) does the work and every other caller waits for and shares its outcome. Callers
+    that shared a result each receive their own deep copy, so none can modify another's result.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def do(
+        self, key: Hashable, func: Callable[[], Any], timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Call the given function, unless an identical call (with the same key) is already in
+        flight, in which case wait for and share its outcome instead.
+
+        :param key: identifies identical calls
+        :param func: the call to make
+        :param timeout: maximum number of seconds to wait for an identical call in flight
+            (indefinitely if not given)
+        :returns: the outcome of the call
+        :raises WaitTimeoutError: if the identical call in flight does not finish in time
+        """
+        with self._lock:
+            if (call := self._calls.get(key)) is not None:
+                call.followers += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+        if not leader:
+            if not call.done.wait(timeout):
+                raise WaitTimeoutError("timed out waiting for an identical call")
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # No further followers can join once the call is removed, so it is safe to read them
+            with self._lock:
+                del self._calls[key]
+                shared = call.followers > 0
+            call.done.set()
+        return copy.deepcopy(call.result) if shared else call.result
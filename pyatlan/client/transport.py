@@ -0,0 +1,213 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import base64
+import gzip
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Hashable, Optional, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Only responses' content-related headers are kept, as anything else is meaningless on replay
+RECORDED_HEADERS = ("content-type",)
+
+
+class NoRecordingError(LookupError):
+    """
+    Raised when a replay transport is asked for a request it has no recording of.
+    """
+
+
+class Transport(ABC):
+    """
+    Sends the HTTP requests of a client.
+    """
+
+    @abstractmethod
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request, accepting the same keyword arguments as requests.Session.request().
+        """
+
+    def close(self) -> None:
+        pass
+
+
+class SessionTransport(Transport):
+    """
+    Sends requests over a requests session (and so through its connection pool and retries).
+    """
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        return self.session.request(method, url, **kwargs)
+
+
+def _decode_body(data: Union[str, bytes, None], headers: Optional[dict]) -> Any:
+    if data is None:
+        return None
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if headers and headers.get("Content-Encoding") == "gzip":
+        data = gzip.decompress(data)
+    # Compare JSON bodies by value, so the codec used to encode them does not matter
+    try:
+        return json.loads(data)
+    except ValueError:
+        return base64.b64encode(data).decode("ascii")
+
+
+def _request_key(
+    method: str, url: str, params: Optional[dict[str, Any]], body: Any
+) -> Hashable:
+    query = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return method, url, query, json.dumps(body, sort_keys=True)
+
+
+def _build_response(
+    url: str, status_code: int, headers: dict[str, str], content: bytes
+) -> requests.Response:
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response.encoding = "utf-8"
+    return response
+
+
+class RecordingTransport(Transport):
+    """
+    Sends requests through another transport, recording every request and its response to a
+    gzip-compressed file of newline-delimited JSON that a ReplayTransport can replay.
+    """
+
+    def __init__(self, path: Union[str, Path], transport: Transport):
+        self._transport = transport
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        start = time.perf_counter()
+        response = self._transport.request(method, url, **kwargs)
+        content = response.content or b""
+        try:
+            body, body_encoding = content.decode("utf-8"), "text"
+        except UnicodeDecodeError:
+            body, body_encoding = base64.b64encode(content).decode("ascii"), "base64"
+        recording = {
+            "method": method,
+            "url": url,
+            "params": {str(k): str(v) for k, v in (kwargs.get("params") or {}).items()},
+            "request_body": _decode_body(kwargs.get("data"), kwargs.get("headers")),
+            "status_code": response.status_code,
+            "headers": {
+                name: response.headers[name]
+                for name in RECORDED_HEADERS
+                if name in response.headers
+            },
+            "body": body,
+            "body_encoding": body_encoding,
+            "elapsed": time.perf_counter() - start,
+        }
+        line = json.dumps(recording)
+        with self._lock:
+            self._file.write(line + "\n")
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+        self._transport.close()
+
+
+class ReplayTransport(Transport):
+    """
+    Answers requests from previously recorded (or explicitly added) responses, without any
+    network access. Identical requests are answered in the order they were recorded, repeating
+    the last response once all have been used. Replayed responses can be delayed by a fixed
+    latency, by the latency that was originally recorded, or both.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        latency: float = 0.0,
+        replay_recorded_latency: bool = False,
+    ):
+        self.latency = latency
+        self.replay_recorded_latency = replay_recorded_latency
+        self._responses: dict[Hashable, deque[dict[str, Any]]] = defaultdict(deque)
+        self._lock = threading.Lock()
+        if path is not None:
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                for line in file:
+                    if line.strip():
+                        self._add_recording(json.loads(line))
+
+    def _add_recording(self, recording: dict[str, Any]) -> None:
+        key = _request_key(
+            recording["method"],
+            recording["url"],
+            recording["params"],
+            recording["request_body"],
+        )
+        self._responses[key].append(recording)
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        body: Any = None,
+        status_code: int = 200,
+        params: Optional[dict[str, Any]] = None,
+        request_body: Any = None,
+    ) -> None:
+        """
+        Add a response to replay for the given request, where body and request_body are any
+        JSON-serializable object (such as a fixture loaded from a file).
+        """
+        self._add_recording(
+            {
+                "method": method,
+                "url": url,
+                "params": params,
+                "request_body": request_body,
+                "status_code": status_code,
+                "headers": {"content-type": "application/json"},
+                "body": "" if body is None else json.dumps(body),
+                "body_encoding": "text",
+                "elapsed": 0.0,
+            }
+        )
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        key = _request_key(
+            method,
+            url,
+            kwargs.get("params"),
+            _decode_body(kwargs.get("data"), kwargs.get("headers")),
+        )
+        with self._lock:
+            if not (responses := self._responses.get(key)):
+                raise NoRecordingError(f"No recorded response for: {method} {url}")
+            recording = responses.popleft() if len(responses) > 1 else responses[0]
+        delay = self.latency
+        if self.replay_recorded_latency:
+            delay += recording["elapsed"]
+        if delay > 0:
+            time.sleep(delay)
+        if recording["body_encoding"] == "base64":
+            content = base64.b64decode(recording["body"])
+        else:
+            content = recording["body"].encode("utf-8")
+        return _build_response(
+            url, recording["status_code"], recording["headers"], content
+        )
@@ -165,3 +165,22 @@ class LogicError(AtlanError):
 
     def __init__(self, message: str, code: str, status_code: int = 500):
         super().__init__(message, code, status_code)
+
+
+class ServiceUnavailableError(AtlanError):
+    """
+    Error that occurs when Atlan responds that it is unavailable, or when requests to a family of endpoints are being
+    rejected without being sent, because too many recent requests to those endpoints have failed.
+    """
+
+    def __init__(self, message: str, code: str, status_code: int = 503):
+        super().__init__(message, code, status_code)
+
+
+class DeadlineExceededError(AtlanError):
+    """
+    Error that occurs when an operation does not complete within the deadline that was set for it.
+    """
+
+    def __init__(self, message: str, code: str, status_code: int = 408):
+        super().__init__(message, code, status_code)
@@ -63,6 +63,8 @@ def get_current_view_of_asset(
             if len(response.current_page()) > 0
             else None
         )
+        # Always a full asset, as the search is not lazy
+        and isinstance(result, Asset)
         else None
     )
 
@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import copy
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from pydantic import parse_obj_as
+
+from pyatlan.model import assets
+from pyatlan.model.assets import Asset
+from pyatlan.model.core import to_camel_case
+from pyatlan.utils import unflatten_custom_metadata_for_entity
+
+
+@lru_cache(maxsize=None)
+def _field_names(type_name: Optional[str]) -> frozenset[str]:
+    """
+    Names of the properties and attributes of the asset type with the given name (or of any
+    asset, if the type is not known).
+    """
+    asset_type = Asset._subtypes_.get(type_name or "") or getattr(
+        assets, type_name or "", Asset
+    )
+    if not (isinstance(asset_type, type) and issubclass(asset_type, Asset)):
+        asset_type = Asset
+    return frozenset(asset_type.__fields__) | frozenset(
+        asset_type.Attributes.__fields__
+    )
+
+
+class AssetView:
+    """
+    Lightweight, read-only view over the raw JSON of an asset, that only builds the full (validated)
+    asset when to_asset() is called. Any property or attribute of the asset can be read by its
+    (snake_case) name, giving its raw JSON value, or None if it was not included in the JSON.
+    Reading a name that is not a property or attribute of the asset's type raises AttributeError.
+    """
+
+    __slots__ = ("_entity", "_requested_attributes")
+
+    def __init__(
+        self, entity: dict[str, Any], requested_attributes: Optional[list[str]] = None
+    ):
+        object.__setattr__(self, "_entity", entity)
+        object.__setattr__(self, "_requested_attributes", requested_attributes)
+
+    @property
+    def raw(self) -> Mapping[str, Any]:
+        return MappingProxyType(self._entity)
+
+    @property
+    def type_name(self) -> Optional[str]:
+        return self._entity.get("typeName")
+
+    @property
+    def guid(self) -> Optional[str]:
+        return self._entity.get("guid")
+
+    @property
+    def qualified_name(self) -> Optional[str]:
+        return self.get("qualifiedName")
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.get("name")
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """
+        Retrieve the raw value of the asset's property or attribute with the given (camelCase)
+        name.
+        """
+        if name in self._entity:
+            return self._entity[name]
+        return (self._entity.get("attributes") or {}).get(name, default)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name not in _field_names(self.type_name):
+            raise AttributeError(
+                f"{type(self).__name__} of {self.type_name} has no attribute {name!r}"
+            )
+        return self.get(to_camel_case(name))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(type_name={self.type_name!r}, guid={self.guid!r}, "
+            f"qualified_name={self.qualified_name!r})"
+        )
+
+    def to_asset(self) -> Asset:
+        """
+        Build the full asset (of the subtype given by its typeName) from the view.
+        """
+        entity = copy.deepcopy(self._entity)
+        unflatten_custom_metadata_for_entity(
+            entity=entity, attributes=self._requested_attributes
+        )
+        return parse_obj_as(Asset, entity)
@@ -1,11 +1,13 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2022 Atlan Pte. Ltd.
 # Based on original code from https://github.com/elastic/elasticsearch-dsl-py.git (under Apache-2.0 license)
+import json
 from abc import ABC, abstractmethod
+from copy import deepcopy
 from datetime import datetime
 from enum import Enum
 from itertools import chain
-from typing import TYPE_CHECKING, Any, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Literal, Optional, Sequence, Union
 
 from pydantic import (
     ConfigDict,
@@ -27,8 +29,6 @@ if TYPE_CHECKING:
 else:
     from pydantic.dataclasses import dataclass
 
-import copy
-
 SearchFieldType = Union[StrictStr, StrictInt, StrictFloat, StrictBool, datetime]
 
 
@@ -89,7 +89,7 @@ def get_with_string(attribute: TermAttributes):
     return with_string
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class Query(ABC):
     def __add__(self, other):
         # make sure we give queries that know how to combine themselves
@@ -115,21 +115,80 @@ class Query(ABC):
     def __invert__(self):
         return Bool(must_not=[self])
 
-    def _clone(self):
-        return copy.deepcopy(self)
+    def __eq__(self, other):
+        if not isinstance(other, Query):
+            return NotImplemented
+        return type(self) is type(other) and self.to_json() == other.to_json()
+
+    def __getstate__(self):
+        # Leave out the compiled forms and hash, to be computed afresh once unpickled: the hash
+        # of a str differs from one process to another
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in ("_dict", "_json", "_hash")
+        }
+
+    def __hash__(self):
+        if (value := self.__dict__.get("_hash")) is None:
+            value = hash((type(self), self.to_json()))
+            object.__setattr__(self, "_hash", value)
+        return value
+
+    def __post_init_post_parse__(self):
+        # Lists of clauses or values are kept as tuples, so they cannot be changed once the
+        # query has been compiled
+        for name in self.__dataclass_fields__:
+            if isinstance(value := getattr(self, name), list):
+                object.__setattr__(self, name, tuple(value))
 
-    @abstractmethod
     def to_dict(self) -> dict[Any, Any]:
+        """
+        Compile the query into the dict form sent to Elasticsearch. As queries are immutable this
+        is only done once, and a copy of the result is returned each time.
+        """
+        return deepcopy(self._compiled())
+
+    def to_json(self) -> str:
+        """
+        Compile the query into the (compact) JSON form sent to Elasticsearch, only once.
+        """
+        if (value := self.__dict__.get("_json")) is None:
+            value = json.dumps(self._compiled(), separators=(",", ":"), default=str)
+            object.__setattr__(self, "_json", value)
+        return value
+
+    def _compiled(self) -> dict[Any, Any]:
+        # The dict form, compiled only once and shared: only to be serialized, never modified
+        if (value := self.__dict__.get("_dict")) is None:
+            value = self._to_dict()
+            object.__setattr__(self, "_dict", value)
+        return value
+
+    def _evolve(self, **changes):
+        """
+        Build a copy of this query with the given fields changed. The copy is not validated
+        again, as combining queries only ever reuses parts of queries that already were.
+        """
+        query = object.__new__(type(self))
+        for name in self.__dataclass_fields__:
+            object.__setattr__(query, name, changes.get(name, getattr(self, name)))
+        object.__setattr__(query, "__pydantic_initialised__", True)
+        query.__post_init_post_parse__()
+        return query
+
+    @abstractmethod
+    def _to_dict(self) -> dict[Any, Any]:
         ...
 
 
-@dataclass(config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
+@dataclass(frozen=True, eq=False, config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
 class MatchAll(Query):
     type_name: Literal["match_all"] = "match_all"
     boost: Optional[float] = None
 
     def __add__(self, other):
-        return other._clone()
+        return other
 
     __and__ = __rand__ = __radd__ = __add__
 
@@ -141,7 +200,7 @@ class MatchAll(Query):
     def __invert__(self):
         return MatchNone()
 
-    def to_dict(self) -> dict[Any, Any]:
+    def _to_dict(self) -> dict[Any, Any]:
         value = {"boost": self.boost} if self.boost else {}
         return {self.type_name: value}
 
@@ -149,7 +208,7 @@ class MatchAll(Query):
 EMPTY_QUERY = MatchAll()
 
 
-@dataclass(config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
+@dataclass(frozen=True, eq=False, config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
 class MatchNone(Query):
     type_name: Literal["match_none"] = "match_none"
 
@@ -159,18 +218,18 @@ class MatchNone(Query):
     __and__ = __rand__ = __radd__ = __add__
 
     def __or__(self, other):
-        return other._clone()
+        return other
 
     __ror__ = __or__
 
     def __invert__(self):
         return MatchAll()
 
-    def to_dict(self) -> dict[Any, Any]:
+    def _to_dict(self) -> dict[Any, Any]:
         return {"match_none": {}}
 
 
-@dataclass(config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
+@dataclass(frozen=True, eq=False, config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
 class Exists(Query):
     field: str
     type_name: Literal["exists"] = "exists"
@@ -326,11 +385,11 @@ class Exists(Query):
     def with_user_description(cls):
         return cls(field=TextAttributes.USER_DESCRIPTION.value)
 
-    def to_dict(self):
+    def _to_dict(self):
         return {self.type_name: {"field": self.field}}
 
 
-@dataclass(config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
+@dataclass(frozen=True, eq=False, config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
 class Term(Query):
     field: str
     value: SearchFieldType
@@ -448,7 +507,7 @@ class Term(Query):
     def with_type_name(cls, value: StrictStr):
         return cls(field=TermAttributes.TYPE_NAME.value, value=value)
 
-    def to_dict(self):
+    def _to_dict(self):
         if isinstance(self.value, datetime):
             parameters = {"value": int(self.value.timestamp() * 1000)}
         else:
@@ -460,44 +519,39 @@ class Term(Query):
         return {self.type_name: {self.field: parameters}}
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class Terms(Query):
     field: str
-    values: list[str]
+    values: Sequence[str]
     boost: Optional[float] = None
     type_name: Literal["terms"] = "terms"
 
-    def to_dict(self):
-        terms = {self.field: self.values}
+    def _to_dict(self):
+        terms = {self.field: list(self.values)}
         if self.boost is not None:
             terms["boost"] = self.boost
         return {self.type_name: terms}
 
 
-@dataclass(config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
+@dataclass(frozen=True, eq=False, config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
 class Bool(Query):
-    must: list[Query] = Field(default_factory=list)
-    should: list[Query] = Field(default_factory=list)
-    must_not: list[Query] = Field(default_factory=list)
-    filter: list[Query] = Field(default_factory=list)
+    must: Sequence[Query] = Field(default_factory=tuple)
+    should: Sequence[Query] = Field(default_factory=tuple)
+    must_not: Sequence[Query] = Field(default_factory=tuple)
+    filter: Sequence[Query] = Field(default_factory=tuple)
     type_name: Literal["bool"] = "bool"
     boost: Optional[float] = None
     minimum_should_match: Optional[int] = None
 
     def __add__(self, other):
-        q = self._clone()
         if isinstance(other, Bool):
-            if other.must:
-                q.must += other.must
-            if other.should:
-                q.should += other.should
-            if other.must_not:
-                q.must_not += other.must_not
-            if other.filter:
-                q.filter += other.filter
-        else:
-            q.must.append(other)
-        return q
+            return self._combine(
+                must=self.must + other.must,
+                should=self.should + other.should,
+                must_not=self.must_not + other.must_not,
+                filter=self.filter + other.filter,
+            )
+        return self._combine(must=(*self.must, other))
 
     __radd__ = __add__
 
@@ -507,7 +561,6 @@ class Bool(Query):
                 (q.must, q.must_not, q.filter, getattr(q, "minimum_should_match", None))
             ):
                 other = self if q is other else other
-                q = q._clone()
                 if isinstance(other, Bool) and not any(
                     (
                         other.must,
@@ -516,10 +569,8 @@ class Bool(Query):
                         getattr(other, "minimum_should_match", None),
                     )
                 ):
-                    q.should.extend(other.should)
-                else:
-                    q.should.append(other)
-                return q
+                    return q._evolve(should=q.should + other.should)
+                return q._evolve(should=(*q.should, other))
 
         return Bool(should=[self, other])
 
@@ -532,6 +583,42 @@ class Bool(Query):
         else:
             return self.minimum_should_match
 
+    @property
+    def _liftable(self) -> bool:
+        # Only required (or prohibited) clauses, none of them scoring differently when merged
+        # into a parent's, and at least one required one so the parent's should clauses stay
+        # optional if they were
+        return bool(self.must or self.filter) and not (
+            self.should
+            or self.boost is not None
+            or self.minimum_should_match is not None
+        )
+
+    def _combine(self, **clauses) -> "Bool":
+        """
+        Build a copy of this query with the given clauses replaced, flattening any nested queries
+        whose clauses can be merged into the copy's without changing its results or scores.
+        """
+        must: list[Query] = []
+        filter: list[Query] = []
+        must_not = list(clauses.pop("must_not", self.must_not))
+
+        def lift(query: Query, scoring: bool):
+            if isinstance(query, Bool) and query._liftable:
+                for child in query.must:
+                    lift(child, scoring)
+                for child in query.filter:
+                    lift(child, False)
+                must_not.extend(query.must_not)
+            else:
+                (must if scoring else filter).append(query)
+
+        for query in clauses.pop("must", self.must):
+            lift(query, True)
+        for query in clauses.pop("filter", self.filter):
+            lift(query, False)
+        return self._evolve(must=must, must_not=must_not, filter=filter, **clauses)
+
     def __invert__(self):
         # Because an empty Bool query is treated like
         # MatchAll the inverse should be MatchNone
@@ -541,56 +628,61 @@ class Bool(Query):
         negations = [~q for q in chain(self.must, self.filter)]
         negations.extend(iter(self.must_not))
         if self.should and self._min_should_match:
-            negations.append(Bool(must_not=self.should[:]))
+            negations.append(Bool(must_not=self.should))
 
         return negations[0] if len(negations) == 1 else Bool(should=negations)
 
     def __and__(self, other):
-        q = self._clone()
-        if isinstance(other, Bool):
-            q.must += other.must
-            q.must_not += other.must_not
-            q.filter += other.filter
-            q.should = []
-
-            # reset minimum_should_match as it will get calculated below
-            if q.minimum_should_match:
-                q.minimum_should_match = None
-
-            for qx in (self, other):
-                # TODO: percentages will fail here
-                min_should_match = qx._min_should_match
-                # all subqueries are required
-                if len(qx.should) <= min_should_match:
-                    q.must.extend(qx.should)
-                # not all of them are required, use it and remember min_should_match
-                elif not q.should:
-                    q.minimum_should_match = min_should_match
-                    q.should = qx.should
-                # all queries are optional, just extend should
-                elif q._min_should_match == 0 and min_should_match == 0:
-                    q.should.extend(qx.should)
-                # not all are required, add a should list to the must with proper min_should_match
-                else:
-                    q.must.append(
-                        Bool(should=qx.should, minimum_should_match=min_should_match)
-                    )
-        else:
-            if not q.must and not q.filter and q.should:
-                q.minimum_should_match = 1
-            q.must.append(other)
-        return q
+        if not isinstance(other, Bool):
+            if not self.must and not self.filter and self.should:
+                return self._combine(must=[other], minimum_should_match=1)
+            return self._combine(must=(*self.must, other))
+
+        must = [*self.must, *other.must]
+        filter = [*self.filter, *other.filter]
+        should: list[Query] = []
+        # reset minimum_should_match as it will get calculated below
+        minimum_should_match = (
+            None if self.minimum_should_match else self.minimum_should_match
+        )
+        for qx in (self, other):
+            # TODO: percentages will fail here
+            min_should_match = qx._min_should_match
+            # all subqueries are required
+            if len(qx.should) <= min_should_match:
+                must.extend(qx.should)
+            # not all of them are required, use it and remember min_should_match
+            elif not should:
+                minimum_should_match = min_should_match
+                should = list(qx.should)
+            # all queries are optional, just extend should
+            elif (
+                min_should_match == 0 and not minimum_should_match and (must or filter)
+            ):
+                should.extend(qx.should)
+            # not all are required, add a should list to the must with proper min_should_match
+            else:
+                must.append(
+                    Bool(should=qx.should, minimum_should_match=min_should_match)
+                )
+        return self._combine(
+            must=must,
+            should=should,
+            must_not=self.must_not + other.must_not,
+            filter=filter,
+            minimum_should_match=minimum_should_match,
+        )
 
     __rand__ = __and__
 
-    def to_dict(self) -> dict[Any, Any]:
+    def _to_dict(self) -> dict[Any, Any]:
         clauses = {}
 
         def add_clause(name):
             if hasattr(self, name):
                 clause = self.__getattribute__(name)
-                if clause and isinstance(clause, list) and len(clause) > 0:
-                    clauses[name] = [c.to_dict() for c in clause]
+                if clause and isinstance(clause, tuple) and len(clause) > 0:
+                    clauses[name] = [c._compiled() for c in clause]
 
         for name in ["must", "should", "must_not", "filter"]:
             add_clause(name)
@@ -601,7 +693,7 @@ class Bool(Query):
         return {"bool": clauses}
 
 
-@dataclass(config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
+@dataclass(frozen=True, eq=False, config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
 class Prefix(Query):
     field: str
     value: SearchFieldType
@@ -680,7 +772,7 @@ class Prefix(Query):
     def with_type_name(cls, value: StrictStr):
         return cls(field=TermAttributes.TYPE_NAME.value, value=value)
 
-    def to_dict(self) -> dict[Any, Any]:
+    def _to_dict(self) -> dict[Any, Any]:
         parameters: dict[str, Any] = {
             "value": int(self.value.timestamp() * 1000)
             if isinstance(self.value, datetime)
@@ -694,7 +786,7 @@ class Prefix(Query):
         return {self.type_name: {self.field: parameters}}
 
 
-@dataclass(config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
+@dataclass(frozen=True, eq=False, config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
 class Range(Query):
     field: str
     gt: Optional[SearchFieldType] = None
@@ -832,7 +924,7 @@ class Range(Query):
             time_zone=time_zone,
         )
 
-    def to_dict(self) -> dict[Any, Any]:
+    def _to_dict(self) -> dict[Any, Any]:
         def get_value(attribute_name):
             if hasattr(self, attribute_name):
                 attribute_value = getattr(self, attribute_name)
@@ -859,7 +951,7 @@ class Range(Query):
         return {self.type_name: {self.field: parameters}}
 
 
-@dataclass(config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
+@dataclass(frozen=True, eq=False, config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
 class Wildcard(Query):
     field: str
     value: StrictStr
@@ -938,7 +1030,7 @@ class Wildcard(Query):
     def with_type_name(cls, value: StrictStr):
         return cls(field=TermAttributes.TYPE_NAME.value, value=value)
 
-    def to_dict(self):
+    def _to_dict(self):
         if isinstance(self.value, datetime):
             parameters = {"value": int(self.value.timestamp() * 1000)}
         else:
@@ -950,7 +1042,7 @@ class Wildcard(Query):
         return {self.type_name: {self.field: parameters}}
 
 
-@dataclass(config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
+@dataclass(frozen=True, eq=False, config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
 class Regexp(Query):
     field: str
     value: StrictStr
@@ -1030,7 +1122,7 @@ class Regexp(Query):
     def with_type_name(cls, value: StrictStr):
         return cls(field=TermAttributes.TYPE_NAME.value, value=value)
 
-    def to_dict(self):
+    def _to_dict(self):
         if isinstance(self.value, datetime):
             parameters = {"value": int(self.value.timestamp() * 1000)}
         else:
@@ -1044,7 +1136,7 @@ class Regexp(Query):
         return {self.type_name: {self.field: parameters}}
 
 
-@dataclass(config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
+@dataclass(frozen=True, eq=False, config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
 class Fuzzy(Query):
     field: str
     value: StrictStr
@@ -1349,7 +1441,7 @@ class Fuzzy(Query):
             rewrite=rewrite,
         )
 
-    def to_dict(self):
+    def _to_dict(self):
         parameters = {"value": self.value}
         if self.fuzziness is not None:
             parameters["fuzziness"] = self.fuzziness
@@ -1364,7 +1456,7 @@ class Fuzzy(Query):
         return {self.type_name: {self.field: parameters}}
 
 
-@dataclass(config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
+@dataclass(frozen=True, eq=False, config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
 class Match(Query):
     field: str
     query: StrictStr
@@ -1711,7 +1803,7 @@ class Match(Query):
             prefix_length=prefix_length,
         )
 
-    def to_dict(self):
+    def _to_dict(self):
         parameters = {"query": self.query}
         if self.analyzer is not None:
             parameters["analyzer"] = self.analyzer
@@ -1755,16 +1847,208 @@ class SortItem:
         return v
 
 
+@dataclass
+class Aggregation(ABC):
+    """
+    Aggregation of the results of a search, as described in
+    https://www.elastic.co/guide/en/elasticsearch/reference/current/search-aggregations.html
+    """
+
+    @property
+    @abstractmethod
+    def type_name(self) -> str:
+        ...
+
+    @abstractmethod
+    def parameters(self) -> dict[Any, Any]:
+        ...
+
+    def to_dict(self) -> dict[Any, Any]:
+        aggregation: dict[Any, Any] = {self.type_name: self.parameters()}
+        if sub_aggregations := getattr(self, "aggregations", None):
+            aggregation["aggs"] = {
+                name: sub_aggregation.to_dict()
+                for name, sub_aggregation in sub_aggregations.items()
+            }
+        return aggregation
+
+
+@dataclass(config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
+class TermsAggregation(Aggregation):
+    field: StrictStr
+    size: Optional[int] = None
+    min_doc_count: Optional[int] = None
+    missing: Optional[SearchFieldType] = None
+    aggregations: dict[str, Aggregation] = Field(default_factory=dict)
+    type_name: Literal["terms"] = "terms"
+
+    def parameters(self) -> dict[Any, Any]:
+        parameters: dict[Any, Any] = {"field": self.field}
+        if self.size is not None:
+            parameters["size"] = self.size
+        if self.min_doc_count is not None:
+            parameters["min_doc_count"] = self.min_doc_count
+        if self.missing is not None:
+            parameters["missing"] = self.missing
+        return parameters
+
+    @classmethod
+    @validate_arguments()
+    def with_type_name(cls, size: Optional[int] = None):
+        return cls(field=TermAttributes.TYPE_NAME.value, size=size)
+
+    @classmethod
+    @validate_arguments()
+    def with_connector_name(cls, size: Optional[int] = None):
+        return cls(field=TermAttributes.CONNECTOR_NAME.value, size=size)
+
+    @classmethod
+    @validate_arguments()
+    def with_certificate_status(cls, size: Optional[int] = None):
+        return cls(field="certificateStatus", size=size)
+
+
+@dataclass(config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
+class CardinalityAggregation(Aggregation):
+    field: StrictStr
+    precision_threshold: Optional[int] = None
+    type_name: Literal["cardinality"] = "cardinality"
+
+    def parameters(self) -> dict[Any, Any]:
+        parameters: dict[Any, Any] = {"field": self.field}
+        if self.precision_threshold is not None:
+            parameters["precision_threshold"] = self.precision_threshold
+        return parameters
+
+
+@dataclass(config=ConfigDict(smart_union=True, extra="forbid"))  # type: ignore
+class DateHistogramAggregation(Aggregation):
+    field: StrictStr
+    calendar_interval: Optional[StrictStr] = None
+    fixed_interval: Optional[StrictStr] = None
+    format: Optional[StrictStr] = None
+    time_zone: Optional[StrictStr] = None
+    min_doc_count: Optional[int] = None
+    aggregations: dict[str, Aggregation] = Field(default_factory=dict)
+    type_name: Literal["date_histogram"] = "date_histogram"
+
+    @validator("fixed_interval", always=True)
+    def validate_interval(cls, v, values):
+        if bool(v) == bool(values.get("calendar_interval")):
+            raise ValueError(
+                "Exactly one of calendar_interval or fixed_interval is required"
+            )
+        return v
+
+    def parameters(self) -> dict[Any, Any]:
+        parameters: dict[Any, Any] = {"field": self.field}
+        if self.calendar_interval is not None:
+            parameters["calendar_interval"] = self.calendar_interval
+        if self.fixed_interval is not None:
+            parameters["fixed_interval"] = self.fixed_interval
+        if self.format is not None:
+            parameters["format"] = self.format
+        if self.time_zone is not None:
+            parameters["time_zone"] = self.time_zone
+        if self.min_doc_count is not None:
+            parameters["min_doc_count"] = self.min_doc_count
+        return parameters
+
+    @classmethod
+    @validate_arguments()
+    def with_update_time(cls, calendar_interval: StrictStr = "day"):
+        return cls(
+            field=TermAttributes.UPDATE_TIME_AS_TIMESTAMP.value,
+            calendar_interval=calendar_interval,
+        )
+
+    @classmethod
+    @validate_arguments()
+    def with_create_time(cls, calendar_interval: StrictStr = "day"):
+        return cls(
+            field=TermAttributes.CREATE_TIME_AS_TIMESTAMP.value,
+            calendar_interval=calendar_interval,
+        )
+
+
+@dataclass(frozen=True)
+class AggregationBucket:
+    key: Any
+    doc_count: int
+    key_as_string: Optional[str] = None
+    aggregations: dict[str, Any] = Field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class AggregationBucketResult:
+    buckets: list[AggregationBucket]
+    doc_count_error_upper_bound: int = 0
+    sum_other_doc_count: int = 0
+
+    def counts(self) -> dict[Any, int]:
+        """
+        Map the key of each bucket to the number of results in it.
+        """
+        return {bucket.key: bucket.doc_count for bucket in self.buckets}
+
+
+@dataclass(frozen=True)
+class AggregationMetricResult:
+    value: Optional[float]
+
+
+AggregationResult = Union[AggregationBucketResult, AggregationMetricResult]
+
+
+def _is_aggregation_result(value: Any) -> bool:
+    return isinstance(value, dict) and ("buckets" in value or "value" in value)
+
+
+def parse_aggregations(raw: Optional[dict[str, Any]]) -> dict[str, AggregationResult]:
+    """
+    Parse the (raw) aggregations from a search response, including any sub-aggregations.
+    """
+    results: dict[str, AggregationResult] = {}
+    for name, value in (raw or {}).items():
+        if not _is_aggregation_result(value):
+            continue
+        if "buckets" in value:
+            results[name] = AggregationBucketResult(
+                buckets=[
+                    AggregationBucket(
+                        key=bucket.get("key"),
+                        doc_count=bucket.get("doc_count", 0),
+                        key_as_string=bucket.get("key_as_string"),
+                        aggregations=parse_aggregations(bucket),
+                    )
+                    for bucket in value["buckets"]
+                ],
+                doc_count_error_upper_bound=value.get("doc_count_error_upper_bound", 0),
+                sum_other_doc_count=value.get("sum_other_doc_count", 0),
+            )
+        else:
+            results[name] = AggregationMetricResult(value=value["value"])
+    return results
+
+
 class DSL(AtlanObject):
     from_: int = Field(0, alias="from")
     size: int = 100
-    track_total_hits: bool = Field(True, alias="track_total_hits")
+    track_total_hits: Union[StrictBool, StrictInt] = Field(
+        True, alias="track_total_hits"
+    )
     post_filter: Optional[Query] = Field(alias="post_filter")
     query: Optional[Query]
     sort: Optional[list[SortItem]] = Field(alias="sort")
+    search_after: Optional[list[Any]] = Field(alias="search_after")
+    aggregations: Optional[dict[str, Aggregation]] = Field(alias="aggregations")
 
     class Config:
-        json_encoders = {Query: lambda v: v.to_dict(), SortItem: lambda v: v.to_dict()}
+        json_encoders = {
+            Query: lambda v: v._compiled(),
+            SortItem: lambda v: v.to_dict(),
+            Aggregation: lambda v: v.to_dict(),
+        }
 
     def __init__(__pydantic_self__, **data: Any) -> None:
         super().__init__(**data)
@@ -1785,7 +2069,11 @@ class IndexSearchRequest(SearchRequest):
     )
 
     class Config:
-        json_encoders = {Query: lambda v: v.to_dict(), SortItem: lambda v: v.to_dict()}
+        json_encoders = {
+            Query: lambda v: v._compiled(),
+            SortItem: lambda v: v.to_dict(),
+            Aggregation: lambda v: v.to_dict(),
+        }
 
 
 def with_active_glossary(name: StrictStr) -> "Bool":
@@ -6,7 +6,7 @@ import logging
 import re
 import time
 from functools import reduce
-from typing import Any, Optional
+from typing import Any, Generator, Optional, Sequence
 
 ADMIN_URI = "api/service/"
 BASE_URI = "api/meta/"
@@ -69,6 +69,15 @@ def attributes_to_params(
     return query_params
 
 
+def chunks(values: Sequence[Any], size: int) -> Generator[Sequence[Any], None, None]:
+    """Split the given values into consecutive chunks of (at most) the given size."""
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    for start in range(0, len(values), size):
+        end = start + size
+        yield values[start:end]
+
+
 def non_null(obj: Optional[object], def_value: object):
     return obj if obj is not None else def_value
 
@@ -128,12 +137,17 @@ class API:
         expected_status,
         consumes=APPLICATION_JSON,
         produces=APPLICATION_JSON,
+        compressible=False,
+        endpoint=None,
     ):
         self.path = path
         self.method = method
         self.expected_status = expected_status
         self.consumes = consumes
         self.produces = produces
+        self.compressible = compressible
+        # Identifies the API independently of any values formatted into its path
+        self.endpoint = endpoint or f"{method.value} {path}"
 
     @staticmethod
     def multipart_urljoin(base_path, *path_elems):
@@ -160,6 +174,8 @@ class API:
             self.expected_status,
             self.consumes,
             self.produces,
+            self.compressible,
+            self.endpoint,
         )
 
     def format_path_with_params(self, *params):
@@ -170,6 +186,8 @@ class API:
             self.expected_status,
             self.consumes,
             self.produces,
+            self.compressible,
+            self.endpoint,
         )
 
 
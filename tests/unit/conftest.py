@@ -1,6 +1,10 @@
+import json
 from unittest.mock import patch
 
 import pytest
+import requests
+
+from pyatlan.client.transport import Transport, _build_response
 
 
 @pytest.fixture()
@@ -25,3 +29,38 @@ def mock_group_cache():
 def mock_custom_metadata_cache():
     with patch("pyatlan.cache.custom_metadata_cache.CustomMetadataCache") as cache:
         yield cache
+
+
+def json_response(url, body, status_code=200) -> requests.Response:
+    return _build_response(
+        url,
+        status_code,
+        {"content-type": "application/json"},
+        json.dumps(body).encode(),
+    )
+
+
+class SearchIndex(Transport):
+    """
+    Answers index searches (by offset or after a GUID) with a page of the GUIDs that match(dsl)
+    returns for each, as assets built by entity(guid).
+    """
+
+    def match(self, dsl):
+        raise NotImplementedError
+
+    def entity(self, guid):
+        return {"typeName": "Table", "guid": guid, "attributes": {}}
+
+    def request(self, method, url, **kwargs):
+        dsl = json.loads(kwargs["data"])["dsl"]
+        guids = self.match(dsl)
+        start = dsl.get("from", 0)
+        if dsl.get("search_after"):
+            start += guids.index(dsl["search_after"][0]) + 1
+        end = start + dsl["size"]
+        body = {
+            "approximateCount": len(guids),
+            "entities": [self.entity(guid) for guid in guids[start:end]],
+        }
+        return json_response(url, body)
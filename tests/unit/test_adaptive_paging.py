@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import pytest
+from pydantic import ValidationError
+
+from pyatlan.client.adaptive_paging import AdaptivePageSize
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.model.search import DSL, IndexSearchRequest, Term
+from tests.unit.conftest import SearchIndex
+
+# Each result is serialized to roughly this many bytes
+RESULT_BYTES = 1000
+
+
+@pytest.mark.parametrize(
+    "size, results, response_bytes, latency, expected",
+    [
+        # Too many bytes per page: shrink to the target
+        (100, 100, 400_000, 0.1, 25),
+        # Too few bytes per page: grow, but at most doubling
+        (100, 100, 10_000, 0.1, 200),
+        # Too slow: shrink to the target latency
+        (100, 100, 50_000, 4.0, 50),
+        # Bounded by the minimum and maximum sizes
+        (100, 100, 100_000_000, 0.1, 10),
+        (800, 800, 8_000, 0.1, 1000),
+        # A partial (last) page still measures the size of each result
+        (100, 10, 40_000, 0.1, 25),
+        # An empty page says nothing about the size of results
+        (100, 0, 50, 0.1, 100),
+    ],
+)
+def test_next_size(size, results, response_bytes, latency, expected):
+    adaptive = AdaptivePageSize(
+        target_bytes=100_000, target_latency=2.0, min_size=10, max_size=1000
+    )
+    assert adaptive.next_size(size, results, response_bytes, latency) == expected
+
+
+def test_next_size_without_target_latency():
+    adaptive = AdaptivePageSize(target_bytes=100_000, target_latency=None)
+    assert adaptive.next_size(100, 100, 100_000, 60.0) == 100
+
+
+def test_max_size_must_be_at_least_min_size():
+    with pytest.raises(ValidationError, match="max_size must be at least min_size"):
+        AdaptivePageSize(min_size=100, max_size=10)
+
+
+class SearchTransport(SearchIndex):
+    """
+    Answers searches (by offset) over a fixed number of results of roughly equal size.
+    """
+
+    def __init__(self, total):
+        self.guids = [str(i) for i in range(total)]
+        self.sizes = []
+
+    def match(self, dsl):
+        self.sizes.append(dsl["size"])
+        return self.guids
+
+    def entity(self, guid):
+        return {
+            "typeName": "Table",
+            "guid": guid,
+            "attributes": {"description": "x" * (RESULT_BYTES - 80)},
+        }
+
+
+@pytest.fixture()
+def client():
+    return AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+
+
+def _search(client, total, adaptive_page_size):
+    transport = SearchTransport(total)
+    client.set_transport(transport)
+    criteria = IndexSearchRequest(dsl=DSL(query=Term.with_type_name("Table"), size=5))
+    results = client.search(criteria, lazy=True, adaptive_page_size=adaptive_page_size)
+    return [asset.guid for asset in results], transport.sizes
+
+
+def test_search_adapts_page_size(client):
+    guids, sizes = _search(
+        client,
+        total=200,
+        adaptive_page_size=AdaptivePageSize(
+            target_bytes=40 * RESULT_BYTES, target_latency=None
+        ),
+    )
+    assert guids == [str(i) for i in range(200)]
+    # Doubling from the initial size until pages reach the target of ~40 results
+    assert sizes[:8] == [5, 10, 20, 40, 40, 40, 40, 40]
+
+
+def test_search_keeps_page_size_by_default(client):
+    guids, sizes = _search(client, total=20, adaptive_page_size=None)
+    assert guids == [str(i) for i in range(20)]
+    assert sizes == [5, 5, 5, 5, 5]
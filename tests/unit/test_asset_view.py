@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+from unittest.mock import patch
+
+import pytest
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.model.asset_view import AssetView
+from pyatlan.model.assets import Table
+from pyatlan.model.search import DSL, IndexSearchRequest, Term
+
+ENTITY = {
+    "typeName": "Table",
+    "guid": "123",
+    "status": "ACTIVE",
+    "attributes": {
+        "name": "orders",
+        "qualifiedName": "default/snowflake/123/db/schema/orders",
+        "columnCount": 4,
+    },
+}
+
+
+@pytest.fixture()
+def view():
+    return AssetView(ENTITY)
+
+
+def test_view_exposes_raw_properties_and_attributes(view):
+    assert view.type_name == "Table"
+    assert view.guid == "123"
+    assert view.status == "ACTIVE"
+    assert view.name == "orders"
+    assert view.qualified_name == "default/snowflake/123/db/schema/orders"
+    assert view.column_count == 4
+    assert view.row_count is None
+    assert view.get("columnCount") == 4
+    assert view.get("rowCount", 0) == 0
+    assert "Table" in repr(view)
+
+
+def test_view_rejects_unknown_attributes(view):
+    with pytest.raises(AttributeError, match="no attribute 'colum_count'"):
+        view.colum_count
+    # Attributes of other asset types are not attributes of a table
+    with pytest.raises(AttributeError):
+        view.dbt_alias
+    assert not hasattr(view, "nonexistent")
+
+
+def test_view_of_unknown_type_exposes_asset_attributes():
+    view = AssetView({"typeName": "Unknown", "attributes": {"name": "x"}})
+    assert view.name == "x"
+    assert view.description is None
+    with pytest.raises(AttributeError):
+        view.column_count
+
+
+def test_view_is_read_only(view):
+    with pytest.raises(AttributeError, match="AssetView is read-only"):
+        view.name = "other"
+    with pytest.raises(TypeError):
+        view.raw["guid"] = "456"
+
+
+def test_to_asset_builds_asset_of_the_right_type(view):
+    asset = view.to_asset()
+    assert isinstance(asset, Table)
+    assert asset.guid == "123"
+    assert asset.name == "orders"
+    assert asset.column_count == 4
+    # The asset does not share any state with the view
+    asset.attributes.name = "other"
+    assert view.name == "orders"
+
+
+def test_lazy_search_returns_views():
+    client = AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+    criteria = IndexSearchRequest(dsl=DSL(query=Term.with_type_name("Table"), size=1))
+    pages = [
+        {"approximateCount": 2, "entities": [ENTITY]},
+        {"approximateCount": 2, "entities": [dict(ENTITY, guid="456")]},
+        {"approximateCount": 2},
+    ]
+    with patch.object(AtlanClient, "_call_api", side_effect=pages):
+        views = list(client.search(criteria, lazy=True))
+    assert all(isinstance(view, AssetView) for view in views)
+    assert [view.guid for view in views] == ["123", "456"]
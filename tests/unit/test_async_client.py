@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pyatlan.client.async_atlan import DEFAULT_MAX_CONCURRENCY, AsyncAtlanClient
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.model.assets import Table
+
+
+@pytest.fixture()
+def client():
+    return AtlanClient(
+        base_url="https://name.atlan.com",
+        api_key="abkj",
+        connection_pool_maxsize=DEFAULT_MAX_CONCURRENCY,
+    )
+
+
+def test_max_concurrency_must_be_positive(client):
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        AsyncAtlanClient(client=client, max_concurrency=0)
+
+
+def test_get_asset_by_guid_delegates_to_client(client):
+    table = Table()
+
+    async def run():
+        async with AsyncAtlanClient(client=client) as async_client:
+            return await async_client.get_asset_by_guid("123", Table)
+
+    with patch.object(AtlanClient, "get_asset_by_guid", return_value=table) as mock:
+        assert asyncio.run(run()) is table
+    mock.assert_called_once_with(
+        guid="123", asset_type=Table, min_ext_info=False, ignore_relationships=False
+    )
+
+
+def test_search_results_iterate_asynchronously_over_pages(client):
+    first, second = Table(), Table()
+    results = Mock()
+    pages = [[first], [second]]
+    results.current_page.side_effect = lambda: pages[0]
+
+    def next_page(start=None, size=None):
+        pages.pop(0)
+        return len(pages) > 0
+
+    results.next_page.side_effect = next_page
+    results.count = 2
+
+    async def run():
+        async with AsyncAtlanClient(client=client) as async_client:
+            search_results = await async_client.search(Mock())
+            assert search_results.count == 2
+            return [asset async for asset in search_results]
+
+    with patch.object(AtlanClient, "search", return_value=results):
+        assert asyncio.run(run()) == [first, second]
+
+
+def test_concurrency_is_bounded(client):
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def get_asset_by_guid(**kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return Table()
+
+    async def run():
+        async with AsyncAtlanClient(client=client, max_concurrency=3) as async_client:
+            return await asyncio.gather(
+                *(async_client.get_asset_by_guid(str(i), Table) for i in range(12))
+            )
+
+    with patch.object(AtlanClient, "get_asset_by_guid", side_effect=get_asset_by_guid):
+        assert len(asyncio.run(run())) == 12
+    assert 1 < peak <= 3
+
+
+@pytest.mark.parametrize(
+    "max_concurrency, maxsize",
+    [(DEFAULT_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY), (2, 10)],
+)
+def test_built_client_has_a_connection_for_every_worker(max_concurrency, maxsize):
+    async_client = AsyncAtlanClient(
+        base_url="https://name.atlan.com",
+        api_key="abkj",
+        max_concurrency=max_concurrency,
+    )
+    assert async_client.client.connection_pool_maxsize == maxsize
+    async_client.close()
+
+
+def test_client_with_too_few_connections_is_warned_about(caplog):
+    client = AtlanClient(
+        base_url="https://name.atlan.com", api_key="abkj", connection_pool_maxsize=5
+    )
+    AsyncAtlanClient(client=client, max_concurrency=8).close()
+    assert "holds 5 connections, fewer than the 8 worker threads" in caplog.text
+
+
+def test_exiting_closes_without_blocking_the_event_loop(client):
+    closed_by = []
+
+    async def run():
+        async_client = AsyncAtlanClient(client=client)
+        with patch.object(
+            async_client,
+            "close",
+            side_effect=lambda: closed_by.append(threading.current_thread()),
+        ):
+            async with async_client:
+                pass
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(run())
+    assert len(closed_by) == 1
+    assert closed_by[0] is not loop_thread
@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import time
+
+import pytest
+
+from pyatlan.client.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakers,
+    CircuitState,
+    EndpointFamily,
+    endpoint_family,
+)
+from pyatlan.client.constants import (
+    BULK_UPDATE,
+    GET_ALL_TYPE_DEFS,
+    GET_ENTITY_BY_GUID,
+    GET_USERS,
+    INDEX_SEARCH,
+)
+
+
+@pytest.mark.parametrize(
+    "api, family",
+    [
+        (INDEX_SEARCH, EndpointFamily.SEARCH),
+        (BULK_UPDATE, EndpointFamily.BULK),
+        (GET_ALL_TYPE_DEFS.format_path_with_params(), EndpointFamily.TYPEDEFS),
+        (GET_USERS, EndpointFamily.ADMIN),
+        (GET_ENTITY_BY_GUID.format_path_with_params("123"), EndpointFamily.ENTITY),
+    ],
+)
+def test_endpoint_family(api, family):
+    assert endpoint_family(api) == family
+
+
+@pytest.mark.parametrize(
+    "failure_threshold, minimum_calls, message",
+    [
+        (0, 1, "failure_threshold must be greater than 0 and at most 1"),
+        (1.5, 1, "failure_threshold must be greater than 0 and at most 1"),
+        (0.5, 0, "minimum_calls must be at least 1"),
+    ],
+)
+def test_circuit_breaker_with_invalid_parameters_raises_value_error(
+    failure_threshold, minimum_calls, message
+):
+    with pytest.raises(ValueError, match=message):
+        CircuitBreaker(failure_threshold=failure_threshold, minimum_calls=minimum_calls)
+
+
+def test_circuit_opens_once_failure_rate_reaches_threshold():
+    breaker = CircuitBreaker(failure_threshold=0.5, minimum_calls=4)
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow_request()
+
+
+def test_circuit_allows_single_trial_after_reset_timeout():
+    breaker = CircuitBreaker(minimum_calls=1, reset_timeout=0.05)
+    breaker.record_failure()
+    assert not breaker.allow_request()
+    time.sleep(0.06)
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow_request()
+
+
+def test_failed_trial_reopens_circuit():
+    breaker = CircuitBreaker(minimum_calls=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow_request()
+
+
+def test_released_trial_allows_another():
+    breaker = CircuitBreaker(minimum_calls=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.release()
+    assert breaker.allow_request()
+
+
+def test_circuit_breakers_are_independent_per_family():
+    breakers = CircuitBreakers(minimum_calls=1)
+    breakers.for_api(INDEX_SEARCH).record_failure()
+    assert breakers[EndpointFamily.SEARCH].state == CircuitState.OPEN
+    assert breakers.for_api(BULK_UPDATE).state == CircuitState.CLOSED
@@ -1,19 +1,31 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2022 Atlan Pte. Ltd.
+import json
 import os
+import time
 from unittest.mock import DEFAULT, Mock, patch
 
 import pytest
-
-from pyatlan.client.atlan import AtlanClient
-from pyatlan.error import NotFoundError
+import requests
+
+from pyatlan.client.atlan import (
+    AtlanClient,
+    SearchCheckpoint,
+    get_search_after,
+    partition_by_guid,
+    with_tiebreaker,
+)
+from pyatlan.client.constants import BULK_UPDATE, GET_USERS, INDEX_SEARCH
+from pyatlan.error import DeadlineExceededError, NotFoundError, ServiceUnavailableError
+from pyatlan.exceptions import AtlanServiceException
 from pyatlan.model.assets import (
     AtlasGlossary,
     AtlasGlossaryCategory,
     AtlasGlossaryTerm,
     Table,
 )
-from pyatlan.model.search import Bool, Term
+from pyatlan.model.enums import SortOrder
+from pyatlan.model.search import DSL, Bool, IndexSearchRequest, SortItem, Term
 from tests.unit.model.constants import (
     GLOSSARY_CATEGORY_NAME,
     GLOSSARY_NAME,
@@ -982,3 +994,610 @@ def test_find_term_by_name():
             attributes=attributes,
         )
         assert mock_find_term_fast_by_name.return_value == term
+
+
+def test_connection_pool_defaults_apply_to_both_schemes():
+    client = AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+    https_adapter = client._session.get_adapter("https://name.atlan.com")
+    http_adapter = client._session.get_adapter("http://localhost:8080")
+    assert https_adapter is http_adapter
+    assert https_adapter.max_retries.total == 10
+    assert https_adapter._pool_connections == 10
+    assert https_adapter._pool_maxsize == 10
+    assert https_adapter._pool_block is False
+
+
+@patch.dict(
+    os.environ,
+    {
+        "ATLAN_BASE_URL": "https://dummy.atlan.com",
+        "ATLAN_API_KEY": "123",
+        "ATLAN_CONNECTION_POOL_MAXSIZE": "32",
+    },
+)
+def test_connection_pool_is_configurable():
+    client = AtlanClient(connection_pool_size=4, connection_pool_block=True)
+    adapter = client._session.get_adapter("https://dummy.atlan.com")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+
+
+def test_connection_pool_size_must_be_positive():
+    with pytest.raises(ValueError, match="connection_pool_maxsize"):
+        AtlanClient(
+            base_url="https://name.atlan.com", api_key="abkj", connection_pool_maxsize=0
+        )
+
+
+def test_get_connection_pool_stats():
+    client = AtlanClient(
+        base_url="https://name.atlan.com", api_key="abkj", connection_pool_maxsize=16
+    )
+    assert client.get_connection_pool_stats() == []
+    adapter = client._session.get_adapter("https://name.atlan.com")
+    adapter.poolmanager.connection_from_url("https://name.atlan.com")
+
+    (stats,) = client.get_connection_pool_stats()
+    assert stats.host == "https://name.atlan.com:443"
+    assert stats.maxsize == 16
+    assert stats.num_connections == 0
+    assert stats.num_requests == 0
+    assert stats.available_connections == 16
+
+
+@pytest.fixture()
+def client():
+    return AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+
+
+def _response(status_code: int, body: str = "{}"):
+    response = Mock()
+    response.status_code = status_code
+    response.content = body.encode()
+    response.text = body
+    response.json.return_value = json.loads(body)
+    return response
+
+
+def test_requests_are_sent_with_timeouts(client):
+    with patch.object(client._session, "request", return_value=_response(200)) as req:
+        client._call_api(GET_USERS)
+    assert req.call_args.kwargs["timeout"] == (30.0, 900.0)
+
+
+def test_deadline_bounds_request_timeouts(client):
+    with patch.object(client._session, "request", return_value=_response(200)) as req:
+        with client.deadline(5):
+            client._call_api(GET_USERS)
+    timeout = req.call_args.kwargs["timeout"].clone()
+    assert 4 < timeout.connect_timeout <= 5
+    assert 4 < timeout.read_timeout <= 5
+
+
+def test_rate_limit_past_deadline_raises_deadline_exceeded():
+    client = AtlanClient(
+        base_url="https://name.atlan.com", api_key="abkj", rate_limit_per_second=1
+    )
+    client._rate_limiter.pause(2)
+    start = time.monotonic()
+    with patch.object(client._session, "request") as req:
+        with client.deadline(0.1):
+            with pytest.raises(DeadlineExceededError, match="waiting to call"):
+                client._call_api(GET_USERS)
+    assert time.monotonic() - start < 1
+    req.assert_not_called()
+
+
+def test_expired_deadline_raises_without_calling_api(client):
+    with patch.object(client._session, "request") as req:
+        with client.deadline(0.01):
+            time.sleep(0.02)
+            with pytest.raises(DeadlineExceededError):
+                client._call_api(GET_USERS)
+    req.assert_not_called()
+
+
+def test_timeout_past_deadline_raises_deadline_exceeded(client):
+    def timeout(*args, **kwargs):
+        time.sleep(0.02)
+        raise requests.exceptions.ReadTimeout()
+
+    with patch.object(client._session, "request", side_effect=timeout):
+        with client.deadline(0.01):
+            with pytest.raises(DeadlineExceededError):
+                client._call_api(GET_USERS)
+
+
+def test_search_results_keep_deadline_for_further_pages(client):
+    with client.deadline(0.01):
+        results = AtlanClient.IndexSearchResults(
+            client=client,
+            criteria=IndexSearchRequest(dsl=DSL(query=Term.with_guid("123"))),
+            start=0,
+            size=1,
+            count=2,
+            assets=[Table()],
+        )
+    time.sleep(0.02)
+    with patch.object(client._session, "request") as req:
+        with pytest.raises(DeadlineExceededError):
+            results.next_page()
+    req.assert_not_called()
+
+
+def test_open_circuit_rejects_requests(monkeypatch):
+    monkeypatch.setenv("ATLAN_CIRCUIT_BREAKER_MINIMUM_CALLS", "2")
+    client = AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+    with patch.object(client._session, "request", return_value=_response(500)) as req:
+        for _ in range(2):
+            with pytest.raises(AtlanServiceException):
+                client._call_api(INDEX_SEARCH)
+        with pytest.raises(ServiceUnavailableError):
+            client._call_api(INDEX_SEARCH)
+        assert req.call_count == 2
+        with pytest.raises(AtlanServiceException):
+            client._call_api(BULK_UPDATE)
+        assert req.call_count == 3
+
+
+def test_connection_errors_count_towards_circuit(monkeypatch):
+    monkeypatch.setenv("ATLAN_CIRCUIT_BREAKER_MINIMUM_CALLS", "1")
+    client = AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+    with patch.object(
+        client._session,
+        "request",
+        side_effect=requests.exceptions.ConnectionError(),
+    ):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client._call_api(GET_USERS)
+        with pytest.raises(ServiceUnavailableError):
+            client._call_api(GET_USERS)
+
+
+def test_expired_deadline_does_not_hold_circuit_trial(monkeypatch):
+    monkeypatch.setenv("ATLAN_CIRCUIT_BREAKER_MINIMUM_CALLS", "1")
+    monkeypatch.setenv("ATLAN_CIRCUIT_BREAKER_RESET_TIMEOUT", "0.05")
+    client = AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+    with patch.object(
+        client._session,
+        "request",
+        side_effect=requests.exceptions.ConnectionError(),
+    ):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client._call_api(GET_USERS)
+    time.sleep(0.06)
+    with client.deadline(0.01):
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceededError):
+            client._call_api(GET_USERS)
+    with patch.object(client._session, "request", return_value=_response(200)):
+        client._call_api(GET_USERS)
+        client._call_api(GET_USERS)
+
+
+def test_unexpected_error_releases_circuit_trial(monkeypatch):
+    monkeypatch.setenv("ATLAN_CIRCUIT_BREAKER_MINIMUM_CALLS", "1")
+    monkeypatch.setenv("ATLAN_CIRCUIT_BREAKER_RESET_TIMEOUT", "0.05")
+    client = AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+    with patch.object(
+        client._session,
+        "request",
+        side_effect=requests.exceptions.ConnectionError(),
+    ):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client._call_api(GET_USERS)
+    time.sleep(0.06)
+    with patch.object(client._session, "request", side_effect=ValueError("bad")):
+        with pytest.raises(ValueError):
+            client._call_api(GET_USERS)
+    with patch.object(client._session, "request", return_value=_response(200)):
+        client._call_api(GET_USERS)
+
+
+def test_service_unavailable_raises_and_counts_towards_circuit(monkeypatch):
+    monkeypatch.setenv("ATLAN_CIRCUIT_BREAKER_MINIMUM_CALLS", "1")
+    client = AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+    with patch.object(client._session, "request", return_value=_response(503)):
+        with pytest.raises(ServiceUnavailableError) as err:
+            client._call_api(GET_USERS)
+        assert err.value.code == "ATLAN-PYTHON-503-001"
+        with pytest.raises(ServiceUnavailableError) as err:
+            client._call_api(GET_USERS)
+        assert err.value.code == "ATLAN-PYTHON-503-000"
+
+
+def _paged_search_results(client, total_pages, size=2, delay=0.0):
+    def call_api(api, query_params=None, request_obj=None, exclude_unset=True):
+        time.sleep(delay)
+        start = request_obj.dsl.from_
+        if start >= total_pages * size:
+            return {"approximateCount": total_pages * size}
+        return {
+            "approximateCount": total_pages * size,
+            "entities": [
+                {"typeName": "Table", "guid": str(i), "attributes": {"name": str(i)}}
+                for i in range(start, start + size)
+            ],
+        }
+
+    criteria = IndexSearchRequest(dsl=DSL(query=Term.with_guid("123"), size=size))
+    results = AtlanClient.IndexSearchResults(
+        client=client,
+        criteria=criteria,
+        start=0,
+        size=size,
+        count=total_pages * size,
+        assets=[Table(guid=str(i)) for i in range(size)],
+    )
+    return results, call_api
+
+
+def test_prefetch_returns_all_results_in_order(client):
+    results, call_api = _paged_search_results(client, total_pages=5)
+    with patch.object(AtlanClient, "_call_api", side_effect=call_api):
+        assert [asset.guid for asset in results.prefetch(pages=2)] == [
+            str(i) for i in range(10)
+        ]
+
+
+def test_prefetch_overlaps_fetching_with_consuming(client):
+    results, call_api = _paged_search_results(client, total_pages=4, delay=0.05)
+    start = time.monotonic()
+    with patch.object(AtlanClient, "_call_api", side_effect=call_api):
+        for asset in results.prefetch():
+            time.sleep(0.025)
+    # Fetching and consuming serially would take at least 0.4s
+    assert time.monotonic() - start < 0.35
+
+
+def test_prefetch_bounds_pages_held(client):
+    results, call_api = _paged_search_results(client, total_pages=10)
+    with patch.object(AtlanClient, "_call_api", side_effect=call_api) as mock:
+        assets = results.prefetch(pages=1)
+        next(assets)
+        time.sleep(0.2)
+        # One page waiting in the buffer and one waiting for room in it
+        assert mock.call_count == 2
+        assets.close()
+
+
+def test_prefetch_raises_errors_from_background_thread(client):
+    results, _ = _paged_search_results(client, total_pages=2)
+    with patch.object(
+        AtlanClient, "_call_api", side_effect=AtlanServiceException(GET_USERS, Mock())
+    ):
+        with pytest.raises(AtlanServiceException):
+            list(results.prefetch())
+
+
+def test_prefetch_requires_at_least_one_page(client):
+    results, _ = _paged_search_results(client, total_pages=1)
+    with pytest.raises(ValueError, match="pages must be at least 1"):
+        list(results.prefetch(pages=0))
+
+
+def test_search_with_deep_paging_pages_with_search_after(client):
+    guids = [f"guid-{i}" for i in range(5)]
+    requests_sent = []
+
+    def call_api(api, query_params=None, request_obj=None, exclude_unset=True):
+        dsl = request_obj.dsl
+        requests_sent.append(json.loads(dsl.json(by_alias=True, exclude_unset=True)))
+        after = dsl.search_after[0] if dsl.search_after else ""
+        page = [guid for guid in guids if guid > after][: dsl.size]
+        return {
+            "approximateCount": len(guids),
+            "entities": [
+                {"typeName": "Table", "guid": guid, "attributes": {"name": guid}}
+                for guid in page
+            ],
+        }
+
+    criteria = IndexSearchRequest(dsl=DSL(query=Term.with_type_name("Table"), size=2))
+    with patch.object(AtlanClient, "_call_api", side_effect=call_api):
+        results = client.search(criteria, deep_paging=True)
+        assert results.deep_paging
+        assert [asset.guid for asset in results] == guids
+    assert [request.get("search_after") for request in requests_sent] == [
+        None,
+        ["guid-1"],
+        ["guid-3"],
+        ["guid-4"],
+    ]
+    assert all(request["from"] == 0 for request in requests_sent)
+    assert requests_sent[0]["sort"] == [{"__guid": {"order": "asc"}}]
+    # The criteria passed in are left untouched
+    assert criteria.dsl.sort is None
+
+
+def _guid_search(guids, fail_on=None):
+    def call_api(api, query_params=None, request_obj=None, exclude_unset=True):
+        dsl = request_obj.dsl
+        if fail_on is not None and dsl.search_after == fail_on:
+            raise AtlanServiceException(INDEX_SEARCH, Mock())
+        after = dsl.search_after[0] if dsl.search_after else ""
+        start, end = dsl.from_, dsl.from_ + dsl.size
+        page = [guid for guid in guids if guid > after][start:end]
+        return {
+            "approximateCount": len(guids),
+            "entities": [
+                {"typeName": "Table", "guid": guid, "attributes": {"name": guid}}
+                for guid in page
+            ],
+        }
+
+    return call_api
+
+
+@pytest.mark.parametrize("deep_paging", [True, False])
+def test_resume_search_from_checkpoint(client, tmp_path, deep_paging):
+    guids = [f"guid-{i}" for i in range(7)]
+    criteria = IndexSearchRequest(dsl=DSL(query=Term.with_type_name("Table"), size=2))
+    with patch.object(AtlanClient, "_call_api", side_effect=_guid_search(guids)):
+        results = client.search(criteria, deep_paging=deep_paging)
+        assets = iter(results)
+        consumed = [next(assets).guid for _ in range(3)]
+        results.checkpoint().save(tmp_path / "checkpoint.json")
+
+        checkpoint = SearchCheckpoint.load(tmp_path / "checkpoint.json")
+        resumed = client.resume_search(criteria, checkpoint)
+        consumed.extend(asset.guid for asset in resumed)
+
+    assert checkpoint.skip == 1
+    assert checkpoint.retrieved == 3
+    assert checkpoint.deep_paging == deep_paging
+    assert consumed == guids
+    assert resumed.retrieved == len(guids)
+
+
+def test_resume_search_after_failure(client):
+    guids = [f"guid-{i}" for i in range(7)]
+    criteria = IndexSearchRequest(dsl=DSL(query=Term.with_type_name("Table"), size=2))
+    consumed = []
+    with patch.object(
+        AtlanClient,
+        "_call_api",
+        side_effect=_guid_search(guids, fail_on=["guid-3"]),
+    ):
+        results = client.search(criteria, deep_paging=True)
+        with pytest.raises(AtlanServiceException):
+            for asset in results:
+                consumed.append(asset.guid)
+        checkpoint = results.checkpoint()
+    assert checkpoint.search_after == ["guid-1"]
+    assert checkpoint.skip == 2
+
+    with patch.object(AtlanClient, "_call_api", side_effect=_guid_search(guids)):
+        consumed.extend(
+            asset.guid
+            for asset in client.resume_search(
+                criteria, SearchCheckpoint.from_dict(checkpoint.to_dict())
+            )
+        )
+    assert consumed == guids
+
+
+def test_resume_search_from_first_page_sends_no_search_after(client):
+    guids = [f"guid-{i}" for i in range(3)]
+    criteria = IndexSearchRequest(dsl=DSL(query=Term.with_type_name("Table"), size=2))
+    bodies = []
+    search = _guid_search(guids)
+
+    def call_api(api, query_params=None, request_obj=None, exclude_unset=True):
+        bodies.append(json.loads(request_obj.json(exclude_unset=exclude_unset)))
+        return search(api, query_params, request_obj, exclude_unset)
+
+    with patch.object(AtlanClient, "_call_api", side_effect=_guid_search(guids)):
+        checkpoint = client.search(criteria, deep_paging=True).checkpoint()
+    assert checkpoint.search_after is None
+
+    with patch.object(AtlanClient, "_call_api", side_effect=call_api):
+        assert [asset.guid for asset in client.resume_search(criteria, checkpoint)] == (
+            guids
+        )
+    assert "search_after" not in bodies[0]["dsl"]
+
+
+def test_resume_search_with_other_criteria_raises_value_error(client):
+    guids = [f"guid-{i}" for i in range(3)]
+    criteria = IndexSearchRequest(dsl=DSL(query=Term.with_type_name("Table"), size=2))
+    with patch.object(AtlanClient, "_call_api", side_effect=_guid_search(guids)):
+        checkpoint = client.search(criteria, deep_paging=True).checkpoint()
+        other = IndexSearchRequest(dsl=DSL(query=Term.with_type_name("View"), size=2))
+        with pytest.raises(
+            ValueError, match="criteria do not match those of the checkpoint"
+        ):
+            client.resume_search(other, checkpoint)
+
+
+@pytest.mark.parametrize(
+    "sort, expected",
+    [
+        ([SortItem("__guid")], ["123"]),
+        ([SortItem("__timestamp"), SortItem("__guid")], [1000, "123"]),
+        ([SortItem("name.keyword"), SortItem("__guid")], ["t", "123"]),
+        ([SortItem("description")], [None]),
+    ],
+)
+def test_get_search_after(sort, expected):
+    entity = {
+        "typeName": "Table",
+        "guid": "123",
+        "createTime": 1000,
+        "attributes": {"name": "t"},
+    }
+    assert get_search_after(sort, entity) == expected
+
+
+def test_with_tiebreaker_requests_sorted_attributes():
+    criteria = IndexSearchRequest(
+        dsl=DSL(
+            query=Term.with_type_name("Table"),
+            sort=[SortItem("name.keyword"), SortItem("__guid", SortOrder.DESCENDING)],
+        ),
+        attributes=["description"],
+    )
+    copy = with_tiebreaker(criteria)
+    assert copy.dsl.sort == criteria.dsl.sort
+    assert copy.attributes == ["description", "name"]
+    assert criteria.attributes == ["description"]
+
+
+def test_partition_by_guid():
+    criteria = IndexSearchRequest(dsl=DSL(query=Term.with_type_name("Table")))
+    partitions = partition_by_guid(criteria, 4)
+    ranges = [partition.dsl.query.filter[0] for partition in partitions]
+    assert [(r.gte, r.lt) for r in ranges] == [
+        (None, "40"),
+        ("40", "80"),
+        ("80", "c0"),
+        ("c0", None),
+    ]
+    assert all(
+        partition.dsl.query.must == (criteria.dsl.query,) for partition in partitions
+    )
+    assert partition_by_guid(criteria, 1)[0].dsl.query == criteria.dsl.query
+
+
+@pytest.mark.parametrize("slices", [0, 257])
+def test_partition_by_guid_with_invalid_slices_raises_value_error(slices):
+    criteria = IndexSearchRequest(dsl=DSL(query=Term.with_type_name("Table")))
+    with pytest.raises(ValueError, match="slices must be between 1 and 256"):
+        partition_by_guid(criteria, slices)
+
+
+def _sliced_search(guids):
+    def call_api(api, query_params=None, request_obj=None, exclude_unset=True):
+        dsl = request_obj.dsl
+        guid_range = dsl.query.filter[0]
+        after = dsl.search_after[0] if dsl.search_after else ""
+        matches = sorted(
+            guid
+            for guid in guids
+            if (guid_range.gte is None or guid >= guid_range.gte)
+            and (guid_range.lt is None or guid < guid_range.lt)
+        )
+        page = [guid for guid in matches if guid > after][: dsl.size]
+        return {
+            "approximateCount": len(matches),
+            "entities": [
+                {"typeName": "Table", "guid": guid, "attributes": {"name": guid}}
+                for guid in page
+            ],
+        }
+
+    return call_api
+
+
+def test_search_parallel_retrieves_every_slice(client):
+    guids = [f"{i:02x}-guid" for i in range(0, 256, 3)]
+    criteria = IndexSearchRequest(dsl=DSL(query=Term.with_type_name("Table"), size=5))
+    with patch.object(AtlanClient, "_call_api", side_effect=_sliced_search(guids)):
+        results = client.search_parallel(criteria, slices=4, max_workers=2)
+        assert sorted(asset.guid for asset in results) == sorted(guids)
+    assert results.count == len(guids)
+    assert all(progress.done for progress in results.progress)
+    assert sum(progress.retrieved for progress in results.progress) == len(guids)
+
+
+def test_search_parallel_raises_errors_from_slices(client):
+    criteria = IndexSearchRequest(dsl=DSL(query=Term.with_type_name("Table")))
+    with patch.object(
+        AtlanClient, "_call_api", side_effect=AtlanServiceException(GET_USERS, Mock())
+    ):
+        with pytest.raises(AtlanServiceException):
+            list(client.search_parallel(criteria, slices=2))
+
+
+def test_search_parallel_requires_at_least_one_worker(client):
+    criteria = IndexSearchRequest(dsl=DSL(query=Term.with_type_name("Table")))
+    with pytest.raises(ValueError, match="max_workers must be at least 1"):
+        client.search_parallel(criteria, max_workers=0)
+
+
+@pytest.mark.parametrize("track_total_hits", [True, 10000])
+def test_count_retrieves_no_assets(client, track_total_hits):
+    with patch.object(
+        AtlanClient, "_call_api", return_value={"approximateCount": 42}
+    ) as call:
+        assert (
+            client.count(
+                Term.with_type_name("Table"), track_total_hits=track_total_hits
+            )
+            == 42
+        )
+    request = json.loads(
+        call.call_args.kwargs["request_obj"].json(by_alias=True, exclude_unset=True)
+    )
+    assert request["attributes"] == []
+    assert request["dsl"]["size"] == 0
+    assert request["dsl"]["track_total_hits"] == track_total_hits
+
+
+@pytest.mark.parametrize(
+    "response, expected", [({"approximateCount": 1}, True), ({}, False)]
+)
+def test_exists(client, response, expected):
+    with patch.object(AtlanClient, "_call_api", return_value=response) as call:
+        assert client.exists(Term.with_type_name("Table")) is expected
+    dsl = call.call_args.kwargs["request_obj"].dsl
+    assert dsl.size == 0
+    assert dsl.track_total_hits == 1 and dsl.track_total_hits is not True
+
+
+def _terms_search(assets):
+    def call_api(api, query_params=None, request_obj=None, exclude_unset=True):
+        terms, state = request_obj.dsl.query.filter
+        assert state.value == "ACTIVE"
+        key = "guid" if terms.field == "__guid" else "qualifiedName"
+        entities = [
+            asset
+            for asset in assets
+            if (asset.get(key) or asset["attributes"].get(key)) in terms.values
+        ]
+        after = request_obj.dsl.search_after
+        entities = [e for e in entities if not after or e["guid"] > after[0]]
+        return {"approximateCount": len(entities), "entities": entities}
+
+    return call_api
+
+
+ASSETS_TO_RESOLVE = [
+    {
+        "typeName": "Table",
+        "guid": f"guid-{i}",
+        "attributes": {"qualifiedName": f"qn-{i}"},
+    }
+    for i in range(10)
+]
+
+
+def test_get_assets_by_qualified_names(client):
+    qualified_names = ["qn-1", "qn-5", "missing", "qn-1", "qn-9"]
+    with patch.object(
+        AtlanClient, "_call_api", side_effect=_terms_search(ASSETS_TO_RESOLVE)
+    ) as call:
+        found = client.get_assets_by_qualified_names(qualified_names, chunk_size=2)
+    assert list(found) == ["qn-1", "qn-5", "missing", "qn-9"]
+    assert found["missing"] is None
+    assert {qn: view.guid for qn, view in found.items() if view} == {
+        "qn-1": "guid-1",
+        "qn-5": "guid-5",
+        "qn-9": "guid-9",
+    }
+    assert found["qn-5"].type_name == "Table"
+    assert call.call_count == 2
+    assert all(
+        len(c.kwargs["request_obj"].dsl.query.filter[0].values) <= 2
+        for c in call.call_args_list
+    )
+
+
+def test_get_assets_by_guids(client):
+    with patch.object(
+        AtlanClient, "_call_api", side_effect=_terms_search(ASSETS_TO_RESOLVE)
+    ):
+        found = client.get_assets_by_guids(["guid-3", "guid-42"])
+    assert found["guid-3"].qualified_name == "qn-3"
+    assert found["guid-42"] is None
@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import json
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic import Field
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.codec import OrjsonCodec, StdlibJsonCodec, get_codec
+from pyatlan.client.constants import GET_USERS
+from pyatlan.model.assets import Asset, AtlasGlossary, Table
+from pyatlan.model.core import AtlanObject, BulkRequest
+from pyatlan.model.enums import CertificateStatus
+from pyatlan.model.search import DSL, IndexSearchRequest, Range, SortItem, Term, Terms
+
+CODECS = [StdlibJsonCodec(), OrjsonCodec()]
+
+
+class RootList(AtlanObject):
+    __root__: list[str] = Field(default_factory=list)
+
+
+def _search_request():
+    query = (
+        Term.with_state("ACTIVE")
+        + Range.with_update_time_as_timestamp(gte=1690000000000)
+        + Terms(field="__guid", values=["1", "2"])
+        + Term.with_create_time_as_timestamp(datetime(2023, 7, 1, tzinfo=timezone.utc))
+    )
+    return IndexSearchRequest(
+        dsl=DSL(query=query, sort=[SortItem("__guid")]),
+        attributes=["name", "qualifiedName"],
+    )
+
+
+def _bulk_request():
+    table = Table.create(
+        name="my_table",
+        schema_qualified_name="default/snowflake/123/db/schema",
+    )
+    table.certificate_status = CertificateStatus.VERIFIED
+    table.description = "Tëst ☃"
+    table.source_created_at = datetime(2023, 7, 1, tzinfo=timezone.utc)
+    glossary = AtlasGlossary.create(name="my_glossary")
+    return BulkRequest[Asset](entities=[table, glossary])
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda c: c.name)
+@pytest.mark.parametrize(
+    "model",
+    [_search_request(), _bulk_request(), RootList(__root__=["a", "b"])],
+    ids=["search", "bulk", "custom_root"],
+)
+def test_dumps_model_matches_pydantic_json(codec, model):
+    encoded = codec.dumps_model(model, exclude_unset=True)
+    assert json.loads(encoded) == json.loads(
+        model.json(by_alias=True, exclude_unset=True)
+    )
+
+
+def test_stdlib_codec_is_byte_for_byte_compatible():
+    model = _search_request()
+    assert StdlibJsonCodec().dumps_model(model) == model.json(
+        by_alias=True, exclude_unset=True
+    )
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda c: c.name)
+def test_loads(codec):
+    assert codec.loads(b'{"a": [1, 2.5, "x", null, true]}') == {
+        "a": [1, 2.5, "x", None, True]
+    }
+
+
+@pytest.mark.parametrize(
+    "name, codec_type",
+    [("auto", OrjsonCodec), ("orjson", OrjsonCodec), ("json", StdlibJsonCodec)],
+)
+def test_get_codec(name, codec_type):
+    assert isinstance(get_codec(name), codec_type)
+
+
+def test_get_codec_with_unknown_name_raises_value_error():
+    with pytest.raises(ValueError, match="Unknown JSON codec: yaml"):
+        get_codec("yaml")
+
+
+def test_get_codec_falls_back_to_stdlib_when_orjson_missing():
+    with patch("pyatlan.client.codec.orjson", None):
+        assert isinstance(get_codec("auto"), StdlibJsonCodec)
+        with pytest.raises(ValueError, match="orjson must be installed"):
+            get_codec("orjson")
+
+
+@pytest.mark.parametrize("json_codec", ["json", "orjson"])
+def test_client_decodes_response_once(json_codec):
+    client = AtlanClient(
+        base_url="https://name.atlan.com", api_key="abkj", json_codec=json_codec
+    )
+    response = Mock()
+    response.status_code = 200
+    response.content = b'{"records": []}'
+    with patch.object(client._session, "request", return_value=response):
+        with patch("pyatlan.client.atlan.LOGGER.isEnabledFor", return_value=True):
+            assert client._call_api(GET_USERS) == {"records": []}
+    response.json.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "json_codec, codec_type", [("json", StdlibJsonCodec), ("orjson", OrjsonCodec)]
+)
+def test_client_exposes_its_codec(json_codec, codec_type):
+    client = AtlanClient(
+        base_url="https://name.atlan.com", api_key="abkj", json_codec=json_codec
+    )
+    assert isinstance(client.codec, codec_type)
@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import pytest
+
+from pyatlan.client.atlan import AtlanClient, PagingGap
+from pyatlan.model.search import DSL, IndexSearchRequest, Term
+from tests.unit.conftest import SearchIndex
+
+
+class ChangingIndex(SearchIndex):
+    """
+    Answers searches (by offset or after a GUID) over results in the order of the given GUIDs,
+    applying the given change to them just before answering the search with the given number.
+    """
+
+    def __init__(self, guids, changes=None):
+        self.guids = list(guids)
+        self.changes = changes or {}
+        self.searches = 0
+
+    def match(self, dsl):
+        self.searches += 1
+        if change := self.changes.get(self.searches):
+            change(self.guids)
+        return self.guids
+
+
+def _guids(count):
+    return [f"{i:03d}" for i in range(count)]
+
+
+def _search(guids, changes=None, consistent=True, deep_paging=False):
+    client = AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+    client.set_transport(ChangingIndex(guids, changes))
+    criteria = IndexSearchRequest(dsl=DSL(query=Term.with_type_name("Table"), size=5))
+    results = client.search(
+        criteria, deep_paging=deep_paging, lazy=True, consistent=consistent
+    )
+    return results, [asset.guid for asset in results]
+
+
+def test_inconsistent_paging_repeats_and_misses_results():
+    # Results inserted ahead of the position reached are repeated, and those removed cause
+    # others to be missed
+    _, guids = _search(_guids(20), {2: lambda g: g.insert(1, "000a")}, consistent=False)
+    assert guids.count("004") == 2
+
+    _, guids = _search(_guids(20), {2: lambda g: g.remove("000")}, consistent=False)
+    assert "005" not in guids
+
+
+def test_consistent_paging_skips_duplicates():
+    results, guids = _search(
+        _guids(20), {2: lambda g: g.__setitem__(slice(1, 1), ["000a", "000b"])}
+    )
+    assert len(guids) == len(set(guids))
+    assert set(_guids(20)) <= set(guids)
+    assert results.paging_report.duplicates == 2
+    assert results.paging_report.complete
+
+
+def test_consistent_paging_reports_gaps():
+    results, guids = _search(
+        _guids(20), {2: lambda g: g.remove("000"), 3: lambda g: g.remove("001")}
+    )
+    assert len(guids) == len(set(guids))
+    assert results.paging_report.gaps == [
+        PagingGap(start=5, after_guid="004"),
+        PagingGap(start=10, after_guid="010"),
+    ]
+    assert not results.paging_report.complete
+
+
+def test_consistent_paging_without_changes():
+    results, guids = _search(_guids(12))
+    assert guids == _guids(12)
+    assert results.paging_report.duplicates == 0
+    assert results.paging_report.complete
+
+
+def _update_retrieved(guids):
+    # As though sorted by when each was last updated, with those retrieved so far updated
+    # (and the last one removed)
+    guids[:] = guids[10:-1] + guids[:10]
+
+
+def test_consistent_paging_continues_past_pages_of_duplicates():
+    results, guids = _search(_guids(20), {3: _update_retrieved})
+    assert guids == _guids(10)
+    assert results.paging_report.duplicates == 10
+    assert results.paging_report.gaps == [PagingGap(start=10, after_guid="009")]
+
+
+def test_consistent_deep_paging_is_unaffected_by_changes_before_position():
+    results, guids = _search(
+        _guids(20),
+        {2: lambda g: g.remove("000"), 3: lambda g: g.insert(1, "000a")},
+        deep_paging=True,
+    )
+    assert guids == _guids(20)
+    assert results.paging_report.complete
+
+
+def test_paging_report_only_when_consistent():
+    results, _ = _search(_guids(3), consistent=False)
+    assert results.paging_report is None
+
+
+def test_consistent_results_cannot_be_checkpointed():
+    results, _ = _search(_guids(3))
+    with pytest.raises(ValueError, match="cannot checkpoint"):
+        results.checkpoint()
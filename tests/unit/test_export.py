@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import csv
+import gzip
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.export import csv_columns, export_to_csv, export_to_ndjson
+from pyatlan.model.search import DSL, IndexSearchRequest, Term
+
+ENTITIES = [
+    {
+        "typeName": "Table",
+        "guid": f"guid-{i}",
+        "attributes": {
+            "qualifiedName": f"default/snowflake/123/db/schema/table{i}",
+            "name": f"table{i}",
+            "description": 'a, "quoted" description' if i == 1 else None,
+            "atlanSchema": {"typeName": "Schema", "guid": "schema"},
+        },
+    }
+    for i in range(5)
+]
+
+
+@pytest.fixture()
+def client():
+    return AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+
+
+@pytest.fixture()
+def criteria():
+    return IndexSearchRequest(
+        dsl=DSL(query=Term.with_type_name("Table"), size=2),
+        attributes=["name", "description", "atlanSchema"],
+    )
+
+
+def _call_api(api, query_params=None, request_obj=None, exclude_unset=True):
+    dsl = request_obj.dsl
+    after = dsl.search_after[0] if dsl.search_after else ""
+    page = [entity for entity in ENTITIES if entity["guid"] > after][: dsl.size]
+    return {"approximateCount": len(ENTITIES), "entities": page}
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_export_to_ndjson(client, criteria, tmp_path, prefetch):
+    path = tmp_path / "export.ndjson"
+    with patch.object(AtlanClient, "_call_api", side_effect=_call_api):
+        assert export_to_ndjson(client, criteria, path, prefetch=prefetch) == 5
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == ENTITIES
+
+
+def test_export_to_ndjson_compresses_gz_files(client, criteria, tmp_path):
+    path = tmp_path / "export.ndjson.gz"
+    with patch.object(AtlanClient, "_call_api", side_effect=_call_api):
+        export_to_ndjson(client, criteria, path)
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        assert [json.loads(line) for line in file] == ENTITIES
+
+
+def test_export_to_ndjson_writes_to_open_file(client, criteria):
+    file = io.BytesIO()
+    with patch.object(AtlanClient, "_call_api", side_effect=_call_api):
+        export_to_ndjson(client, criteria, file)
+    assert not file.closed
+    assert len(file.getvalue().splitlines()) == 5
+
+
+def test_csv_columns(criteria):
+    assert csv_columns(criteria) == [
+        "typeName",
+        "guid",
+        "qualifiedName",
+        "name",
+        "description",
+        "atlanSchema",
+    ]
+
+
+def test_export_to_csv(client, criteria, tmp_path):
+    path = tmp_path / "export.csv"
+    with patch.object(AtlanClient, "_call_api", side_effect=_call_api):
+        assert export_to_csv(client, criteria, path, compress=True) == 5
+    with gzip.open(path, "rt", encoding="utf-8", newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == csv_columns(criteria)
+    assert rows[2] == [
+        "Table",
+        "guid-1",
+        "default/snowflake/123/db/schema/table1",
+        "table1",
+        'a, "quoted" description',
+        '{"typeName": "Schema", "guid": "schema"}',
+    ]
+    assert rows[1][4] == ""
+    assert len(rows) == 6
+
+
+def test_export_to_csv_with_columns(client, criteria):
+    file = io.StringIO(newline="")
+    with patch.object(AtlanClient, "_call_api", side_effect=_call_api):
+        export_to_csv(client, criteria, file, columns=["guid", "name"])
+    assert file.getvalue().splitlines()[:2] == ["guid,name", "guid-0,table0"]
@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+from unittest.mock import patch
+
+import pytest
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.incremental_sync import IncrementalSync, SyncState
+from pyatlan.model.search import Bool, Range, Term
+
+QUERY = Term.with_type_name("Table")
+
+
+@pytest.fixture()
+def client():
+    return AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+
+
+class Catalog:
+    """
+    Stands in for the search endpoint, over assets that are only their GUID and update time.
+    """
+
+    def __init__(self, **update_times):
+        self.update_times = dict(update_times)
+        self.requests = []
+
+    def call_api(self, api, query_params=None, request_obj=None, exclude_unset=True):
+        dsl = request_obj.dsl
+        self.requests.append(dsl)
+        since = 0
+        if isinstance(dsl.query, Bool):
+            since = next(q.gte for q in dsl.query.filter if isinstance(q, Range))
+        after = tuple(dsl.search_after) if dsl.search_after else (0, "")
+        matches = sorted(
+            (update_time, guid)
+            for guid, update_time in self.update_times.items()
+            if update_time >= since and (update_time, guid) > after
+        )
+        return {
+            "approximateCount": len(matches),
+            "entities": [
+                {"typeName": "Table", "guid": guid, "updateTime": update_time}
+                for update_time, guid in matches[: dsl.size]
+            ],
+        }
+
+
+def _sync(client, catalog, sync):
+    with patch.object(AtlanClient, "_call_api", side_effect=catalog.call_api):
+        return [(asset.guid, asset.update_time) for asset in sync.changes()]
+
+
+def test_first_sync_retrieves_everything(client):
+    catalog = Catalog(a=1_000, b=3_000, c=2_000)
+    sync = IncrementalSync(client, QUERY, page_size=2)
+
+    assert _sync(client, catalog, sync) == [("a", 1_000), ("c", 2_000), ("b", 3_000)]
+    assert sync.state.watermark == 3_000
+    assert catalog.requests[0].query == QUERY
+    assert [item.field for item in catalog.requests[0].sort] == [
+        "__modificationTimestamp",
+        "__guid",
+    ]
+
+
+def test_sync_retrieves_only_changes_since_watermark(client, tmp_path):
+    catalog = Catalog(a=100_000, b=200_000, c=300_000)
+    first = IncrementalSync(client, QUERY, overlap=60)
+    _sync(client, catalog, first)
+    first.state.save(tmp_path / "state.json")
+
+    catalog.update_times.update(a=400_000, d=300_000)
+    catalog.requests.clear()
+    second = IncrementalSync(
+        client, QUERY, state=SyncState.load(tmp_path / "state.json"), overlap=60
+    )
+
+    # d was changed at the same time as c (which was already retrieved)
+    assert _sync(client, catalog, second) == [("d", 300_000), ("a", 400_000)]
+    assert catalog.requests[0].query.filter[1].gte == 240_000
+    assert second.state == SyncState(watermark=400_000, recent={"a": 400_000})
+
+
+def test_sync_retrieves_late_changes_within_overlap(client):
+    catalog = Catalog(a=100_000)
+    sync = IncrementalSync(client, QUERY, overlap=30)
+    _sync(client, catalog, sync)
+
+    # Changed on a server with a clock running behind
+    catalog.update_times["b"] = 80_000
+    assert _sync(client, catalog, sync) == [("b", 80_000)]
+    assert _sync(client, catalog, sync) == []
+
+
+def test_sync_without_changes_keeps_state(client):
+    catalog = Catalog(a=100_000)
+    state = SyncState(watermark=100_000, recent={"a": 100_000})
+    sync = IncrementalSync(client, QUERY, state=state)
+
+    assert _sync(client, catalog, sync) == []
+    assert sync.state == state
+
+
+def test_state_forgets_changes_before_overlap(client):
+    catalog = Catalog(a=100_000, b=500_000)
+    sync = IncrementalSync(client, QUERY, overlap=60)
+    _sync(client, catalog, sync)
+
+    assert sync.state.recent == {"b": 500_000}
+
+
+def test_state_round_trips_through_dict():
+    state = SyncState(watermark=1_000, recent={"a": 1_000})
+    assert SyncState.from_dict(state.to_dict()) == state
+
+
+def test_negative_overlap_raises_value_error(client):
+    with pytest.raises(ValueError, match="overlap must not be negative"):
+        IncrementalSync(client, QUERY, overlap=-1)
@@ -0,0 +1,155 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from urllib3.util.retry import RequestHistory, Retry
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.constants import GET_ENTITY_BY_GUID, GET_USERS, INDEX_SEARCH
+from pyatlan.client.metrics import (
+    Histogram,
+    InMemoryMetricsSink,
+    MetricsSink,
+    RequestMetrics,
+)
+from pyatlan.exceptions import AtlanServiceException
+from pyatlan.model.search import DSL, IndexSearchRequest, Term
+
+
+@pytest.fixture()
+def client():
+    return AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+
+
+def _response(status_code: int, body: str = "{}", retries: int = 0):
+    response = Mock()
+    response.status_code = status_code
+    response.content = body.encode()
+    response.text = body
+    response.raw.retries = Retry(
+        total=10,
+        history=tuple(
+            RequestHistory("GET", "/", None, 503, None) for _ in range(retries)
+        ),
+    )
+    return response
+
+
+def test_histogram():
+    histogram = Histogram(buckets=(0.01, 0.1, 1.0))
+    for value in (0.005, 0.05, 0.05, 0.5, 5.0):
+        histogram.observe(value)
+    assert histogram.count == 5
+    assert histogram.counts == [1, 2, 1, 1]
+    assert histogram.mean == pytest.approx(1.121)
+    assert histogram.percentile(50) == 0.1
+    assert histogram.percentile(80) == 1.0
+    assert histogram.percentile(100) == 5.0
+    assert Histogram().percentile(50) == 0.0
+
+
+def test_in_memory_metrics_sink_aggregates_by_endpoint():
+    sink = InMemoryMetricsSink()
+    for status_code in (200, 200, 500):
+        sink.record_request(
+            RequestMetrics(
+                endpoint="GET a",
+                status_code=status_code,
+                latency=0.1,
+                request_bytes=10,
+                response_bytes=100,
+                retries=1,
+                decode_time=0.01,
+            )
+        )
+    sink.record_parse("GET a", 0.02)
+    summary = sink.summary()["GET a"]
+    assert summary["count"] == 3
+    assert summary["errors"] == 1
+    assert summary["request_bytes"] == 30
+    assert summary["response_bytes"] == 300
+    assert summary["retries"] == 3
+    assert summary["latency_mean"] == pytest.approx(0.1)
+    assert summary["decode_time_total"] == pytest.approx(0.03)
+    assert summary["parse_time_total"] == pytest.approx(0.02)
+    sink.reset()
+    assert sink.summary() == {}
+
+
+def test_client_records_request_metrics(client):
+    body = json.dumps({"totalRecord": 0, "filterRecord": 0, "records": []})
+    with patch.object(
+        client._session, "request", return_value=_response(200, body, retries=2)
+    ):
+        client._call_api(GET_USERS, request_obj={"a": 1})
+    metrics = client.metrics_sink.endpoints[GET_USERS.endpoint]
+    assert metrics.count == 1
+    assert metrics.status_codes == {200: 1}
+    assert metrics.request_bytes == len(client._codec.dumps({"a": 1}))
+    assert metrics.response_bytes == len(body)
+    assert metrics.retries == 2
+    assert metrics.decode_time.count == 1
+
+
+def test_client_records_rate_limiting_apart_from_latency():
+    client = AtlanClient(
+        base_url="https://name.atlan.com", api_key="abkj", rate_limit_per_second=2
+    )
+    with patch.object(client._session, "request", return_value=_response(200, "")):
+        for _ in range(3):
+            client._call_api(GET_USERS)
+    metrics = client.metrics_sink.endpoints[GET_USERS.endpoint]
+    # The third request waits for the rate limiter, which is no part of its latency
+    assert metrics.latency.max < 0.1
+    assert metrics.queue_wait.max >= 0.4
+
+
+def test_client_records_failed_requests(client):
+    with patch.object(client._session, "request", return_value=_response(400)):
+        with pytest.raises(AtlanServiceException):
+            client._call_api(GET_USERS)
+    assert client.metrics_sink.endpoints[GET_USERS.endpoint].status_codes == {400: 1}
+
+
+def test_client_records_metrics_per_endpoint_rather_than_path(client):
+    for guid in ("123", "456"):
+        with patch.object(client._session, "request", return_value=_response(200, "")):
+            client._call_api(GET_ENTITY_BY_GUID.format_path_with_params(guid))
+    assert list(client.metrics_sink.endpoints) == [GET_ENTITY_BY_GUID.endpoint]
+    assert client.metrics_sink.endpoints[GET_ENTITY_BY_GUID.endpoint].count == 2
+
+
+def test_client_records_parse_time_separately(client):
+    body = json.dumps(
+        {
+            "approximateCount": 1,
+            "entities": [
+                {"typeName": "Table", "guid": "123", "attributes": {"name": "t"}}
+            ],
+        }
+    )
+    with patch.object(client._session, "request", return_value=_response(200, body)):
+        client.search(IndexSearchRequest(dsl=DSL(query=Term(field="name", value="t"))))
+    metrics = client.metrics_sink.endpoints[INDEX_SEARCH.endpoint]
+    assert metrics.count == 1
+    assert metrics.parse_time.count == 1
+
+
+def test_metrics_sink_is_pluggable(client):
+    sink = Mock(spec=MetricsSink)
+    client.set_metrics_sink(sink)
+    with patch.object(client._session, "request", return_value=_response(200, "")):
+        client._call_api(GET_USERS)
+    metrics = sink.record_request.call_args.args[0]
+    assert metrics.endpoint == f"GET {GET_USERS.path}"
+    assert metrics.status_code == 200
+
+
+def test_failing_metrics_sink_does_not_fail_requests(client):
+    sink = Mock(spec=MetricsSink)
+    sink.record_request.side_effect = ValueError("boom")
+    client.set_metrics_sink(sink)
+    with patch.object(client._session, "request", return_value=_response(200, "")):
+        assert client._call_api(GET_USERS) is None
@@ -0,0 +1,204 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import threading
+import time
+
+import pytest
+from urllib3 import HTTPResponse
+from urllib3.exceptions import MaxRetryError
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.deadline import (
+    MIN_ATTEMPT_TIMEOUT,
+    Deadline,
+    DeadlineTimeout,
+    deadline_scope,
+)
+from pyatlan.client.rate_limit import (
+    AtlanRetry,
+    LimitTimeoutError,
+    RateLimiter,
+    RetryBudget,
+)
+
+
+@pytest.mark.parametrize(
+    "requests_per_second, max_concurrent, message",
+    [
+        (0, None, "requests_per_second must be greater than 0"),
+        (None, 0, "max_concurrent must be at least 1"),
+    ],
+)
+def test_rate_limiter_with_invalid_parameters_raises_value_error(
+    requests_per_second, max_concurrent, message
+):
+    with pytest.raises(ValueError, match=message):
+        RateLimiter(
+            requests_per_second=requests_per_second, max_concurrent=max_concurrent
+        )
+
+
+def test_unlimited_rate_limiter_does_not_wait():
+    limiter = RateLimiter()
+    start = time.monotonic()
+    for _ in range(1000):
+        with limiter.limit():
+            pass
+    assert time.monotonic() - start < 0.5
+
+
+def test_rate_limiter_spaces_out_requests():
+    limiter = RateLimiter(requests_per_second=50)
+    start = time.monotonic()
+    for _ in range(60):
+        limiter.wait()
+    # The first 50 requests are the initial burst, the remaining 10 take ~0.2s
+    assert time.monotonic() - start >= 0.15
+
+
+def test_rate_limiter_pause_blocks_new_requests():
+    limiter = RateLimiter()
+    limiter.pause(0.2)
+    start = time.monotonic()
+    limiter.wait()
+    assert time.monotonic() - start >= 0.15
+
+
+def test_rate_limiter_caps_requests_in_flight():
+    limiter = RateLimiter(max_concurrent=2)
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def request():
+        nonlocal in_flight, peak
+        with limiter.limit():
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak == 2
+
+
+def test_rate_limiter_stops_waiting_at_deadline():
+    limiter = RateLimiter()
+    limiter.pause(2)
+    start = time.monotonic()
+    assert not limiter.wait(Deadline(0.05))
+    assert time.monotonic() - start < 1
+
+
+def test_rate_limiter_stops_waiting_for_a_slot_at_deadline():
+    limiter = RateLimiter(max_concurrent=1)
+    with limiter.limit():
+        with pytest.raises(LimitTimeoutError):
+            with limiter.limit(Deadline(0.05)):
+                pass
+    with limiter.limit(Deadline(0.05)):
+        pass
+
+
+def test_retry_after_is_cut_short_by_deadline():
+    retry = AtlanRetry(total=3, status_forcelist=[429])
+    response = HTTPResponse(status=429, headers={"Retry-After": "10"})
+    start = time.monotonic()
+    with deadline_scope(Deadline(0.05)):
+        with pytest.raises(MaxRetryError, match="deadline exceeded"):
+            retry.increment(method="GET", url="/", response=response).sleep(response)
+    assert time.monotonic() - start < 1
+
+
+def test_each_attempt_is_timed_out_by_what_is_left_of_deadline():
+    timeout = DeadlineTimeout(30.0, 900.0, Deadline(0.2))
+    assert 0.1 < timeout.clone().read_timeout <= 0.2
+    time.sleep(0.2)
+    retried = timeout.clone()
+    assert retried.connect_timeout == retried.read_timeout == MIN_ATTEMPT_TIMEOUT
+
+
+def test_retry_budget():
+    budget = RetryBudget(ratio=0.5, reserve=1, capacity=2)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+    for _ in range(10):
+        budget.deposit()
+    assert budget.balance == 2
+
+
+def test_retry_backoff_is_jittered_and_capped():
+    retry = AtlanRetry(total=10, backoff_factor=1, max_backoff=4)
+    for _ in range(5):
+        retry = retry.increment(method="GET", url="/", error=Exception())
+    backoffs = {retry.get_backoff_time() for _ in range(50)}
+    assert all(2 <= backoff <= 4 for backoff in backoffs)
+    assert len(backoffs) > 1
+
+
+def test_retry_shares_budget_and_limiter_with_new_instances():
+    budget = RetryBudget()
+    limiter = RateLimiter()
+    retry = AtlanRetry(total=3, budget=budget, rate_limiter=limiter, max_backoff=5)
+    new_retry = retry.new(total=2)
+    assert new_retry.budget is budget
+    assert new_retry.rate_limiter is limiter
+    assert new_retry.max_backoff == 5
+
+
+def test_retry_on_too_many_requests_pauses_rate_limiter():
+    limiter = RateLimiter()
+    retry = AtlanRetry(total=3, status_forcelist=[429], rate_limiter=limiter)
+    response = HTTPResponse(status=429, headers={"Retry-After": "1"})
+    retry.increment(method="GET", url="/", response=response)
+    start = time.monotonic()
+    limiter.wait()
+    assert time.monotonic() - start >= 0.9
+
+
+def test_retry_takes_a_token_for_each_attempt():
+    limiter = RateLimiter(requests_per_second=10)
+    retry = AtlanRetry(total=10, rate_limiter=limiter)
+    # Use up the initial burst
+    for _ in range(10):
+        limiter.wait()
+    start = time.monotonic()
+    for _ in range(3):
+        retry = retry.increment(method="GET", url="/", error=Exception())
+        retry.sleep()
+    assert time.monotonic() - start >= 0.25
+
+
+def test_retry_raises_when_budget_exhausted():
+    retry = AtlanRetry(total=10, budget=RetryBudget(ratio=0, reserve=1))
+    retry = retry.increment(method="GET", url="/", error=Exception())
+    with pytest.raises(MaxRetryError, match="retry budget exhausted"):
+        retry.increment(method="GET", url="/")
+
+
+def test_client_retry_strategy_is_configurable():
+    client = AtlanClient(
+        base_url="https://name.atlan.com",
+        api_key="abkj",
+        rate_limit_per_second=5,
+        max_concurrent_requests=4,
+        max_retries=3,
+    )
+    retry = client._session.get_adapter("https://name.atlan.com").max_retries
+    assert isinstance(retry, AtlanRetry)
+    assert retry.total == 3
+    assert 429 in retry.status_forcelist
+    assert retry.respect_retry_after_header
+    assert retry.rate_limiter is client._rate_limiter
+    assert retry.budget is client._retry_budget
+    assert client._rate_limiter.requests_per_second == 5
@@ -0,0 +1,149 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import gzip
+import json
+import time
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.constants import (
+    BULK_UPDATE,
+    GET_ENTITY_BY_GUID,
+    INDEX_SEARCH,
+    UPLOAD_IMAGE,
+)
+from pyatlan.client.request_template import RequestTemplates
+from pyatlan.utils import APPLICATION_JSON
+
+
+@pytest.fixture()
+def templates():
+    return RequestTemplates(
+        base_url="https://name.atlan.com",
+        headers={"authorization": "Bearer abkj"},
+        max_cached_urls=2,
+    )
+
+
+def test_url_is_resolved_against_base_url(templates):
+    assert (
+        templates.url(INDEX_SEARCH)
+        == "https://name.atlan.com/api/meta/search/indexsearch"
+    )
+    assert (
+        templates.url(GET_ENTITY_BY_GUID.format_path_with_params("123"))
+        == "https://name.atlan.com/api/meta/entity/guid/123"
+    )
+
+
+def test_url_cache_is_bounded(templates):
+    for guid in ("1", "2", "3"):
+        templates.url(GET_ENTITY_BY_GUID.format_path_with_params(guid))
+    assert len(templates._urls) <= 2
+
+
+def test_header_template_is_immutable(templates):
+    template = templates.header_template(INDEX_SEARCH)
+    assert template == {
+        "authorization": "Bearer abkj",
+        "Accept": APPLICATION_JSON,
+        "content-type": APPLICATION_JSON,
+    }
+    assert templates.header_template(INDEX_SEARCH) is template
+    with pytest.raises(TypeError):
+        template["Accept"] = "text/plain"
+
+
+def test_headers_are_a_fresh_copy_per_call(templates):
+    headers = templates.headers(INDEX_SEARCH)
+    headers["x-extra"] = "1"
+    assert "x-extra" not in templates.headers(INDEX_SEARCH)
+
+
+def test_create_params():
+    client = AtlanClient(
+        base_url="https://name.atlan.com", api_key="abkj", json_codec="json"
+    )
+    params, path = client._create_params(
+        GET_ENTITY_BY_GUID.format_path_with_params("123"),
+        {"minExtInfo": False},
+        {"a": 1},
+    )
+    assert path == "https://name.atlan.com/api/meta/entity/guid/123"
+    assert params == {
+        "headers": {
+            "authorization": "Bearer abkj",
+            "Accept-Encoding": "gzip, deflate",
+            "Accept": APPLICATION_JSON,
+            "content-type": APPLICATION_JSON,
+        },
+        "params": {"minExtInfo": False},
+        "data": '{"a": 1}',
+    }
+
+
+def test_upload_file_does_not_modify_shared_api():
+    client = AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+    with patch.object(AtlanClient, "_call_api_internal") as call:
+        client._upload_file(UPLOAD_IMAGE, file=BytesIO(b"abc"), filename="image.png")
+    api, _, params = call.call_args.args
+    assert api.produces.startswith("multipart/form-data; boundary=")
+    assert params["headers"]["content-type"] == api.produces
+    assert UPLOAD_IMAGE.produces == APPLICATION_JSON
+
+
+@pytest.fixture()
+def compressing_client():
+    return AtlanClient(
+        base_url="https://name.atlan.com",
+        api_key="abkj",
+        json_codec="json",
+        compress_requests=True,
+        compression_threshold=100,
+    )
+
+
+def test_create_params_compresses_large_bodies(compressing_client):
+    body = {"entities": [{"typeName": "Table", "guid": str(i)} for i in range(20)]}
+    params, _ = compressing_client._create_params(BULK_UPDATE, None, body)
+    assert params["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(params["data"])) == body
+
+
+def test_create_params_compresses_the_same_body_to_the_same_bytes(
+    compressing_client,
+):
+    body = {"entities": [{"typeName": "Table", "guid": str(i)} for i in range(20)]}
+    first, _ = compressing_client._create_params(BULK_UPDATE, None, body)
+    with patch("time.time", return_value=time.time() + 60):
+        later, _ = compressing_client._create_params(BULK_UPDATE, None, body)
+    assert first["data"] == later["data"]
+
+
+@pytest.mark.parametrize(
+    "api, body",
+    [
+        (BULK_UPDATE, {"a": 1}),
+        (GET_ENTITY_BY_GUID.format_path_with_params("123"), {"a": "b" * 200}),
+    ],
+)
+def test_create_params_does_not_compress_small_or_incompressible_bodies(
+    compressing_client, api, body
+):
+    params, _ = compressing_client._create_params(api, None, body)
+    assert "Content-Encoding" not in params["headers"]
+    assert params["data"] == json.dumps(body)
+
+
+def test_create_params_does_not_compress_by_default():
+    client = AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+    params, _ = client._create_params(BULK_UPDATE, None, {"a": "b" * 2000})
+    assert "Content-Encoding" not in params["headers"]
+
+
+def test_format_path_with_params_preserves_compressible():
+    assert INDEX_SEARCH.format_path_with_params().compressible
+    assert not GET_ENTITY_BY_GUID.format_path_with_params("123").compressible
@@ -0,0 +1,132 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import json
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.model.search import (
+    DSL,
+    AggregationBucketResult,
+    AggregationMetricResult,
+    CardinalityAggregation,
+    DateHistogramAggregation,
+    IndexSearchRequest,
+    Term,
+    TermsAggregation,
+    parse_aggregations,
+)
+
+
+def test_terms_aggregation_with_sub_aggregations_to_dict():
+    aggregation = TermsAggregation.with_connector_name(size=5)
+    aggregation.aggregations["types"] = TermsAggregation.with_type_name()
+    assert aggregation.to_dict() == {
+        "terms": {"field": "connectorName", "size": 5},
+        "aggs": {"types": {"terms": {"field": "__typeName.keyword"}}},
+    }
+
+
+def test_cardinality_aggregation_to_dict():
+    assert CardinalityAggregation(
+        field="__guid", precision_threshold=100
+    ).to_dict() == {"cardinality": {"field": "__guid", "precision_threshold": 100}}
+
+
+def test_date_histogram_aggregation_to_dict():
+    assert DateHistogramAggregation.with_update_time("month").to_dict() == {
+        "date_histogram": {
+            "field": "__modificationTimestamp",
+            "calendar_interval": "month",
+        }
+    }
+
+
+@pytest.mark.parametrize(
+    "calendar_interval, fixed_interval", [(None, None), ("day", "1d")]
+)
+def test_date_histogram_aggregation_requires_one_interval(
+    calendar_interval, fixed_interval
+):
+    with pytest.raises(
+        ValidationError,
+        match="Exactly one of calendar_interval or fixed_interval is required",
+    ):
+        DateHistogramAggregation(
+            field="__timestamp",
+            calendar_interval=calendar_interval,
+            fixed_interval=fixed_interval,
+        )
+
+
+def test_dsl_serializes_aggregations():
+    request = IndexSearchRequest(
+        dsl=DSL(
+            query=Term.with_type_name("Table"),
+            size=0,
+            aggregations={"certificates": TermsAggregation.with_certificate_status()},
+        )
+    )
+    assert json.loads(request.json(by_alias=True, exclude_unset=True))["dsl"][
+        "aggregations"
+    ] == {"certificates": {"terms": {"field": "certificateStatus"}}}
+
+
+RAW_AGGREGATIONS = {
+    "connectors": {
+        "doc_count_error_upper_bound": 0,
+        "sum_other_doc_count": 3,
+        "buckets": [
+            {
+                "key": "snowflake",
+                "doc_count": 10,
+                "types": {
+                    "buckets": [
+                        {"key": "Table", "doc_count": 7},
+                        {"key": "View", "doc_count": 3},
+                    ]
+                },
+            },
+            {"key": "tableau", "doc_count": 5, "types": {"buckets": []}},
+        ],
+    },
+    "owners": {"value": 42},
+}
+
+
+def test_parse_aggregations():
+    results = parse_aggregations(RAW_AGGREGATIONS)
+    connectors = results["connectors"]
+    assert isinstance(connectors, AggregationBucketResult)
+    assert connectors.counts() == {"snowflake": 10, "tableau": 5}
+    assert connectors.sum_other_doc_count == 3
+    assert connectors.buckets[0].aggregations["types"].counts() == {
+        "Table": 7,
+        "View": 3,
+    }
+    assert results["owners"] == AggregationMetricResult(value=42)
+    assert parse_aggregations(None) == {}
+
+
+def test_search_results_expose_aggregations():
+    client = AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+    criteria = IndexSearchRequest(
+        dsl=DSL(
+            query=Term.with_type_name("Table"),
+            size=0,
+            aggregations={"connectors": TermsAggregation.with_connector_name()},
+        )
+    )
+    with patch.object(
+        AtlanClient,
+        "_call_api",
+        return_value={"approximateCount": 15, "aggregations": RAW_AGGREGATIONS},
+    ):
+        results = client.search(criteria)
+    assert results.count == 15
+    assert results.aggregations["connectors"].counts() == {
+        "snowflake": 10,
+        "tableau": 5,
+    }
@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.codec import StdlibJsonCodec
+from pyatlan.client.constants import (
+    BULK_UPDATE,
+    GET_ENTITY_BY_GUID,
+    GET_LINEAGE,
+    INDEX_SEARCH,
+    PARSE_QUERY,
+)
+from pyatlan.client.search_cache import SearchCache, search_key
+from pyatlan.model.search import DSL, IndexSearchRequest, Term
+
+RESPONSE = {
+    "approximateCount": 1,
+    "entities": [{"typeName": "Table", "guid": "123", "attributes": {"name": "t"}}],
+}
+
+
+def _cache(max_size=10, ttl=60.0):
+    return SearchCache(max_size=max_size, ttl=ttl, codec=StdlibJsonCodec())
+
+
+def test_search_key_ignores_key_order():
+    assert search_key('{"a": 1, "b": {"c": 2, "d": 3}}') == search_key(
+        b'{"b": {"d": 3, "c": 2}, "a": 1}'
+    )
+    assert search_key('{"a": 1}') != search_key('{"a": 2}')
+
+
+def test_cache_answers_repeated_loads_from_memory():
+    cache = _cache()
+    first = cache.get_or_load("key", lambda: {"a": [1]})
+    first["a"].append(2)
+
+    assert cache.get_or_load("key", lambda: {"a": [3]}) == {"a": [1]}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_expires_entries():
+    cache = _cache(ttl=0.05)
+    cache.get_or_load("key", lambda: 1)
+    time.sleep(0.1)
+
+    assert cache.get_or_load("key", lambda: 2) == 2
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = _cache(max_size=2)
+    cache.get_or_load("a", lambda: 1)
+    cache.get_or_load("b", lambda: 2)
+    cache.get_or_load("a", lambda: 1)
+    cache.get_or_load("c", lambda: 3)
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get_or_load("a", lambda: None) == 1
+    assert cache.get_or_load("b", lambda: "reloaded") == "reloaded"
+
+
+def test_cache_discards_loads_in_flight_when_cleared():
+    cache = _cache()
+    loading, cleared = threading.Event(), threading.Event()
+
+    def load():
+        loading.set()
+        cleared.wait()
+        return "stale"
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(cache.get_or_load, "key", load)
+        loading.wait()
+        cache.clear()
+        cleared.set()
+        assert future.result() == "stale"
+    assert cache.get_or_load("key", lambda: "fresh") == "fresh"
+
+
+def test_cache_requires_room_for_an_entry():
+    with pytest.raises(ValueError, match="max_size must be at least 1"):
+        _cache(max_size=0)
+
+
+@pytest.fixture()
+def client():
+    return AtlanClient(
+        base_url="https://name.atlan.com", api_key="abkj", search_cache_size=10
+    )
+
+
+def _criteria(type_name="Table"):
+    return IndexSearchRequest(dsl=DSL(query=Term.with_type_name(type_name)))
+
+
+def test_client_does_not_cache_by_default():
+    client = AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+    assert client.search_cache is None
+    with patch.object(AtlanClient, "_call_api_internal", return_value=RESPONSE) as call:
+        client.search(_criteria())
+        client.search(_criteria())
+    assert call.call_count == 2
+
+
+def test_client_answers_repeated_searches_from_cache(client):
+    with patch.object(AtlanClient, "_call_api_internal", return_value=RESPONSE) as call:
+        assert client.search(_criteria()).current_page()[0].guid == "123"
+        assert client.search(_criteria()).current_page()[0].guid == "123"
+        client.search(_criteria("View"))
+    assert call.call_count == 2
+    assert (client.search_cache.hits, client.search_cache.misses) == (1, 2)
+
+
+@pytest.mark.parametrize(
+    "api, cleared",
+    [
+        (BULK_UPDATE, True),
+        (GET_ENTITY_BY_GUID.format_path_with_params("123"), False),
+        (GET_LINEAGE, False),
+        (PARSE_QUERY, False),
+    ],
+)
+def test_client_clears_cache_on_writes(client, api, cleared):
+    with patch.object(AtlanClient, "_call_api_internal", return_value=RESPONSE):
+        client.search(_criteria())
+        client._call_api(api, None, {"entities": []})
+    assert len(client.search_cache) == (0 if cleared else 1)
+
+
+def test_client_clears_cache_on_failed_writes(client):
+    with patch.object(AtlanClient, "_call_api_internal", return_value=RESPONSE):
+        client.search(_criteria())
+    with patch.object(
+        AtlanClient, "_call_api_internal", side_effect=ValueError("failed")
+    ):
+        with pytest.raises(ValueError):
+            client._call_api(BULK_UPDATE, None, {"entities": []})
+    assert len(client.search_cache) == 0
+
+
+def test_client_encodes_searches_once(client):
+    dumps_model = client.codec.dumps_model
+    with patch.object(
+        client.codec, "dumps_model", side_effect=dumps_model
+    ) as encode, patch.object(AtlanClient, "_call_api_internal", return_value=RESPONSE):
+        client.search(_criteria())
+        client.search(_criteria())
+    assert encode.call_count == 2
+
+
+def test_client_caches_raw_search_calls(client):
+    with patch.object(AtlanClient, "_call_api_internal", return_value=RESPONSE) as call:
+        client._call_api(INDEX_SEARCH, None, {"dsl": {"size": 1, "from": 0}})
+        client._call_api(INDEX_SEARCH, None, {"dsl": {"from": 0, "size": 1}})
+    assert call.call_count == 1
@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import json
+import pickle
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from pyatlan.model.search import DSL, Bool, MatchAll, Prefix, Term, Terms
+
+BOB = Term(field="name", value="Bob")
+DAVE = Term(field="name", value="Dave")
+ACTIVE = Term(field="__state", value="ACTIVE")
+
+
+@pytest.mark.parametrize(
+    "query, field, value",
+    [
+        (BOB, "value", "Fred"),
+        (Terms(field="name", values=["Bob"]), "values", []),
+        (Bool(must=[BOB]), "must", [DAVE]),
+        (MatchAll(), "boost", 1.0),
+    ],
+)
+def test_query_is_immutable(query, field, value):
+    with pytest.raises(FrozenInstanceError):
+        setattr(query, field, value)
+
+
+def test_equal_queries_are_equal_and_hash_the_same():
+    query = Bool(must=[Term(field="name", value="Bob")], filter=[ACTIVE])
+
+    assert query == Bool(must=[BOB], filter=[ACTIVE])
+    assert hash(query) == hash(Bool(must=[BOB], filter=[ACTIVE]))
+    assert {query: "cached"}[Bool(must=[BOB], filter=[ACTIVE])] == "cached"
+
+
+def test_unpickled_queries_hash_afresh():
+    query = Bool(must=[BOB], filter=[ACTIVE])
+    query.to_dict()
+    # As though hashed in another process, where the hash of a str differs
+    object.__setattr__(query, "_hash", hash(query) + 1)
+
+    unpickled = pickle.loads(pickle.dumps(query))
+    assert unpickled == query
+    assert hash(unpickled) == hash(Bool(must=[BOB], filter=[ACTIVE]))
+    assert unpickled in {Bool(must=[BOB], filter=[ACTIVE])}
+
+
+def test_different_queries_are_not_equal():
+    assert BOB != DAVE
+    assert Bool(must=[BOB]) != Bool(filter=[BOB])
+    assert Term(field="name", value="Bob") != Prefix(field="name", value="Bob")
+
+
+def test_to_dict_returns_a_copy():
+    query = Bool(must=[BOB, DAVE])
+    compiled = query.to_dict()
+    compiled["bool"]["must"].append(ACTIVE.to_dict())
+    compiled["bool"]["must"][0]["term"] = {}
+
+    assert query.to_dict() == Bool(must=[BOB, DAVE]).to_dict()
+    assert json.loads(query.to_json()) == query.to_dict()
+
+
+def test_clauses_and_values_cannot_be_changed():
+    values = ["a", "b"]
+    terms = Terms(field="name.keyword", values=values)
+    query = Bool(must=[terms])
+    values.append("c")
+
+    assert terms.values == ("a", "b")
+    assert query.must == (terms,)
+    assert (query & ACTIVE).must == (terms, ACTIVE)
+    assert terms.to_dict() == {"terms": {"name.keyword": ["a", "b"]}}
+
+
+def test_to_json():
+    query = Bool(must=[BOB])
+
+    assert json.loads(query.to_json()) == query.to_dict()
+    assert query.to_json() is query.to_json()
+
+
+def test_combining_does_not_change_operands():
+    left = Bool(must=[BOB])
+    right = Bool(filter=[ACTIVE])
+
+    combined = left & right
+
+    assert left == Bool(must=[BOB])
+    assert right == Bool(filter=[ACTIVE])
+    assert combined == Bool(must=[BOB], filter=[ACTIVE])
+    assert combined.must[0] is BOB
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        (
+            Bool(must=[Bool(must=[BOB], filter=[ACTIVE])]) & DAVE,
+            Bool(must=[BOB, DAVE], filter=[ACTIVE]),
+        ),
+        (
+            Bool(filter=[Bool(must=[BOB], must_not=[DAVE])]) + ACTIVE,
+            Bool(must=[ACTIVE], filter=[BOB], must_not=[DAVE]),
+        ),
+        (
+            Bool(must=[Bool(must=[Bool(must=[BOB])])]) & Bool(must=[DAVE]),
+            Bool(must=[BOB, DAVE]),
+        ),
+    ],
+)
+def test_combining_flattens_nested_conjunctions(query, expected):
+    assert query == expected
+
+
+@pytest.mark.parametrize(
+    "nested",
+    [
+        Bool(should=[BOB, DAVE]),
+        Bool(must=[BOB], boost=2.0),
+        Bool(must=[BOB], should=[DAVE], minimum_should_match=1),
+        Bool(must_not=[BOB]),
+    ],
+)
+def test_combining_keeps_nested_queries_that_cannot_be_flattened(nested):
+    query = Bool(must=[nested]) & ACTIVE
+
+    assert query.must == (nested, ACTIVE)
+
+
+def test_query_template_is_reused_in_dsl():
+    template = Bool(filter=[ACTIVE, Term(field="__typeName.keyword", value="Table")])
+
+    first = DSL(query=template & BOB)
+    second = DSL(query=template & DAVE)
+
+    assert first.query.filter == second.query.filter == template.filter
+    assert json.loads(first.json(by_alias=True, exclude_unset=True))["query"] == {
+        "bool": {
+            "must": [{"term": {"name": {"value": "Bob"}}}],
+            "filter": [
+                {"term": {"__state": {"value": "ACTIVE"}}},
+                {"term": {"__typeName.keyword": {"value": "Table"}}},
+            ],
+        }
+    }
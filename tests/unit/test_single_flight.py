@@ -0,0 +1,161 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.constants import BULK_UPDATE, GET_ENTITY_BY_GUID, INDEX_SEARCH
+from pyatlan.client.single_flight import SingleFlight, WaitTimeoutError, request_key
+from pyatlan.error import DeadlineExceededError
+
+
+def test_request_key_ignores_param_order_and_hashes_body():
+    assert request_key("GET", "/a", {"x": 1, "y": 2}, None) == request_key(
+        "GET", "/a", {"y": 2, "x": 1}, None
+    )
+    assert request_key("POST", "/a", None, '{"a": 1}') == request_key(
+        "POST", "/a", None, b'{"a": 1}'
+    )
+    assert request_key("POST", "/a", None, '{"a": 1}') != request_key(
+        "POST", "/a", None, '{"a": 2}'
+    )
+
+
+def test_single_flight_merges_concurrent_calls():
+    single_flight = SingleFlight()
+    calls = 0
+    started = threading.Event()
+
+    def func():
+        nonlocal calls
+        calls += 1
+        started.set()
+        time.sleep(0.1)
+        return {"entity": {"guid": "123"}}
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        leader = executor.submit(single_flight.do, "key", func)
+        started.wait()
+        followers = [executor.submit(single_flight.do, "key", func) for _ in range(4)]
+        results = [leader.result()] + [follower.result() for follower in followers]
+    assert calls == 1
+    assert all(result == {"entity": {"guid": "123"}} for result in results)
+    # Each caller gets its own copy of a shared result
+    assert len({id(result) for result in results}) == 5
+    assert single_flight.in_flight == 0
+
+
+def test_single_flight_shares_errors_with_followers():
+    single_flight = SingleFlight()
+    started = threading.Event()
+
+    def func():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.do, "key", func)
+        started.wait()
+        follower = executor.submit(single_flight.do, "key", func)
+        for future in (leader, follower):
+            with pytest.raises(ValueError, match="boom"):
+                future.result()
+    assert single_flight.in_flight == 0
+
+
+def test_single_flight_follower_gives_up_after_timeout():
+    single_flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def func():
+        started.set()
+        release.wait()
+        return 1
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(single_flight.do, "key", func)
+        started.wait()
+        with pytest.raises(WaitTimeoutError):
+            single_flight.do("key", func, timeout=0.05)
+        release.set()
+        assert leader.result() == 1
+
+
+def test_single_flight_does_not_merge_sequential_calls():
+    single_flight = SingleFlight()
+    result = {"a": 1}
+    assert single_flight.do("key", lambda: result) is result
+    assert single_flight.do("key", lambda: {"a": 2}) == {"a": 2}
+
+
+def _call_concurrently(client, api, request_obj=None):
+    def slow_call(*args, **kwargs):
+        time.sleep(0.1)
+        return {"a": 1}
+
+    with patch.object(
+        AtlanClient, "_call_api_internal", side_effect=slow_call
+    ) as call, ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(client._call_api, api, None, request_obj) for _ in range(4)
+        ]
+        assert all(future.result() == {"a": 1} for future in futures)
+    return call.call_count
+
+
+@pytest.mark.parametrize(
+    "api, request_obj",
+    [
+        (GET_ENTITY_BY_GUID.format_path_with_params("123"), None),
+        (INDEX_SEARCH, {"dsl": {"size": 10}}),
+    ],
+)
+def test_client_coalesces_identical_reads(api, request_obj):
+    client = AtlanClient(
+        base_url="https://name.atlan.com", api_key="abkj", coalesce_requests=True
+    )
+    assert _call_concurrently(client, api, request_obj) == 1
+
+
+def test_client_follower_respects_its_own_deadline():
+    client = AtlanClient(
+        base_url="https://name.atlan.com", api_key="abkj", coalesce_requests=True
+    )
+    api = GET_ENTITY_BY_GUID.format_path_with_params("123")
+    started, release = threading.Event(), threading.Event()
+
+    def slow_call(*args, **kwargs):
+        started.set()
+        release.wait()
+        return {"a": 1}
+
+    with patch.object(
+        AtlanClient, "_call_api_internal", side_effect=slow_call
+    ), ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(client._call_api, api)
+        started.wait()
+        with client.deadline(0.05):
+            with pytest.raises(DeadlineExceededError):
+                client._call_api(api)
+        release.set()
+        assert leader.result() == {"a": 1}
+
+
+def test_client_does_not_coalesce_writes():
+    client = AtlanClient(
+        base_url="https://name.atlan.com", api_key="abkj", coalesce_requests=True
+    )
+    assert _call_concurrently(client, BULK_UPDATE, {"entities": []}) == 4
+
+
+def test_client_does_not_coalesce_by_default():
+    client = AtlanClient(base_url="https://name.atlan.com", api_key="abkj")
+    assert (
+        _call_concurrently(client, GET_ENTITY_BY_GUID.format_path_with_params("123"))
+        == 4
+    )
@@ -0,0 +1,184 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import threading
+import time
+
+import pytest
+
+from pyatlan.client.atlan import AtlanClient, split_terms
+from pyatlan.model.search import (
+    DSL,
+    Bool,
+    IndexSearchRequest,
+    Term,
+    TermAttributes,
+    Terms,
+    TermsAggregation,
+)
+from tests.unit.conftest import SearchIndex
+
+GUID = TermAttributes.GUID.value
+
+
+def _criteria(query, size=100, **kwargs):
+    return IndexSearchRequest(dsl=DSL(query=query, size=size, **kwargs))
+
+
+def _values(criteria):
+    return [
+        query.values
+        for query in criteria.dsl.query.filter
+        if isinstance(query, Terms) and query.field == GUID
+    ]
+
+
+def test_split_terms_leaves_small_terms():
+    criteria = _criteria(Terms(field=GUID, values=["a", "b"]))
+    assert split_terms(criteria, 2) == [criteria]
+
+
+def test_split_terms_splits_oversized_required_terms():
+    query = Bool(
+        filter=[
+            Term.with_type_name("Table"),
+            Terms(field=GUID, values=["a", "b", "c", "d", "e"]),
+            Terms(field="name.keyword", values=["x", "y"]),
+        ]
+    )
+    split = split_terms(_criteria(query), 2)
+
+    assert [_values(criteria) for criteria in split] == [
+        [("a", "b")],
+        [("c", "d")],
+        [("e",)],
+    ]
+    for criteria in split:
+        assert criteria.dsl.query.filter[0] == Term.with_type_name("Table")
+        assert criteria.dsl.query.filter[2] == query.filter[2]
+    # The original criteria are left as they were
+    assert query.filter[1].values == ("a", "b", "c", "d", "e")
+
+
+def test_split_terms_splits_every_oversized_required_terms():
+    names = Terms(field="name.keyword", values=["x", "y", "z"])
+    query = Bool(
+        filter=[Terms(field=GUID, values=["a", "b", "c"]), names],
+        must=[names],
+    )
+    split = split_terms(_criteria(query), 2)
+
+    assert sorted(
+        (query.filter[0].values, query.filter[1].values)
+        for query in (criteria.dsl.query for criteria in split)
+    ) == [
+        (("a", "b"), ("x", "y")),
+        (("a", "b"), ("z",)),
+        (("c",), ("x", "y")),
+        (("c",), ("z",)),
+    ]
+    # A terms query shared by several clauses is split the same way in each
+    assert all(
+        criteria.dsl.query.must == (criteria.dsl.query.filter[1],) for criteria in split
+    )
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        Bool(should=[Terms(field=GUID, values=["a", "b", "c"])]),
+        Bool(must_not=[Terms(field=GUID, values=["a", "b", "c"])]),
+    ],
+)
+def test_split_terms_leaves_optional_or_negated_terms(query):
+    criteria = _criteria(query)
+    assert split_terms(criteria, 2) == [criteria]
+
+
+def test_split_terms_keeps_boost():
+    criteria = _criteria(Terms(field=GUID, values=["a", "b", "c"], boost=2.0))
+    assert [c.dsl.query.boost for c in split_terms(criteria, 2)] == [2.0, 2.0]
+
+
+class GuidIndex(SearchIndex):
+    """
+    Answers searches for terms of GUIDs (by offset) with the assets that have those GUIDs,
+    along with an asset that matches every search, as though matching several of the values.
+    """
+
+    def __init__(self, guids, delay=0.0):
+        self.guids = set(guids)
+        self.delay = delay
+        self.searches = []
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def match(self, dsl):
+        values = dsl["query"]["terms"][GUID]
+        # Only further pages count towards the peak of those in flight at the same time
+        further = dsl["from"] > 0
+        with self.lock:
+            self.searches.append(values)
+            self.in_flight += further
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= further
+        return ["shared"] + [guid for guid in values if guid in self.guids]
+
+
+def _search(guids, values, size=100, delay=0.0, workers=4, **kwargs):
+    client = AtlanClient(
+        base_url="https://name.atlan.com",
+        api_key="abkj",
+        max_terms_values=10,
+        search_chunk_workers=workers,
+    )
+    index = GuidIndex(guids, delay)
+    client.set_transport(index)
+    criteria = _criteria(Terms(field=GUID, values=values), size=size, **kwargs)
+    return client.search(criteria, lazy=True), index
+
+
+def test_search_splits_oversized_terms():
+    values = [f"{i:03d}" for i in range(35)]
+    results, index = _search(values, values, size=4)
+
+    assert sorted(asset.guid for asset in results) == sorted(values + ["shared"])
+    assert max(len(values) for values in index.searches) == 10
+    assert results.count == 4 + 35
+    assert results.paging_report.duplicates == 3
+
+
+def test_search_skips_chunks_of_results_already_retrieved():
+    values = [f"{i:03d}" for i in range(30)]
+    results, _ = _search(values[20:], values, size=4)
+
+    assert [asset.guid for asset in results] == ["shared"] + values[20:]
+
+
+@pytest.mark.parametrize("workers", [2, 4])
+def test_search_pages_through_chunks_concurrently(workers):
+    values = [f"{i:03d}" for i in range(40)]
+    results, index = _search(values, values, size=2, delay=0.01, workers=workers)
+
+    assert sorted(asset.guid for asset in results) == sorted(values + ["shared"])
+    # Further pages of the chunks are retrieved concurrently too
+    assert index.peak == workers
+
+
+def test_search_does_not_split_small_terms():
+    results, index = _search(["a"], ["a", "b"])
+
+    assert [asset.guid for asset in results] == ["shared", "a"]
+    assert results.paging_report is None
+    assert all(values == ["a", "b"] for values in index.searches)
+
+
+def test_search_cannot_aggregate_over_chunks():
+    with pytest.raises(ValueError, match="cannot aggregate"):
+        _search(
+            [],
+            [str(i) for i in range(11)],
+            aggregations={"types": TermsAggregation.with_type_name()},
+        )
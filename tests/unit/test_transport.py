@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2023 Atlan Pte. Ltd.
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.constants import GET_ALL_TYPE_DEFS
+from pyatlan.client.transport import (
+    NoRecordingError,
+    RecordingTransport,
+    ReplayTransport,
+    Transport,
+)
+from pyatlan.model.assets import AtlasGlossary
+from pyatlan.model.enums import AtlanTypeCategory
+from tests.unit.conftest import json_response
+
+DATA_DIR = Path(__file__).parent / "data"
+BASE_URL = "https://name.atlan.com"
+
+
+def load_json(filename):
+    with (DATA_DIR / filename).open() as input_file:
+        return json.load(input_file)
+
+
+def _client(**kwargs):
+    return AtlanClient(base_url=BASE_URL, api_key="abkj", **kwargs)
+
+
+def _url(api):
+    return f"{BASE_URL}/{api.path}"
+
+
+class StubTransport(Transport):
+    def __init__(self, body):
+        self.body = body
+
+    def request(self, method, url, **kwargs):
+        return json_response(url, self.body)
+
+
+def test_replay_transport_replays_fixtures():
+    transport = ReplayTransport()
+    transport.add("GET", _url(GET_ALL_TYPE_DEFS), load_json("typedefs.json"))
+    client = _client()
+    client.set_transport(transport)
+    assert client.get_all_typedefs().entity_defs
+
+
+def test_replay_transport_matches_query_parameters():
+    transport = ReplayTransport()
+    transport.add(
+        "GET",
+        _url(GET_ALL_TYPE_DEFS),
+        {"enumDefs": []},
+        params={"type": AtlanTypeCategory.ENUM.value},
+    )
+    client = _client()
+    client.set_transport(transport)
+    assert client.get_typedefs(AtlanTypeCategory.ENUM).enum_defs == []
+    with pytest.raises(NoRecordingError, match="No recorded response for: GET"):
+        client.get_typedefs(AtlanTypeCategory.STRUCT)
+
+
+def test_replay_transport_replays_responses_in_order_then_repeats_the_last():
+    transport = ReplayTransport()
+    for i in range(2):
+        transport.add("GET", "https://a", {"i": i})
+    assert [transport.request("GET", "https://a").json()["i"] for _ in range(3)] == [
+        0,
+        1,
+        1,
+    ]
+
+
+def test_replay_transport_simulates_latency():
+    transport = ReplayTransport(latency=0.1)
+    transport.add("GET", "https://a", {})
+    start = time.monotonic()
+    transport.request("GET", "https://a")
+    assert time.monotonic() - start >= 0.1
+
+
+@pytest.mark.parametrize("compress_requests", [False, True])
+def test_recorded_requests_are_replayed(tmp_path, compress_requests):
+    glossary = AtlasGlossary.create(name="Test")
+    glossary.guid = "-1"
+    live = StubTransport(load_json("asset_mutated_response_update.json"))
+    path = tmp_path / "recording.ndjson.gz"
+    recording = RecordingTransport(path, live)
+    client = _client(compress_requests=compress_requests, compression_threshold=0)
+    client.set_transport(recording)
+    recorded = client.upsert(glossary)
+    recording.close()
+
+    # Replay with a different codec, which encodes request bodies differently
+    client = _client(json_codec="json")
+    client.set_transport(ReplayTransport(path))
+    assert client.upsert(glossary) == recorded
@@ -5,6 +5,7 @@ from unittest.mock import patch
 import pytest
 
 from pyatlan.utils import (
+    chunks,
     list_attributes_to_params,
     unflatten_custom_metadata,
     unflatten_custom_metadata_for_entity,
@@ -124,3 +125,20 @@ def test_unflatten_custom_metadata_for_entity_when_none_returned_does_not_modify
     assert mock_unflatten_custom_metadata.callled_once_with(
         attributes=attributes, asset_attrubtes=entity.get("attributes", None)
     )
+
+
+@pytest.mark.parametrize(
+    "values, size, expected",
+    [
+        ([1, 2, 3, 4, 5], 2, [[1, 2], [3, 4], [5]]),
+        ([1, 2], 5, [[1, 2]]),
+        ([], 3, []),
+    ],
+)
+def test_chunks(values, size, expected):
+    assert list(chunks(values, size)) == expected
+
+
+def test_chunks_with_invalid_size_raises_value_error():
+    with pytest.raises(ValueError, match="size must be at least 1"):
+        list(chunks([1], 0))